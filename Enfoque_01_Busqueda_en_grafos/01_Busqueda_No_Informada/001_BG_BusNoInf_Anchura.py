@@ -1,17 +1,39 @@
 import collections
+import os
+import sys
+import tempfile
+import time
 
-def bfs(graph, start_node):
+import numpy as np
+
+# Añadimos la carpeta 'Enfoque_01_Busqueda_en_grafos' al path para usar el paquete 'grafos'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from grafos import (ENQUEUE, VISIT, BitsetVisited, BloomVisited, CountSink, GrafoCSR, PrintSink,
+                    erdos_renyi_graph, open_graph, save_graph, scale_free_graph,
+                    search_peak_bytes, visited_memory_bytes)
+from grafos.paralelo import parallel_bfs_ids
+
+def bfs(graph, start_node, trace=None, visited=None):
     """
     Implementa la Búsqueda en Anchura (BFS) en un grafo.
 
     Args:
-        graph (dict): El grafo representado como una lista de adyacencia.
+        graph (dict | GrafoCSR): El grafo representado como una lista de adyacencia,
+                                 o un GrafoCSR (mismo resultado, mucha menos memoria).
         start_node (str): El nodo desde el cual comenzar la búsqueda.
+        trace (optional): Sink de eventos (PrintSink, CountSink, ...).
+                          Con None no se imprime ni se registra nada.
+        visited (optional): Conjunto de visitados a usar (vacío). Por defecto
+                            un set; también BitsetVisited o BloomVisited.
+
+    Returns:
+        list: Los nodos en el orden en que se visitaron.
     """
     
     # 1. Un conjunto (set) para guardar los nodos que ya hemos visitado.
     # Usamos un set para que la comprobación de "ya lo visité?" sea súper rápida.
-    visited = set()
+    if visited is None:
+        visited = set()
     
     # 2. Una cola (queue) para llevar el orden de visita.
     # Usamos collections.deque porque es muy eficiente para sacar (pop) 
@@ -21,8 +43,7 @@ def bfs(graph, start_node):
     
     # 3. Marcamos el nodo inicial como visitado
     visited.add(start_node)
-    
-    print(f"Iniciando BFS desde el nodo: {start_node}")
+    order = []
 
     # 4. El bucle principal: mientras la cola NO esté vacía...
     while queue:
@@ -30,7 +51,9 @@ def bfs(graph, start_node):
         # 5. Sacamos el primer nodo de la cola (FIFO)
         # Este es el nodo que vamos a "explorar" ahora.
         node = queue.popleft()
-        print(f"  Visitando nodo: {node}")
+        order.append(node)
+        if trace is not None:
+            trace(VISIT, node)
 
         # --- (Opcional) Aquí podrías comprobar si 'node' es tu objetivo ---
         # if node == 'OBJETIVO':
@@ -50,7 +73,273 @@ def bfs(graph, start_node):
                 
                 # 9. Lo añadimos al FINAL de la cola para visitarlo después
                 queue.append(neighbor)
-                print(f"    -> Encolando vecino: {neighbor}")
+                if trace is not None:
+                    trace(ENQUEUE, neighbor)
+
+    return order
+
+
+def bfs_level_synchronous(graph, start_node, alpha=14, beta=24, direction_optimizing=True):
+    """
+    BFS por niveles (level-synchronous) vectorizada con numpy.
+
+    En lugar de sacar un nodo a la vez de la cola, expandimos TODA la
+    frontera de un nivel con operaciones de arreglos. Además cambia de
+    dirección según el tamaño de la frontera (direction-optimizing BFS):
+
+      - Top-down: cada nodo de la frontera mira a sus vecinos.
+        Conviene cuando la frontera es pequeña.
+      - Bottom-up: cada nodo NO visitado busca un padre en la frontera y
+        deja de buscar en cuanto lo encuentra. Conviene cuando la frontera
+        es enorme: casi todos encuentran padre en sus primeras aristas.
+
+    Args:
+        graph (GrafoCSR | dict): El grafo (un dict se convierte a CSR).
+        start_node (str): El nodo desde el cual comenzar la búsqueda.
+        alpha (int): Pasamos a bottom-up si aristas_frontera > aristas_sin_visitar / alpha.
+        beta (int): Volvemos a top-down si nodos_frontera < nodos_totales / beta, o
+                    si top-down revisaría menos aristas (aristas_frontera) que las
+                    que bottom-up revisó de verdad en el nivel anterior.
+        direction_optimizing (bool): Con False, siempre top-down (para comparar).
+
+    Returns:
+        (dist, parent): arreglos int32 indexados por id de nodo.
+                        dist[v] = número de saltos desde el inicio (-1 si no se alcanza).
+                        parent[v] = id del padre en el árbol BFS (-1 si no tiene).
+    """
+
+    # 1. Trabajamos siempre con ids enteros sobre un CSR
+    if not isinstance(graph, GrafoCSR):
+        graph = GrafoCSR.from_dict(graph)
+    num_nodes = graph.num_nodes
+    reverse = graph.reversed()
+    out_degree = graph.degrees()
+    in_degree = reverse.degrees()
+
+    # 2. Distancias y padres. -1 significa "todavía no visitado".
+    dist = np.full(num_nodes, -1, dtype=np.int32)
+    parent = np.full(num_nodes, -1, dtype=np.int32)
+
+    start = graph.id_of(start_node)
+    dist[start] = 0
+    frontier = np.array([start], dtype=np.int64)
+    unvisited_edges = int(in_degree.sum()) - int(in_degree[start])
+    level = 0
+    bottom_up = False
+    scanned_edges = 0  # Aristas que revisó el último nivel bottom-up
+
+    # 3. Un nivel completo por vuelta
+    while frontier.size > 0:
+
+        # 4. ¿En qué dirección expandimos este nivel?
+        frontier_edges = int(out_degree[frontier].sum())
+        if (direction_optimizing and not bottom_up
+                and frontier_edges > unvisited_edges / alpha):
+            bottom_up = True
+        elif bottom_up and (frontier.size < num_nodes / beta
+                            or frontier_edges < scanned_edges):
+            bottom_up = False
+
+        if bottom_up:
+            # 5a. Bottom-up: los nodos sin visitar buscan un padre en la frontera
+            in_frontier = np.zeros(num_nodes, dtype=bool)
+            in_frontier[frontier] = True
+            children, parents, scanned_edges = _bottom_up_step(
+                reverse, np.flatnonzero(dist == -1), in_frontier)
+        else:
+            # 5b. Top-down: la frontera mira a todos sus vecinos de una vez
+            parents, positions = graph.edge_positions(frontier)
+            children = graph.targets[positions]
+            new = dist[children] == -1
+            children, parents = children[new], parents[new]
+
+        # 6. Un nodo puede aparecer varias veces: nos quedamos con el primer padre
+        next_frontier, first = np.unique(children, return_index=True)
+        level += 1
+        dist[next_frontier] = level
+        parent[next_frontier] = parents[first]
+
+        unvisited_edges -= int(in_degree[next_frontier].sum())
+        frontier = next_frontier.astype(np.int64)
+
+    return dist, parent
+
+
+def _bottom_up_step(reverse, candidates, in_frontier):
+    """
+    Ayudante de bfs_level_synchronous: cada candidato revisa sus aristas de
+    entrada en ventanas (1, 2, 4, ... aristas) y SALE en cuanto encuentra un
+    padre en la frontera. Así se revisan pocas aristas por nodo sin hacer
+    una vuelta de Python por cada arista.
+
+    Returns:
+        (children, parents, scanned): los nodos que encontraron padre, su
+        padre, y cuántas aristas se revisaron en total.
+    """
+    offsets, targets = reverse.offsets, reverse.targets
+    cursor = offsets[candidates]
+    end = offsets[candidates + 1]
+    found_children, found_parents = [], []
+    scanned = 0
+    window = 1
+
+    while candidates.size > 0:
+        # 1. La siguiente ventana de aristas de cada candidato
+        counts = np.minimum(end - cursor, window)
+        total = int(counts.sum())
+        if total == 0:
+            break
+        scanned += total
+        block_begin = np.cumsum(counts) - counts
+        positions = np.repeat(cursor - block_begin, counts) + np.arange(total)
+        owner = np.repeat(np.arange(candidates.size), counts)
+
+        # 2. El primer padre en la frontera de cada candidato (las aristas de
+        #    un candidato están juntas y en orden, así que unique da la primera)
+        hits = in_frontier[targets[positions]]
+        hit_owner, first = np.unique(owner[hits], return_index=True)
+        found_children.append(candidates[hit_owner])
+        found_parents.append(targets[positions[hits][first]])
+
+        # 3. Siguen buscando solo los que no encontraron padre y tienen aristas
+        cursor = cursor + counts
+        keep = cursor < end
+        keep[hit_owner] = False
+        candidates, cursor, end = candidates[keep], cursor[keep], end[keep]
+        window *= 2
+
+    if not found_children:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, scanned
+    return np.concatenate(found_children), np.concatenate(found_parents), scanned
+
+
+def bfs_parallel(graph, start_node, num_workers=None):
+    """
+    BFS por niveles repartida entre varios procesos (uno por núcleo).
+
+    Cada nivel se divide en trozos con más o menos las mismas aristas y cada
+    proceso expande el suyo. El CSR, el bitmap de visitados y las fronteras
+    viven en memoria compartida (multiprocessing.shared_memory), así que no
+    se copia ni se serializa el grafo. No es automáticamente más rápida que
+    bfs_level_synchronous: cada nivel paga el reparto entre procesos y la
+    unión de candidatos en el coordinador. Mídela antes de usarla.
+
+    Args:
+        graph (GrafoCSR | dict): El grafo (un dict se convierte a CSR).
+        start_node (str): El nodo desde el cual comenzar la búsqueda.
+        num_workers (int, optional): Número de procesos (por defecto, os.cpu_count()).
+
+    Returns:
+        (dist, parent): arreglos int32 por id, igual que bfs_level_synchronous.
+    """
+    if not isinstance(graph, GrafoCSR):
+        graph = GrafoCSR.from_dict(graph)
+    return parallel_bfs_ids(graph, graph.id_of(start_node), num_workers)
+
+
+def _bfs_bitmask_batch(graph, sources):
+    """
+    Ayudante: UNA sola BFS que avanza a la vez desde todos los 'sources'.
+
+    Cada nodo guarda una máscara de bits (varias palabras uint64): el bit b
+    está encendido si el nodo está en la frontera (o ya fue visitado) por la
+    búsqueda que empezó en sources[b]. Así, recorrer una arista sirve para
+    las 64 (o más) búsquedas al mismo tiempo.
+
+    Returns:
+        Matriz int32 de forma (len(sources), num_nodos) con las distancias.
+    """
+    num_nodes = graph.num_nodes
+    num_sources = len(sources)
+    words = (num_sources + 63) // 64
+
+    dist = np.full((num_sources, num_nodes), -1, dtype=np.int32)
+    visited = np.zeros((num_nodes, words), dtype=np.uint64)
+    frontier = np.zeros((num_nodes, words), dtype=np.uint64)
+
+    # 1. Cada búsqueda b arranca en su nodo con el bit b encendido
+    for b, source in enumerate(sources):
+        bit = np.uint64(1) << np.uint64(b % 64)
+        frontier[source, b // 64] |= bit
+        visited[source, b // 64] |= bit
+        dist[b, source] = 0
+
+    active = np.unique(np.asarray(sources, dtype=np.int64))
+    level = 0
+
+    while active.size > 0:
+        level += 1
+
+        # 2. Todas las aristas que salen de los nodos activos
+        parents, positions = graph.edge_positions(active)
+        if positions.size == 0:
+            break
+        children = graph.targets[positions]
+
+        # 3. Cada hijo recibe el OR de las máscaras de todos sus padres
+        order = np.argsort(children, kind='stable')
+        children = children[order]
+        masks = frontier[parents[order]]
+        reached, starts = np.unique(children, return_index=True)
+        incoming = np.bitwise_or.reduceat(masks, starts, axis=0)
+
+        # 4. Solo nos interesan los bits que el hijo aún no tenía
+        new = incoming & ~visited[reached]
+        visited[reached] |= new
+
+        # 5. Anotamos la distancia de cada par (búsqueda, nodo) nuevo
+        bits = np.unpackbits(new.view(np.uint8), axis=1, bitorder='little')[:, :num_sources]
+        node_index, source_index = np.nonzero(bits)
+        dist[source_index, reached[node_index]] = level
+
+        # 6. La nueva frontera son los nodos con algún bit nuevo
+        frontier[active] = 0
+        has_new = new.any(axis=1)
+        active = reached[has_new].astype(np.int64)
+        frontier[active] = new[has_new]
+
+    return dist
+
+
+def iter_bfs_multi_source(graph, start_nodes, batch_size=64):
+    """
+    BFS desde MUCHOS nodos de inicio, agrupados en lotes.
+
+    En lugar de hacer una BFS completa por cada inicio, cada lote de
+    'batch_size' inicios se resuelve con un solo recorrido usando máscaras
+    de bits. Los resultados se entregan poco a poco (generador), así no hace
+    falta tener en memoria la matriz completa.
+
+    Args:
+        graph (GrafoCSR | dict): El grafo (un dict se convierte a CSR).
+        start_nodes (list): Los nodos de inicio.
+        batch_size (int): Búsquedas por recorrido (múltiplo de 64 recomendado).
+
+    Yields:
+        (start_node, dist): el nodo de inicio y su fila de distancias (int32,
+                            indexada por id de nodo, -1 si no se alcanza).
+    """
+    if not isinstance(graph, GrafoCSR):
+        graph = GrafoCSR.from_dict(graph)
+
+    for i in range(0, len(start_nodes), batch_size):
+        batch = start_nodes[i:i + batch_size]
+        dist = _bfs_bitmask_batch(graph, [graph.id_of(node) for node in batch])
+        for start_node, row in zip(batch, dist):
+            yield start_node, row
+
+
+def bfs_multi_source(graph, start_nodes, batch_size=64):
+    """
+    Igual que iter_bfs_multi_source, pero devuelve la matriz completa
+    de distancias de forma (len(start_nodes), num_nodos).
+    """
+    if not isinstance(graph, GrafoCSR):
+        graph = GrafoCSR.from_dict(graph)
+    if not start_nodes:
+        return np.empty((0, graph.num_nodes), dtype=np.int32)
+    return np.vstack([row for _, row in iter_bfs_multi_source(graph, start_nodes, batch_size)])
 
 # --- Definimos nuestro grafo de ejemplo ---
 #       'A'
@@ -68,4 +357,84 @@ graph_example = {
 }
 
 # --- Ejecutamos el algoritmo ---
-bfs(graph_example, 'A')
\ No newline at end of file
+# (PrintSink imprime cada evento; sin 'trace' la búsqueda no imprime nada)
+print("Iniciando BFS desde el nodo: A")
+order = bfs(graph_example, 'A', trace=PrintSink())
+print(f"Orden de visita: {order}")
+
+# --- El mismo grafo en formato CSR (compacto) ---
+# GrafoCSR.from_edge_list('aristas.txt') carga grafos grandes desde archivo.
+print("\n--- PRUEBA CON GrafoCSR ---")
+graph_csr = GrafoCSR.from_dict(graph_example)
+counter = CountSink()
+print(f"Orden de visita: {bfs(graph_csr, 'A', trace=counter)}  {counter}")
+
+# --- El mismo grafo guardado en disco (numpy.memmap) ---
+# Para grafos que no caben en memoria: convert_edge_list('aristas.txt', 'grafo.bin')
+# convierte el archivo de texto por bloques, y open_graph lo abre sin cargarlo.
+print("\n--- PRUEBA CON GRAFO EN DISCO ---")
+with tempfile.TemporaryDirectory() as temp_dir:
+    disk_path = os.path.join(temp_dir, 'grafo.bin')
+    save_graph(graph_csr, disk_path)
+    graph_disk = open_graph(disk_path)
+    print(f"Orden de visita: {bfs(graph_disk, 'A')}")
+    del graph_disk  # Cerramos el memmap antes de borrar el archivo
+
+# --- BFS por niveles: devuelve distancias y padres en lugar de imprimir ---
+print("\n--- PRUEBA CON BFS POR NIVELES (vectorizada) ---")
+dist, parent = bfs_level_synchronous(graph_csr, 'A')
+for node_id, name in enumerate(graph_csr.names):
+    parent_name = graph_csr.name_of(parent[node_id]) if parent[node_id] >= 0 else None
+    print(f"  {name}: distancia={dist[node_id]}, padre={parent_name}")
+
+# --- Pruebas pesadas: solo al correr el script directamente ---
+# (Grafos de 200000 nodos y procesos hijos: no se pagan al importar el
+#  script, como hace benchmarks/bench_busquedas.py. El 'if' también evita
+#  que los procesos hijos vuelvan a correr estas pruebas en sistemas que
+#  arrancan los procesos importando el script, como Windows)
+if __name__ == '__main__':
+    # --- ¿Cuánto ayuda cambiar de dirección? (grafos grandes) ---
+    print("\n--- PRUEBA CON BFS POR NIVELES: top-down vs. direction-optimizing ---")
+    for name, graph_levels in [('Erdős–Rényi', erdos_renyi_graph(200000, seed=1)),
+                               ('libre de escala', scale_free_graph(200000, seed=1))]:
+        graph_levels.reversed()  # (El transpuesto se calcula una vez, fuera del tiempo)
+        times = {}
+        for label, optimizing in [('solo top-down', False), ('direction-optimizing', True)]:
+            start = time.perf_counter()
+            dist_levels, _ = bfs_level_synchronous(graph_levels, 0,
+                                                   direction_optimizing=optimizing)
+            times[label] = time.perf_counter() - start
+        print(f"  {name:<16} " + "  ".join(f"{label}: {seconds:.3f} s"
+                                           for label, seconds in times.items()))
+
+    # --- BFS en paralelo (varios procesos con memoria compartida) ---
+    print("\n--- PRUEBA CON BFS EN PARALELO ---")
+    dist_parallel, _ = bfs_parallel(graph_csr, 'A', num_workers=2)
+    print(f"  Distancias iguales a la versión por niveles: {(dist_parallel == dist).all()}")
+
+# --- BFS desde varios inicios en un solo recorrido (máscaras de bits) ---
+print("\n--- PRUEBA CON BFS MULTI-INICIO ---")
+starts = ['A', 'D', 'F']
+dist_matrix = bfs_multi_source(graph_csr, starts)
+print(f"  Nodos: {graph_csr.names}")
+for start_node, row in zip(starts, dist_matrix):
+    print(f"  Desde {start_node}: {row.tolist()}")
+
+# --- Memoria de cada tipo de conjunto de visitados ---
+# (BloomVisited puede saltarse nodos por falsos positivos: es aproximado.
+#  Solo se comprime el conjunto de visitados: la cola y el orden de visita
+#  siguen creciendo con los nodos, así que el pico total baja mucho menos)
+print("\n--- PRUEBA CON CONJUNTOS DE VISITADOS COMPACTOS ---")
+graph_big = erdos_renyi_graph(5000, seed=1)
+backends = {
+    'set de Python': set,
+    'BitsetVisited': lambda: BitsetVisited(graph_big.num_nodes),
+    'BloomVisited (1%)': lambda: BloomVisited(graph_big.num_nodes, false_positive_rate=0.01),
+}
+for name, make_visited in backends.items():
+    def search():
+        visited = make_visited()
+        return visited, bfs(graph_big, 0, visited=visited)
+    (visited, order), peak = search_peak_bytes(search)
+    print(f"  {name:<18} visitados={len(order):>6}  "
+          f"conjunto={visited_memory_bytes(visited):>9} bytes  pico total={peak:>9} bytes")
@@ -1,6 +1,19 @@
+import collections
 import heapq
+import os
+import sys
+import tempfile
+import time
 
-def ucs(graph, start_node, goal_node):
+import numpy as np
+
+# Añadimos la carpeta 'Enfoque_01_Busqueda_en_grafos' al path para usar el paquete 'grafos'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from grafos import (ENQUEUE, GOAL, PRUNE, VISIT, ContractionHierarchy, CountSink, GrafoCSR,
+                    IndexedDaryHeap, LazyHeapQueue, NodeArena, PrintSink, SlidingPuzzle,
+                    cost_neighbor_edges, dicts_memory_bytes, grid_graph)
+
+def ucs(graph, start_node, goal_node, priority_queue=None, trace=None, arena=None):
     """
     Implementa la Búsqueda de Costo Uniforme (UCS) en un grafo con pesos.
 
@@ -9,75 +22,198 @@ def ucs(graph, start_node, goal_node):
                       Formato: {'A': [('B', 5), ('C', 1)], ...}
                       o también: {'A': [(5, 'B'), (1, 'C')], ...}
                       ¡Vamos a usar (costo, vecino) para que funcione bien con heapq!
+                      También acepta un GrafoCSR o un GrafoImplicito (los
+                      vecinos se generan con su función sucesora al expandir).
         start_node (str): El nodo de inicio.
         goal_node (str): El nodo objetivo que queremos alcanzar.
+        priority_queue (optional): La cola de prioridad a usar.
+                      LazyHeapQueue() (por defecto) mete duplicados y descarta los viejos;
+                      IndexedDaryHeap() hace decrease-key y nunca duplica nodos.
+        trace (optional): Sink de eventos (PrintSink, CountSink, ...).
+                          Con None no se imprime ni se registra nada.
+        arena (NodeArena, optional): Almacén de nodos (vacío). Si se pasa, al
+                          final contiene todos los nodos descubiertos. Por
+                          defecto NodeArena.for_graph(graph) (densa con un GrafoCSR).
+
+    Returns:
+        (path, cost): el camino más barato y su costo, o (None, inf) si no hay camino.
     """
     
-    # 1. Una cola de prioridad (min-heap).
-    # Guardará tuplas de (costo_acumulado, nodo).
-    # heapq siempre ordena por el primer elemento de la tupla.
-    priority_queue = []
-    heapq.heappush(priority_queue, (0, start_node))  # (Costo 0 para llegar al inicio)
-
-    # 2. Un diccionario para guardar el costo MÁS BAJO encontrado 
-    # hasta ahora para llegar a cada nodo.
-    costs = {start_node: 0}
-    
-    # 3. Un diccionario para reconstruir el camino al final.
-    # Guarda: {nodo_hijo: nodo_padre}
-    path_from = {start_node: None}
-    
-    print(f"Iniciando UCS desde '{start_node}' para encontrar '{goal_node}'")
+    # 1. La arena de nodos: para cada nodo descubierto guarda su padre y
+    #    el costo MÁS BAJO encontrado hasta ahora (en lugar de dos diccionarios
+    #    'costs' y 'path_from'). Cada nodo se identifica por su índice.
+    if arena is None:
+        arena = NodeArena.for_graph(graph)
+    start_index = arena.add(start_node)
 
-    # 4. Mientras la cola de prioridad NO esté vacía...
-    while priority_queue:
+    # 2. Una cola de prioridad (min-heap) de índices de nodo.
+    # Ordena los nodos por su costo acumulado.
+    # Por defecto usamos heapq "perezoso" (LazyHeapQueue).
+    if priority_queue is None:
+        priority_queue = LazyHeapQueue()
+    priority_queue.add(start_index, 0)  # (Costo 0 para llegar al inicio)
+
+    # 3. Mientras la cola de prioridad NO esté vacía...
+    while not priority_queue.is_empty():
         
-        # 5. Sacamos el nodo con el MENOR costo acumulado
-        current_cost, current_node = heapq.heappop(priority_queue)
+        # 4. Sacamos el nodo con el MENOR costo acumulado
+        current_cost, current_index = priority_queue.remove()
+        current_node = arena.states[current_index]
         
-        print(f"\n  Visitando nodo: '{current_node}' (Costo acumulado: {current_cost})")
+        if trace is not None:
+            trace(VISIT, current_node, current_cost)
 
-        # 6. (Opcional) Si un nodo se procesa con un costo mayor al ya guardado,
+        # 5. (Opcional) Si un nodo se procesa con un costo mayor al ya guardado,
         # significa que encontramos un camino más rápido antes. Lo ignoramos.
-        if current_cost > costs.get(current_node, float('inf')):
-            print(f"    (Ignorando, ya encontramos un camino más barato a '{current_node}')")
+        # (Con IndexedDaryHeap esto nunca pasa: no hay entradas duplicadas)
+        if current_cost > arena.g[current_index]:
+            if trace is not None:
+                trace(PRUNE, current_node, current_cost)
             continue
 
-        # 7. ¡OBJETIVO ENCONTRADO!
+        # 6. ¡OBJETIVO ENCONTRADO!
         if current_node == goal_node:
-            print(f"¡Objetivo '{goal_node}' alcanzado con costo total: {current_cost}!")
+            if trace is not None:
+                trace(GOAL, current_node, current_cost)
             
-            # --- Reconstruir el camino ---
-            path = []
-            node = goal_node
-            while node is not None:
-                path.append(node)
-                node = path_from[node]
-            path.reverse()  # Le damos la vuelta para que sea inicio -> fin
-            print(f"  Camino encontrado: {' -> '.join(path)}")
-            return
+            # --- Reconstruir el camino (siguiendo los índices de padre) ---
+            return arena.path(current_index), current_cost
         
-        # 8. Exploramos los vecinos
-        for edge_cost, neighbor in graph.get(current_node, []):
+        # 7. Exploramos los vecinos
+        # (Sea dict, GrafoCSR o GrafoImplicito, en formato (costo, vecino))
+        for edge_cost, neighbor in cost_neighbor_edges(graph, current_node):
             
-            # 9. Calculamos el nuevo costo para llegar a ESE vecino
+            # 8. Calculamos el nuevo costo para llegar a ESE vecino
             new_cost = current_cost + edge_cost
             
-            # 10. ¡La clave de UCS!
+            # 9. ¡La clave de UCS!
             # Si no lo hemos visitado O encontramos un camino MÁS BARATO...
-            if neighbor not in costs or new_cost < costs[neighbor]:
-                
-                # ...actualizamos su costo
-                costs[neighbor] = new_cost
+            neighbor_index = arena.index_of(neighbor)
+            if neighbor_index is None or new_cost < arena.g[neighbor_index]:
                 
-                # ...guardamos de dónde venimos
-                path_from[neighbor] = current_node
+                # ...guardamos su costo y de dónde venimos
+                if neighbor_index is None:
+                    neighbor_index = arena.add(neighbor, current_index, new_cost)
+                else:
+                    arena.update(neighbor_index, current_index, new_cost)
                 
                 # ...y lo metemos a la cola de prioridad
-                heapq.heappush(priority_queue, (new_cost, neighbor))
-                print(f"    -> Encolando vecino: '{neighbor}' (Nuevo costo: {new_cost})")
+                # (o bajamos su prioridad si ya estaba, con decrease-key)
+                priority_queue.add(neighbor_index, new_cost)
+                if trace is not None:
+                    trace(ENQUEUE, neighbor, new_cost)
                 
-    print(f"No se pudo encontrar un camino de '{start_node}' a '{goal_node}'.")
+    return None, float('inf')
+
+
+def ucs_shortest_path_tree(graph, start_node):
+    """
+    UCS (Dijkstra) SIN objetivo: calcula el árbol de caminos más cortos
+    completo desde 'start_node' hacia TODOS los nodos.
+
+    Args:
+        graph (GrafoCSR | dict): El grafo (un dict en formato (costo, vecino)
+                                 se convierte a CSR).
+        start_node (str): El nodo de inicio.
+
+    Returns:
+        (cost, parent): arreglos indexados por id de nodo.
+                        cost[v] = costo mínimo desde el inicio (inf si no se alcanza).
+                        parent[v] = id del padre en el árbol (-1 si no tiene).
+    """
+    if not isinstance(graph, GrafoCSR):
+        graph = GrafoCSR.from_dict(graph, formato='costo_vecino')
+
+    cost = np.full(graph.num_nodes, np.inf)
+    parent = np.full(graph.num_nodes, -1, dtype=np.int32)
+
+    start = graph.id_of(start_node)
+    cost[start] = 0
+    priority_queue = [(0, start)]
+
+    while priority_queue:
+        current_cost, current_node = heapq.heappop(priority_queue)
+        if current_cost > cost[current_node]:
+            continue  # Entrada vieja
+
+        neighbors = graph.neighbor_ids(current_node).tolist()
+        weights = graph.edge_weights(current_node).tolist()
+        for neighbor, edge_cost in zip(neighbors, weights):
+            new_cost = current_cost + edge_cost
+            if new_cost < cost[neighbor]:
+                cost[neighbor] = new_cost
+                parent[neighbor] = current_node
+                heapq.heappush(priority_queue, (new_cost, neighbor))
+
+    return cost, parent
+
+
+class ShortestPathTreeCache:
+    """
+    Caché de árboles de caminos más cortos (resultado de ucs_shortest_path_tree).
+
+    La primera consulta desde un origen corre Dijkstra completo; las
+    siguientes desde ese mismo origen solo recorren los padres desde el
+    objetivo: O(largo del camino).
+
+    Las entradas se guardan por (versión del grafo, origen). Si el grafo
+    cambia (graph.touch()), las entradas viejas dejan de usarse. Cuando se
+    pasa del presupuesto de memoria se descartan las menos usadas (LRU).
+    """
+
+    def __init__(self, graph, max_bytes=64 * 1024 * 1024):
+        if not isinstance(graph, GrafoCSR):
+            graph = GrafoCSR.from_dict(graph, formato='costo_vecino')
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self.trees = collections.OrderedDict()  # {(versión, origen): (cost, parent)}
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def tree(self, start_node):
+        """Devuelve (cost, parent) desde 'start_node', calculándolo solo si hace falta."""
+        key = (self.graph.version, start_node)
+        if key in self.trees:
+            self.hits += 1
+            self.trees.move_to_end(key)  # Recién usado
+            return self.trees[key]
+
+        self.misses += 1
+        cost, parent = ucs_shortest_path_tree(self.graph, start_node)
+        self.trees[key] = (cost, parent)
+        self.used_bytes += cost.nbytes + parent.nbytes
+
+        # Descartamos árboles de versiones viejas y luego los menos usados
+        for old_key in [k for k in self.trees if k[0] != self.graph.version]:
+            self._evict(old_key)
+        while self.used_bytes > self.max_bytes and len(self.trees) > 1:
+            self._evict(next(iter(self.trees)))
+        return cost, parent
+
+    def query(self, start_node, goal_node):
+        """
+        Camino más corto de 'start_node' a 'goal_node'.
+
+        Returns:
+            (camino, costo) o (None, inf) si no hay camino.
+        """
+        cost, parent = self.tree(start_node)
+        goal = self.graph.id_of(goal_node)
+        if np.isinf(cost[goal]):
+            return None, float('inf')
+
+        path = []
+        node = goal
+        while node != -1:
+            path.append(self.graph.name_of(node))
+            node = parent[node]
+        path.reverse()
+        return path, cost[goal].item()
+
+    def _evict(self, key):
+        cost, parent = self.trees.pop(key)
+        self.used_bytes -= cost.nbytes + parent.nbytes
 
 # --- Definimos nuestro grafo de ejemplo con COSTOS ---
 #       'A'
@@ -103,4 +239,82 @@ graph_example_ucs = {
 }
 
 # --- Ejecutamos el algoritmo ---
-ucs(graph_example_ucs, 'A', 'E')
\ No newline at end of file
+# (PrintSink imprime cada evento con su costo; sin 'trace' no se imprime nada)
+print("Iniciando UCS desde 'A' para encontrar 'E'")
+path, total_cost = ucs(graph_example_ucs, 'A', 'E', trace=PrintSink())
+print(f"  Camino encontrado: {' -> '.join(path)} (costo total: {total_cost})")
+
+# --- El mismo grafo en formato CSR (compacto) ---
+print("\n--- PRUEBA CON GrafoCSR ---")
+graph_csr = GrafoCSR.from_dict(graph_example_ucs, formato='costo_vecino')
+path, total_cost = ucs(graph_csr, 'A', 'E')
+print(f"  Camino encontrado: {' -> '.join(path)} (costo total: {total_cost})")
+
+# --- Con un heap d-ario indexado (decrease-key, sin duplicados) ---
+# (benchmarks/bench_colas_prioridad.py compara ambas estrategias)
+print("\n--- PRUEBA CON IndexedDaryHeap ---")
+lazy_counter, indexed_counter = CountSink(), CountSink()
+ucs(graph_example_ucs, 'A', 'E', trace=lazy_counter)
+path, total_cost = ucs(graph_example_ucs, 'A', 'E', priority_queue=IndexedDaryHeap(),
+                       trace=indexed_counter)
+print(f"  Camino encontrado: {' -> '.join(path)} (costo total: {total_cost})")
+print(f"  Eventos con heapq perezoso: {dict(lazy_counter.counts)}")
+print(f"  Eventos con IndexedDaryHeap: {dict(indexed_counter.counts)}")
+
+# --- Muchas consultas desde el mismo origen: caché de árboles ---
+print("\n--- PRUEBA CON ShortestPathTreeCache ---")
+cache = ShortestPathTreeCache(graph_csr)
+for goal in ['E', 'D', 'B']:
+    path, total_cost = cache.query('A', goal)
+    print(f"  A -> {goal}: costo {total_cost}, camino {' -> '.join(path)}")
+print(f"  (Dijkstra ejecutado {cache.misses} vez, {cache.hits} consultas desde el caché)")
+
+# --- Grafo implícito: el 8-puzzle, generado solo donde UCS lo explora ---
+# (Cada estado es un int empaquetado, no una tupla)
+print("\n--- PRUEBA CON GrafoImplicito (8-puzzle) ---")
+puzzle = SlidingPuzzle(3)
+start_state = puzzle.scrambled(14, seed=3)
+path, total_cost = ucs(puzzle, start_state, puzzle.goal)
+print(f"  Inicio: {puzzle.decode(start_state)}")
+print(f"  Resuelto en {total_cost} movimientos, {puzzle.expansions} estados expandidos")
+
+# --- Memoria por nodo: arena de nodos vs. diccionarios path_from/costs ---
+print("\n--- PRUEBA CON NodeArena (memoria) ---")
+# (Con un GrafoCSR la arena usa el modo denso aunque los nodos tengan
+#  nombres: el índice de cada nodo es su id en el grafo y no hace falta
+#  un diccionario propio. Es lo que ucs usa por defecto.)
+graph_grid = grid_graph(40000, seed=1)
+graph_named = GrafoCSR(graph_grid.offsets, graph_grid.targets, graph_grid.weights,
+                       [f"n{node_id}" for node_id in range(graph_grid.num_nodes)])
+for name, arena in [('NodeArena()', NodeArena()),
+                    ('for_graph(graph)', NodeArena.for_graph(graph_named))]:
+    ucs(graph_named, 'n0', f"n{graph_named.num_nodes - 1}", arena=arena)
+    arena_bytes = arena.memory_bytes()
+    print(f"  {name:<18} {arena_bytes:>9} bytes ({arena_bytes / len(arena):.1f} por nodo)")
+dict_bytes = dicts_memory_bytes(arena)
+print(f"  {'path_from + costs':<18} {dict_bytes:>9} bytes ({dict_bytes / len(arena):.1f} por nodo)")
+
+# --- Muchas consultas punto a punto: jerarquía de contracción ---
+# (Se preprocesa UNA vez y se guarda en disco; cada consulta después es un
+#  Dijkstra bidireccional que solo sube de rango y explora pocos nodos)
+print("\n--- PRUEBA CON ContractionHierarchy (rejilla 50x50) ---")
+graph_roads = grid_graph(2500, seed=7)
+start = time.perf_counter()
+with tempfile.TemporaryDirectory() as temp_dir:
+    hierarchy_path = os.path.join(temp_dir, 'jerarquia.npz')
+    ContractionHierarchy.build(graph_roads).save(hierarchy_path)
+    hierarchy = ContractionHierarchy.load(hierarchy_path, graph_roads)
+print(f"  Preprocesamiento: {time.perf_counter() - start:.2f} s, {hierarchy}")
+
+rng = np.random.default_rng(7)
+queries = rng.integers(graph_roads.num_nodes, size=(200, 2)).tolist()
+start = time.perf_counter()
+ucs_costs = [ucs(graph_roads, s, t)[1] for s, t in queries]
+ucs_time = time.perf_counter() - start
+start = time.perf_counter()
+ch_costs = [hierarchy.shortest_path(s, t)[1] for s, t in queries]
+ch_time = time.perf_counter() - start
+print(f"  {len(queries)} consultas: UCS {ucs_time / len(queries) * 1e6:.0f} µs/consulta, "
+      f"jerarquía {ch_time / len(queries) * 1e6:.0f} µs/consulta "
+      f"({ucs_time / ch_time:.0f}x más rápida)")
+print(f"  Mismos costos que UCS: {ucs_costs == ch_costs}")
@@ -1,4 +1,11 @@
-def dfs_recursive(graph, start_node, visited=None):
+import os
+import sys
+
+# Añadimos la carpeta 'Enfoque_01_Busqueda_en_grafos' al path para usar el paquete 'grafos'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from grafos import VISIT, GrafoCSR, PrintSink
+
+def dfs_recursive(graph, start_node, visited=None, trace=None):
     """
     Implementa la Búsqueda en Profundidad (DFS) usando recursión.
 
@@ -7,16 +14,21 @@ def dfs_recursive(graph, start_node, visited=None):
         start_node (str): El nodo desde el cual comenzar la búsqueda.
         visited (set, optional): Un conjunto para rastrear nodos visitados.
                                  Se pasa entre llamadas recursivas.
+        trace (optional): Sink de eventos (PrintSink, CountSink, ...).
+                          Con None no se imprime ni se registra nada.
+
+    Returns:
+        set: Los nodos visitados.
     """
     
     # 1. Inicializar el conjunto de visitados si es la primera llamada
     if visited is None:
         visited = set()
-        print(f"Iniciando DFS recursivo desde: {start_node}")
 
-    # 2. Marcar el nodo actual como visitado y procesarlo (imprimirlo)
+    # 2. Marcar el nodo actual como visitado y procesarlo (avisar al sink)
     visited.add(start_node)
-    print(f"  Visitando nodo: {start_node}")
+    if trace is not None:
+        trace(VISIT, start_node)
 
     # --- (Opcional) Aquí podrías comprobar si 'start_node' es tu objetivo ---
     # if start_node == 'OBJETIVO':
@@ -34,8 +46,131 @@ def dfs_recursive(graph, start_node, visited=None):
             # 5. ...hacemos la llamada recursiva.
             # El algoritmo se va "profundo" por este vecino ANTES
             # de continuar con los otros vecinos del nodo actual.
-            dfs_recursive(graph, neighbor, visited)
-            print(f"    ...Retrocediendo (backtracking) a: {start_node}")
+            # (Al volver de la llamada hacemos "backtracking" a start_node)
+            dfs_recursive(graph, neighbor, visited, trace)
+
+    return visited
+
+
+# --- DFS iterativa (pila explícita) ---
+# La versión recursiva usa un "frame" de Python por cada nodo del camino, así
+# que falla (RecursionError) con caminos de más de ~1000 nodos. Aquí la pila
+# es una lista nuestra y el recorrido se entrega como una secuencia de eventos.
+
+PRE_ORDER = 'pre'    # Entramos al nodo por primera vez
+POST_ORDER = 'post'  # Terminamos con todos sus descendientes (backtracking)
+
+
+def dfs_iterative(graph, start_node, visited=None):
+    """
+    DFS con pila explícita, en forma de generador.
+
+    Produce los eventos en el mismo orden que dfs_recursive, pero de forma
+    perezosa: quien la usa puede procesar cada visita al momento, detenerse
+    antes (break) o armar órdenes topológicos y componentes conexas.
+
+    Args:
+        graph (dict | GrafoCSR): El grafo representado como una lista de adyacencia.
+        start_node (str): El nodo desde el cual comenzar la búsqueda.
+        visited (set, optional): Nodos ya visitados. Si se comparte entre varias
+                                 llamadas, se recorre un bosque completo.
+
+    Yields:
+        (evento, nodo): evento es PRE_ORDER o POST_ORDER.
+    """
+
+    # 1. Inicializar el conjunto de visitados si no nos dieron uno
+    if visited is None:
+        visited = set()
+    if start_node in visited:
+        return
+
+    # 2. La pila guarda (nodo, iterador sobre sus vecinos pendientes).
+    #    Así recordamos por qué vecino íbamos al volver a cada nodo.
+    visited.add(start_node)
+    yield PRE_ORDER, start_node
+    stack = [(start_node, iter(graph.get(start_node, [])))]
+
+    while stack:
+        node, neighbors = stack[-1]
+
+        # 3. Buscamos el siguiente vecino NO visitado del nodo de la cima
+        for neighbor in neighbors:
+            if neighbor not in visited:
+                # 4. Bajamos un nivel: equivale a la llamada recursiva
+                visited.add(neighbor)
+                yield PRE_ORDER, neighbor
+                stack.append((neighbor, iter(graph.get(neighbor, []))))
+                break
+        else:
+            # 5. Ya no quedan vecinos: terminamos este nodo (backtracking)
+            stack.pop()
+            yield POST_ORDER, node
+
+
+def topological_order(graph):
+    """
+    Orden topológico de un grafo dirigido acíclico (DAG):
+    el post-orden de la DFS, invertido.
+
+    Raises:
+        ValueError: si el grafo tiene ciclos.
+    """
+    visited = set()
+    finished = []
+    for node in list(graph):
+        for event, current in dfs_iterative(graph, node, visited):
+            if event == POST_ORDER:
+                finished.append(current)
+    finished.reverse()
+
+    # Comprobamos que ninguna arista "apunte hacia atrás" (eso sería un ciclo)
+    position = {node: i for i, node in enumerate(finished)}
+    for node in finished:
+        for neighbor in graph.get(node, []):
+            if position[neighbor] <= position[node]:
+                raise ValueError(f"El grafo tiene un ciclo (arista {node} -> {neighbor})")
+    return finished
+
+
+def strongly_connected_components(graph):
+    """
+    Componentes fuertemente conexas con el algoritmo de Kosaraju:
+
+      1. DFS sobre todo el grafo anotando el orden en que terminan los nodos.
+      2. DFS sobre el grafo transpuesto, en orden inverso de terminación.
+         Cada árbol de esta segunda pasada es una componente.
+
+    Returns:
+        list[list]: Las componentes, cada una como lista de nodos.
+    """
+
+    # 1. Primera pasada: orden de terminación
+    visited = set()
+    finished = []
+    for node in list(graph):
+        for event, current in dfs_iterative(graph, node, visited):
+            if event == POST_ORDER:
+                finished.append(current)
+
+    # 2. Grafo transpuesto (aristas invertidas)
+    if isinstance(graph, GrafoCSR):
+        reverse = graph.reversed()
+    else:
+        reverse = {}
+        for node in finished:
+            for neighbor in graph.get(node, []):
+                reverse.setdefault(neighbor, []).append(node)
+
+    # 3. Segunda pasada: cada DFS encuentra una componente completa
+    visited = set()
+    components = []
+    for node in reversed(finished):
+        if node not in visited:
+            components.append([current for event, current
+                               in dfs_iterative(reverse, node, visited)
+                               if event == PRE_ORDER])
+    return components
 
 
 # --- Definimos nuestro grafo de ejemplo (el mismo de BFS) ---
@@ -54,4 +189,38 @@ graph_example = {
 }
 
 # --- Ejecutamos el algoritmo ---
-dfs_recursive(graph_example, 'A')
\ No newline at end of file
+# (PrintSink imprime cada visita; sin 'trace' no se imprime nada)
+print("Iniciando DFS recursivo desde: A")
+dfs_recursive(graph_example, 'A', trace=PrintSink())
+
+# --- DFS iterativa: los mismos recorridos, como eventos ---
+print("\n--- PRUEBA CON DFS ITERATIVA (eventos) ---")
+for event, node in dfs_iterative(graph_example, 'A'):
+    print(f"  {event:>4}: {node}")
+
+# --- Un camino de 100000 nodos: la versión recursiva fallaría aquí ---
+long_path = {i: [i + 1] for i in range(100000)}
+deepest = None
+for event, node in dfs_iterative(long_path, 0):
+    if event == PRE_ORDER:
+        deepest = node
+print(f"\nCamino largo recorrido sin RecursionError. Nodo más profundo: {deepest}")
+
+# --- Orden topológico (tareas con dependencias) ---
+tasks = {
+    'levantarse': ['ducharse', 'desayunar'],
+    'ducharse': ['vestirse'],
+    'desayunar': ['salir'],
+    'vestirse': ['salir'],
+    'salir': [],
+}
+print(f"Orden topológico: {' -> '.join(topological_order(tasks))}")
+
+# --- Componentes fuertemente conexas ---
+directed_graph = {
+    'A': ['B'], 'B': ['C'], 'C': ['A', 'D'],  # A, B, C forman un ciclo
+    'D': ['E'], 'E': ['D'],                   # D, E forman otro
+    'F': ['E'],
+}
+print(f"Componentes fuertemente conexas: {strongly_connected_components(directed_graph)}")
+print(f"(con GrafoCSR): {strongly_connected_components(GrafoCSR.from_dict(directed_graph))}")
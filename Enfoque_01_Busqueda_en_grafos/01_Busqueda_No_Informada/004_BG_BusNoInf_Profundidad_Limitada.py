@@ -1,4 +1,11 @@
-def dls(graph, start_node, goal_node, limit, depth=0, visited=None):
+import os
+import sys
+
+# Añadimos la carpeta 'Enfoque_01_Busqueda_en_grafos' al path para usar el paquete 'grafos'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from grafos import GOAL, PRUNE, VISIT, PrintSink, TranspositionTable
+
+def dls(graph, start_node, goal_node, limit, depth=0, visited=None, trace=None):
     """
     Implementa la Búsqueda en Profundidad Limitada (DLS).
 
@@ -9,6 +16,8 @@ def dls(graph, start_node, goal_node, limit, depth=0, visited=None):
         limit (int): La profundidad máxima a explorar.
         depth (int, optional): La profundidad actual. Inicia en 0.
         visited (set, optional): Conjunto de nodos visitados (para ciclos).
+        trace (optional): Sink de eventos (PrintSink, CountSink, ...). El valor
+                          de cada evento es la profundidad. Con None no se imprime nada.
     
     Returns:
         bool: True si se encontró el objetivo, False si no.
@@ -17,21 +26,22 @@ def dls(graph, start_node, goal_node, limit, depth=0, visited=None):
     # 1. Inicializar 'visited' en la primera llamada (solo para grafos con ciclos)
     if visited is None:
         visited = set()
-        print(f"Iniciando DLS desde '{start_node}' para buscar '{goal_node}' "
-              f"con límite={limit}")
 
     # 2. Marcar el nodo actual como visitado
     visited.add(start_node)
-    print(f"  (Profundidad: {depth}) Visitando nodo: {start_node}")
+    if trace is not None:
+        trace(VISIT, start_node, depth)
 
     # 3. Comprobar si es el objetivo
     if start_node == goal_node:
-        print(f"¡Objetivo '{goal_node}' encontrado en profundidad {depth}!")
+        if trace is not None:
+            trace(GOAL, start_node, depth)
         return True  # ¡Éxito!
 
     # 4. ¡La clave de DLS! Comprobar si hemos llegado al límite
     if depth == limit:
-        print(f"    -> Límite de profundidad {limit} alcanzado. Retrocediendo.")
+        if trace is not None:
+            trace(PRUNE, start_node, depth)
         return False  # Cortamos la búsqueda por esta rama
 
     # 5. Si no hemos llegado al límite, exploramos vecinos (recursión)
@@ -42,13 +52,65 @@ def dls(graph, start_node, goal_node, limit, depth=0, visited=None):
             
             # 6. Llamada recursiva, incrementando la profundidad
             # Si CUALQUIERA de las llamadas recursivas encuentra el objetivo...
-            if dls(graph, neighbor, goal_node, limit, depth + 1, visited):
+            if dls(graph, neighbor, goal_node, limit, depth + 1, visited, trace):
                 return True # ...propagamos el éxito hacia arriba
 
     # 7. Si exploramos todos los vecinos y nadie encontró el objetivo
-    print(f"    (Profundidad: {depth}) No hay más caminos desde '{start_node}'. Retrocediendo.")
     return False
 
+
+def dls_with_table(graph, start_node, goal_node, limit, table=None):
+    """
+    DLS con tabla de transposición en lugar del conjunto 'visited' global.
+
+    El 'visited' global de dls() corta caminos válidos: si un nodo se vio
+    primero a gran profundidad, ya no se explora cuando aparece por un
+    camino más corto. Aquí no hay 'visited': lo que se recuerda es
+    "desde el nodo n con r pasos restantes no se llega al objetivo", que es
+    cierto sin importar por qué camino llegamos. Así se evita repetir trabajo
+    SIN perder completitud.
+
+    Args:
+        graph (dict): El grafo como lista de adyacencia.
+        start_node (str): El nodo de inicio.
+        goal_node (str): El nodo objetivo.
+        limit (int): La profundidad máxima a explorar.
+        table (TranspositionTable, optional): Tabla a usar. Con None no se usa
+                                              memoria (para comparar).
+
+    Returns:
+        (found, expanded): si se encontró el objetivo y cuántos nodos se expandieron.
+    """
+    expanded = 0
+
+    def search(node, remaining_depth):
+        nonlocal expanded
+
+        # 1. ¿Es el objetivo?
+        if node == goal_node:
+            return True
+
+        # 2. ¿Se acabaron los pasos?
+        if remaining_depth == 0:
+            return False
+
+        # 3. ¿Ya sabemos que desde aquí (con estos pasos) no hay objetivo?
+        if table is not None and table.is_known_failure(node, remaining_depth):
+            return False
+
+        # 4. Expandimos los vecinos
+        expanded += 1
+        for neighbor in graph.get(node, []):
+            if search(neighbor, remaining_depth - 1):
+                return True
+
+        # 5. Falló: lo anotamos para no repetir este subárbol
+        if table is not None:
+            table.store_failure(node, remaining_depth)
+        return False
+
+    return search(start_node, limit), expanded
+
 # --- Definimos nuestro grafo de ejemplo ---
 #       'A'
 #      /   \
@@ -66,10 +128,30 @@ graph_example = {
 
 # --- Ejecutamos el algoritmo (Prueba 1: Límite muy corto) ---
 print("--- PRUEBA 1: Límite = 1 (No debería encontrar 'E') ---")
-found = dls(graph_example, 'A', 'E', limit=1)
+found = dls(graph_example, 'A', 'E', limit=1, trace=PrintSink())
 print(f"Resultado final: Objetivo encontrado = {found}\n")
 
 # --- Ejecutamos el algoritmo (Prueba 2: Límite suficiente) ---
 print("--- PRUEBA 2: Límite = 2 (Sí debería encontrar 'E') ---")
-found = dls(graph_example, 'A', 'E', limit=2)
-print(f"Resultado final: Objetivo encontrado = {found}\n")
\ No newline at end of file
+found = dls(graph_example, 'A', 'E', limit=2, trace=PrintSink())
+print(f"Resultado final: Objetivo encontrado = {found}\n")
+
+# --- Grafo con muchos caminos que se cruzan (rejilla 6x6 dirigida) ---
+# Desde cada casilla se puede ir a la derecha o hacia abajo, así que
+# a la casilla (i, j) se llega por MUCHOS caminos distintos.
+grid_graph = {}
+for i in range(6):
+    for j in range(6):
+        grid_graph[(i, j)] = [(i + di, j + dj) for di, dj in ((0, 1), (1, 0))
+                              if i + di < 6 and j + dj < 6]
+
+# --- Ejecutamos DLS con y sin tabla de transposición ---
+# El objetivo (5, 5) está a profundidad 10: con límite 9 hay que recorrer todo.
+print("--- PRUEBA 3: DLS con tabla de transposición (rejilla 6x6, límite=9) ---")
+found, expanded_plain = dls_with_table(grid_graph, (0, 0), (5, 5), limit=9)
+print(f"Sin tabla: encontrado={found}, nodos expandidos={expanded_plain}")
+
+table = TranspositionTable(capacity=1024)
+found, expanded_table = dls_with_table(grid_graph, (0, 0), (5, 5), limit=9, table=table)
+print(f"Con tabla: encontrado={found}, nodos expandidos={expanded_table} "
+      f"(ahorro: {expanded_plain - expanded_table}, aciertos en la tabla: {table.hits})")
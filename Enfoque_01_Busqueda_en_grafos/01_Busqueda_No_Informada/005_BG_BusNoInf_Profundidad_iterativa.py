@@ -1,20 +1,31 @@
-def dls_helper(graph, current_node, goal_node, limit, depth):
+import os
+import sys
+
+# Añadimos la carpeta 'Enfoque_01_Busqueda_en_grafos' al path para usar el paquete 'grafos'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from grafos import GOAL, PRUNE, VISIT, PrintSink, TranspositionTable
+
+def dls_helper(graph, current_node, goal_node, limit, depth, trace=None):
     """
     Función de ayuda (Helper) que realiza la DLS para una profundidad dada.
     Esta versión es más simple y solo devuelve True/False.
+    'trace' es un sink de eventos opcional (el valor de cada evento es la profundidad).
     """
     
-    # 1. Imprimimos la visita (para ver el proceso)
-    print(f"  (Límite: {limit}, Profundidad: {depth}) Visitando: {current_node}")
+    # 1. Avisamos de la visita (para ver el proceso)
+    if trace is not None:
+        trace(VISIT, current_node, depth)
 
     # 2. Comprobar si es el objetivo
     if current_node == goal_node:
-        print(f"¡Objetivo '{goal_node}' encontrado!")
+        if trace is not None:
+            trace(GOAL, current_node, depth)
         return True  # ¡Éxito!
 
     # 3. Comprobar si hemos llegado al límite
     if depth == limit:
-        #print(f"    -> Límite alcanzado.")
+        if trace is not None:
+            trace(PRUNE, current_node, depth)
         return False  # Cortamos la búsqueda
 
     # 4. Exploramos vecinos (recursión)
@@ -25,7 +36,7 @@ def dls_helper(graph, current_node, goal_node, limit, depth):
         # para que veas cómo se re-explora. Si tuvieras ciclos,
         # necesitarías pasar un 'visited' para el *camino actual*).
         
-        if dls_helper(graph, neighbor, goal_node, limit, depth + 1):
+        if dls_helper(graph, neighbor, goal_node, limit, depth + 1, trace):
             return True # Propagamos el éxito
 
     # 6. No se encontró en esta rama
@@ -33,7 +44,7 @@ def dls_helper(graph, current_node, goal_node, limit, depth):
 
 # --- Función principal de IDDFS ---
 
-def iddfs(graph, start_node, goal_node, max_allowed_depth):
+def iddfs(graph, start_node, goal_node, max_allowed_depth, trace=None):
     """
     Implementa la Búsqueda en Profundidad Iterativa (IDDFS).
     
@@ -42,30 +53,161 @@ def iddfs(graph, start_node, goal_node, max_allowed_depth):
         start_node (str): El nodo de inicio.
         goal_node (str): El nodo objetivo.
         max_allowed_depth (int): El número máximo de iteraciones.
+        trace (optional): Sink de eventos (PrintSink, CountSink, ...).
+                          Con None no se imprime ni se registra nada.
+
+    Returns:
+        bool: True si se encontró el objetivo, False si no.
     """
     
-    print(f"Iniciando IDDFS desde '{start_node}' para buscar '{goal_node}'"
-          f" (Profundidad máx: {max_allowed_depth})\n")
-    
     # 1. El bucle iterativo: probamos límite 0, 1, 2, ...
     for limit in range(max_allowed_depth + 1):
         
-        print(f"--- INICIANDO BÚSQUEDA CON LÍMITE = {limit} ---")
-        
         # 2. Llamamos a DLS con el límite actual
         # "Olvidamos" todo lo de la iteración anterior.
-        if dls_helper(graph, start_node, goal_node, limit, depth=0):
-            print(f"\nBúsqueda exitosa. Objetivo encontrado en la iteración "
-                  f"con límite de profundidad {limit}.")
+        if dls_helper(graph, start_node, goal_node, limit, depth=0, trace=trace):
             return True
-        
-        print(f"--- Fin de la búsqueda con límite {limit}. Objetivo no encontrado. ---\n")
 
-    print(f"Búsqueda fallida. Objetivo no encontrado "
-          f"dentro de la profundidad máxima {max_allowed_depth}.")
     return False
 
 
+# --- IDDFS con tabla de transposición ---
+
+def dls_helper_with_table(graph, current_node, goal_node, remaining_depth, table, counter):
+    """
+    Igual que dls_helper, pero sin trazas y consultando la tabla de
+    transposición antes de expandir. 'counter' es una lista de un elemento
+    donde se acumulan los nodos expandidos.
+    """
+    if current_node == goal_node:
+        return True
+    if remaining_depth == 0:
+        return False
+
+    # ¿Ya falló este nodo con al menos estos pasos (en esta u otra iteración)?
+    if table is not None and table.is_known_failure(current_node, remaining_depth):
+        return False
+
+    counter[0] += 1
+    for neighbor in graph.get(current_node, []):
+        if dls_helper_with_table(graph, neighbor, goal_node, remaining_depth - 1,
+                                 table, counter):
+            return True
+
+    if table is not None:
+        table.store_failure(current_node, remaining_depth)
+    return False
+
+
+def iddfs_with_table(graph, start_node, goal_node, max_allowed_depth, table=None):
+    """
+    IDDFS que reutiliza una tabla de transposición entre iteraciones.
+
+    Un fallo "desde n con r pasos" sigue siendo cierto en la iteración
+    siguiente, así que la tabla evita re-expandir los mismos subárboles una
+    y otra vez (en grafos con ciclos o con subárboles compartidos).
+
+    Returns:
+        (limit, expanded): límite con el que se encontró el objetivo (None si
+                           no se encontró) y total de nodos expandidos.
+    """
+    counter = [0]
+    for limit in range(max_allowed_depth + 1):
+        if dls_helper_with_table(graph, start_node, goal_node, limit, table, counter):
+            return limit, counter[0]
+    return None, counter[0]
+
+
+# --- IDDFS que retoma la frontera de corte ---
+
+def _expand_to_limit(graph, roots, goal_node, steps, budget, counter):
+    """
+    Ayudante: DFS con pila explícita desde cada raíz, bajando 'steps' niveles.
+
+    Cada entrada de la pila es un "eslabón" (nodo, eslabón_del_padre), así el
+    camino se puede reconstruir sin copiar listas. Los nodos a los que se les
+    acaban los pasos forman la frontera de corte.
+
+    Returns:
+        (goal_link, cutoff): el eslabón del objetivo (o None) y la frontera de
+                             corte en orden DFS (o None si pasó del presupuesto).
+    """
+    cutoff = []
+    for root in roots:
+        stack = [(root, steps)]
+        while stack:
+            link, remaining = stack.pop()
+            node = link[0]
+
+            if node == goal_node:
+                return link, None
+
+            if remaining == 0:
+                # Guardamos el nodo cortado mientras quepa en el presupuesto
+                if cutoff is not None:
+                    if budget is None or len(cutoff) < budget:
+                        cutoff.append(link)
+                    else:
+                        cutoff = None  # No cabe: la próxima iteración reinicia
+                continue
+
+            counter[0] += 1
+            # Invertimos para que el primer vecino salga primero (orden DFS)
+            for neighbor in reversed(graph.get(node, [])):
+                stack.append(((neighbor, link), remaining - 1))
+    return None, cutoff
+
+
+def iddfs_resuming(graph, start_node, goal_node, max_allowed_depth, frontier_budget=None):
+    """
+    IDDFS que NO reinicia desde la raíz en cada iteración.
+
+    Al terminar la iteración con límite k, guardamos los nodos que quedaron
+    cortados justo en la profundidad k (la frontera de corte). La iteración
+    k+1 solo tiene que expandir esos nodos un nivel más, en lugar de rehacer
+    todo el árbol. El resultado (y el orden en que se encuentra el objetivo)
+    es el mismo que el de iddfs.
+
+    Si la frontera no cabe en 'frontier_budget', se descarta y la iteración
+    siguiente vuelve a empezar desde la raíz, como el IDDFS clásico.
+
+    Args:
+        graph (dict): El grafo como lista de adyacencia.
+        start_node (str): El nodo de inicio.
+        goal_node (str): El nodo objetivo.
+        max_allowed_depth (int): La profundidad máxima.
+        frontier_budget (int, optional): Máximo de nodos guardados en la frontera.
+                                         None = sin límite; 0 = siempre reiniciar.
+
+    Returns:
+        (path, limit, expanded): el camino (None si no se encontró), el límite
+                                 con el que se encontró y el total de nodos expandidos.
+    """
+    counter = [0]
+    root_link = (start_node, None)
+    cutoff = None
+
+    for limit in range(max_allowed_depth + 1):
+        if cutoff is None:
+            # 1. Sin frontera guardada: DLS completa desde la raíz
+            goal_link, cutoff = _expand_to_limit(graph, [root_link], goal_node,
+                                                 limit, frontier_budget, counter)
+        else:
+            # 2. Con frontera: solo bajamos un nivel más desde ella
+            goal_link, cutoff = _expand_to_limit(graph, cutoff, goal_node,
+                                                 1, frontier_budget, counter)
+
+        if goal_link is not None:
+            path = []
+            while goal_link is not None:
+                path.append(goal_link[0])
+                goal_link = goal_link[1]
+            path.reverse()
+            return path, limit, counter[0]
+
+    return None, None, counter[0]
+
+
 # --- Definimos nuestro grafo de ejemplo (árbol) ---
 #       'A'
 #      /   \
@@ -83,4 +225,37 @@ graph_example = {
 
 # --- Ejecutamos el algoritmo ---
 # Buscamos 'E', que está en profundidad 2
-iddfs(graph_example, 'A', 'E', max_allowed_depth=3)
\ No newline at end of file
+# (PrintSink imprime cada evento con su profundidad; sin 'trace' no se imprime nada)
+print("Iniciando IDDFS desde 'A' para buscar 'E' (Profundidad máx: 3)")
+found = iddfs(graph_example, 'A', 'E', max_allowed_depth=3, trace=PrintSink())
+print(f"Resultado final: Objetivo encontrado = {found}")
+
+# --- Grafo con muchos caminos que se cruzan (rejilla 6x6 dirigida) ---
+# Desde cada casilla se puede ir a la derecha o hacia abajo, así que
+# a la casilla (i, j) se llega por MUCHOS caminos distintos.
+grid_graph = {}
+for i in range(6):
+    for j in range(6):
+        grid_graph[(i, j)] = [(i + di, j + dj) for di, dj in ((0, 1), (1, 0))
+                              if i + di < 6 and j + dj < 6]
+
+# --- IDDFS con y sin tabla de transposición ---
+print("\n--- IDDFS con tabla de transposición (rejilla 6x6, objetivo (5, 5)) ---")
+limit_found, expanded_plain = iddfs_with_table(grid_graph, (0, 0), (5, 5), max_allowed_depth=12)
+print(f"Sin tabla: encontrado con límite {limit_found}, nodos expandidos={expanded_plain}")
+
+for policy in (TranspositionTable.DEPTH_PREFERRED, TranspositionTable.ALWAYS_REPLACE):
+    table = TranspositionTable(capacity=16, policy=policy)  # Tabla pequeña a propósito
+    limit_found, expanded_table = iddfs_with_table(grid_graph, (0, 0), (5, 5),
+                                                   max_allowed_depth=12, table=table)
+    print(f"Con tabla '{policy}' (16 casillas): encontrado con límite {limit_found}, "
+          f"nodos expandidos={expanded_table} (ahorro: {expanded_plain - expanded_table})")
+
+# --- IDDFS que retoma la frontera vs. IDDFS que reinicia ---
+print("\n--- IDDFS retomando la frontera de corte (rejilla 6x6) ---")
+for budget, label in ((0, "siempre reinicia"), (None, "frontera sin límite"),
+                      (100, "presupuesto de 100 nodos")):
+    path, limit_found, expanded = iddfs_resuming(grid_graph, (0, 0), (5, 5),
+                                                 max_allowed_depth=12, frontier_budget=budget)
+    print(f"  {label:<26} límite {limit_found}, nodos expandidos={expanded}")
+print(f"  Camino: {path}")
@@ -1,4 +1,11 @@
 import collections
+import heapq
+import os
+import sys
+
+# Añadimos la carpeta 'Enfoque_01_Busqueda_en_grafos' al path para usar el paquete 'grafos'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from grafos import GOAL, VISIT, GrafoCSR, PrintSink, cost_neighbor_edges
 
 def reconstruct_path(start_node, goal_node, intersection_node, 
                      path_from_start, path_from_goal):
@@ -24,10 +31,11 @@ def reconstruct_path(start_node, goal_node, intersection_node,
     # El camino final es path1 + path2
     return path1 + path2
 
-def bidirectional_bfs(graph, start_node, goal_node):
+def bidirectional_bfs(graph, start_node, goal_node, trace=None):
     """
     Implementa la Búsqueda Bidireccional usando dos BFS.
     Asume un grafo no dirigido.
+    'trace' es un sink de eventos opcional (PrintSink, CountSink, ...).
     """
     
     # --- Estructuras para la búsqueda DESDE EL INICIO ---
@@ -40,19 +48,19 @@ def bidirectional_bfs(graph, start_node, goal_node):
     visited_goal = {goal_node}
     path_from_goal = {goal_node: None} # {hijo: padre} (en sentido inverso)
 
-    print(f"Iniciando Búsqueda Bidireccional: '{start_node}' <-> '{goal_node}'")
-
     # 3. Mientras ambas colas tengan nodos por explorar
     while queue_start and queue_goal:
         
         # --- PASO 1: Expandir un nivel desde el INICIO ---
         if queue_start:
             current_start = queue_start.popleft()
-            print(f"  -> Buscando desde INICIO: Visitando '{current_start}'")
+            if trace is not None:
+                trace(VISIT, current_start)
 
             # 4. ¡LA CLAVE! ¿Este nodo ya fue visitado por la OTRA búsqueda?
             if current_start in visited_goal:
-                print(f"¡Intersección encontrada en: '{current_start}'!")
+                if trace is not None:
+                    trace(GOAL, current_start)
                 return reconstruct_path(start_node, goal_node, current_start,
                                         path_from_start, path_from_goal)
 
@@ -65,11 +73,13 @@ def bidirectional_bfs(graph, start_node, goal_node):
         # --- PASO 2: Expandir un nivel desde el FINAL ---
         if queue_goal:
             current_goal = queue_goal.popleft()
-            print(f"  <- Buscando desde FINAL: Visitando '{current_goal}'")
+            if trace is not None:
+                trace(VISIT, current_goal)
 
             # 5. ¡LA CLAVE OTRA VEZ! ¿Este nodo ya fue visitado por la OTRA búsqueda?
             if current_goal in visited_start:
-                print(f"¡Intersección encontrada en: '{current_goal}'!")
+                if trace is not None:
+                    trace(GOAL, current_goal)
                 return reconstruct_path(start_node, goal_node, current_goal,
                                         path_from_start, path_from_goal)
 
@@ -80,9 +90,157 @@ def bidirectional_bfs(graph, start_node, goal_node):
                     queue_goal.append(neighbor)
 
     # 6. Si una cola se vacía, no hay camino
-    print("No se encontró un camino entre los nodos.")
     return None
 
+
+def bidirectional_bfs_balanced(graph, start_node, goal_node, reverse_graph=None):
+    """
+    Búsqueda Bidireccional por NIVELES que siempre expande la frontera más pequeña.
+
+    A diferencia de bidirectional_bfs:
+      - Expande un nivel COMPLETO a la vez (no un nodo suelto).
+      - Elige el lado con menos nodos en su frontera, así ninguno crece de más.
+      - Al encontrar intersecciones termina el nivel y se queda con la mejor,
+        por lo que el camino devuelto es el MÁS CORTO (en número de aristas).
+
+    Args:
+        graph (dict | GrafoCSR): El grafo como lista de adyacencia.
+        start_node (str): El nodo de inicio.
+        goal_node (str): El nodo objetivo.
+        reverse_graph (optional): Grafo con las aristas invertidas (para grafos
+                                  dirigidos). Por defecto se asume no dirigido.
+
+    Returns:
+        (path, expanded): el camino (None si no existe) y los nodos expandidos.
+    """
+    if reverse_graph is None:
+        reverse_graph = graph.reversed() if isinstance(graph, GrafoCSR) else graph
+
+    if start_node == goal_node:
+        return [start_node], 0
+
+    # 1. Padres y distancias de cada lado
+    path_from_start = {start_node: None}
+    path_from_goal = {goal_node: None}
+    dist_start = {start_node: 0}
+    dist_goal = {goal_node: 0}
+    frontier_start = [start_node]
+    frontier_goal = [goal_node]
+    expanded = 0
+
+    while frontier_start and frontier_goal:
+
+        # 2. Elegimos el lado con la frontera más pequeña
+        if len(frontier_start) <= len(frontier_goal):
+            frontier, adjacency = frontier_start, graph
+            parents, dist, other_dist = path_from_start, dist_start, dist_goal
+        else:
+            frontier, adjacency = frontier_goal, reverse_graph
+            parents, dist, other_dist = path_from_goal, dist_goal, dist_start
+
+        # 3. Expandimos el nivel completo, anotando la mejor intersección
+        next_frontier = []
+        best_length, meeting_node = float('inf'), None
+        for node in frontier:
+            expanded += 1
+            for neighbor in adjacency.get(node, []):
+                if neighbor not in parents:
+                    parents[neighbor] = node
+                    dist[neighbor] = dist[node] + 1
+                    next_frontier.append(neighbor)
+                if neighbor in other_dist:
+                    length = dist[node] + 1 + other_dist[neighbor]
+                    if length < best_length:
+                        best_length, meeting_node = length, neighbor
+
+        # 4. Si este nivel tocó la otra búsqueda, ya tenemos el camino óptimo
+        if meeting_node is not None:
+            return reconstruct_path(start_node, goal_node, meeting_node,
+                                    path_from_start, path_from_goal), expanded
+
+        if frontier is frontier_start:
+            frontier_start = next_frontier
+        else:
+            frontier_goal = next_frontier
+
+    return None, expanded
+
+
+def bidirectional_dijkstra(graph, start_node, goal_node, reverse_graph=None):
+    """
+    Dijkstra Bidireccional para grafos CON COSTOS (formato de UCS: (costo, vecino)).
+
+    Corre dos UCS a la vez: una desde el inicio y otra desde el objetivo
+    (sobre las aristas invertidas), expandiendo siempre el lado con menos
+    nodos en su cola. Lleva 'mu', el costo del mejor camino completo visto
+    al cruzarse, y se detiene cuando
+
+        tope_cola_inicio + tope_cola_objetivo >= mu
+
+    porque ningún camino que falte por descubrir puede costar menos que eso.
+    En caminos largos cada búsqueda solo cubre un "radio" de la mitad, así que
+    se tocan muchos menos nodos que con una sola UCS.
+
+    Args:
+        graph (dict | GrafoCSR): El grafo con costos: {'A': [(5, 'B'), ...]}.
+        start_node (str): El nodo de inicio.
+        goal_node (str): El nodo objetivo.
+        reverse_graph (optional): Grafo invertido (mismo formato). Por defecto
+                                  se asume no dirigido (o se usa el transpuesto del CSR).
+
+    Returns:
+        (path, cost, expanded): camino óptimo (None si no existe), su costo
+                                y los nodos expandidos entre ambos lados.
+    """
+    if reverse_graph is None:
+        reverse_graph = graph.reversed() if isinstance(graph, GrafoCSR) else graph
+
+    # 1. Una cola, costos y padres por cada lado
+    queue_start, queue_goal = [(0, start_node)], [(0, goal_node)]
+    cost_start, cost_goal = {start_node: 0}, {goal_node: 0}
+    path_from_start, path_from_goal = {start_node: None}, {goal_node: None}
+
+    best_cost = 0 if start_node == goal_node else float('inf')
+    meeting_node = start_node if start_node == goal_node else None
+    expanded = 0
+
+    while queue_start and queue_goal:
+
+        # 2. Criterio de parada: nada pendiente puede mejorar a 'mu'
+        if queue_start[0][0] + queue_goal[0][0] >= best_cost:
+            break
+
+        # 3. Expandimos el lado con menos nodos en cola
+        if len(queue_start) <= len(queue_goal):
+            queue, adjacency = queue_start, graph
+            costs, parents, other_costs = cost_start, path_from_start, cost_goal
+        else:
+            queue, adjacency = queue_goal, reverse_graph
+            costs, parents, other_costs = cost_goal, path_from_goal, cost_start
+
+        current_cost, current_node = heapq.heappop(queue)
+        if current_cost > costs[current_node]:
+            continue  # Entrada vieja
+        expanded += 1
+
+        for edge_cost, neighbor in cost_neighbor_edges(adjacency, current_node):
+            new_cost = current_cost + edge_cost
+            if new_cost < costs.get(neighbor, float('inf')):
+                costs[neighbor] = new_cost
+                parents[neighbor] = current_node
+                heapq.heappush(queue, (new_cost, neighbor))
+
+            # 4. ¿Esta arista conecta con lo que ya alcanzó el otro lado?
+            if neighbor in other_costs and costs[neighbor] + other_costs[neighbor] < best_cost:
+                best_cost = costs[neighbor] + other_costs[neighbor]
+                meeting_node = neighbor
+
+    if meeting_node is None:
+        return None, float('inf'), expanded
+    path = reconstruct_path(start_node, goal_node, meeting_node,
+                            path_from_start, path_from_goal)
+    return path, best_cost, expanded
+
 # --- Definimos un grafo de ejemplo (NO DIRIGIDO) ---
 #      'A' --- 'B' --- 'C' --- 'D'
 #       |       |               |
@@ -101,6 +259,31 @@ graph_example = {
 }
 
 # --- Ejecutamos el algoritmo ---
-path = bidirectional_bfs(graph_example, 'A', 'H')
+# (PrintSink imprime cada visita, alternando INICIO y FINAL; la intersección
+#  aparece como objetivo alcanzado. Sin 'trace' no se imprime nada)
+print("Iniciando Búsqueda Bidireccional: 'A' <-> 'H'")
+path = bidirectional_bfs(graph_example, 'A', 'H', trace=PrintSink())
 if path:
-    print(f"\nCamino más corto encontrado: {' -> '.join(path)}")
\ No newline at end of file
+    print(f"\nCamino más corto encontrado: {' -> '.join(path)}")
+else:
+    print("No se encontró un camino entre los nodos.")
+
+# --- Bidireccional por niveles, expandiendo la frontera más pequeña ---
+print("\n--- PRUEBA CON BÚSQUEDA BIDIRECCIONAL BALANCEADA ---")
+path, expanded = bidirectional_bfs_balanced(graph_example, 'A', 'H')
+print(f"Camino más corto: {' -> '.join(path)} ({expanded} nodos expandidos)")
+
+# --- Dijkstra Bidireccional en un grafo con costos (formato de UCS) ---
+# Rejilla 40x40 no dirigida con costos 1..9 "pseudoaleatorios" (fijos)
+size = 40
+weighted_grid = {}
+for i in range(size):
+    for j in range(size):
+        weighted_grid[(i, j)] = [((3 * (i + ni) + 7 * (j + nj)) % 9 + 1, (ni, nj))
+                                 for ni, nj in ((i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1))
+                                 if 0 <= ni < size and 0 <= nj < size]
+
+print("\n--- PRUEBA CON DIJKSTRA BIDIRECCIONAL (rejilla 40x40) ---")
+path, cost, expanded = bidirectional_dijkstra(weighted_grid, (0, 0), (size - 1, size - 1))
+print(f"Costo óptimo: {cost}, largo del camino: {len(path)} nodos, "
+      f"nodos expandidos: {expanded} de {size * size}")
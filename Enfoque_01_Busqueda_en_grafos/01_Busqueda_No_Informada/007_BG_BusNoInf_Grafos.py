@@ -1,13 +1,36 @@
+import array
 import collections
+import heapq
+import itertools
+import os
+import sys
+import tempfile
+import time
+
+# Añadimos la carpeta 'Enfoque_01_Busqueda_en_grafos' al path para usar el paquete 'grafos'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from grafos import (ENQUEUE, GOAL, PRUNE, VISIT, NodeArena, PrintSink, SlidingPuzzle,
+                    contains_sorted, iter_sorted_file, merge_runs, neighbor_cost_edges,
+                    run_length, write_sorted_run)
 
 # --- Definimos las estructuras de la Frontera ---
+#
+# Todas siguen el mismo protocolo:
+#   add(node, g=0)  -> mete un nodo (g = costo acumulado para llegar a él)
+#   remove()        -> saca el siguiente nodo según la estrategia
+#   is_empty(), len()
+#   uses_costs      -> True si la frontera ordena por costos (UCS/A*/Voraz).
+#                      En ese caso la búsqueda vuelve a meter un nodo cuando
+#                      encuentra un camino más barato hacia él.
 
 class QueueFrontier:
     """Implementa una frontera tipo Cola (FIFO) para BFS."""
+    uses_costs = False
+
     def __init__(self):
         self.frontier = collections.deque()
     
-    def add(self, node):
+    def add(self, node, g=0):
         self.frontier.append(node)
         
     def remove(self):
@@ -16,12 +39,17 @@ class QueueFrontier:
     def is_empty(self):
         return len(self.frontier) == 0
 
+    def __len__(self):
+        return len(self.frontier)
+
 class StackFrontier:
     """Implementa una frontera tipo Pila (LIFO) para DFS."""
+    uses_costs = False
+
     def __init__(self):
         self.frontier = [] # Usamos una lista normal
     
-    def add(self, node):
+    def add(self, node, g=0):
         self.frontier.append(node)
         
     def remove(self):
@@ -30,75 +58,372 @@ class StackFrontier:
     def is_empty(self):
         return len(self.frontier) == 0
 
+    def __len__(self):
+        return len(self.frontier)
+
+class PriorityFrontier:
+    """
+    Implementa una frontera con Cola de Prioridad (min-heap).
+
+    La prioridad depende de la estrategia:
+        'ucs'    -> g(n)          (Costo Uniforme)
+        'greedy' -> h(n)          (Voraz Primero el Mejor)
+        'astar'  -> g(n) + h(n)   (A*)
+    """
+    uses_costs = True
+
+    def __init__(self, strategy='ucs', heuristics=None):
+        if strategy not in ('ucs', 'greedy', 'astar'):
+            raise ValueError(f"Estrategia desconocida: '{strategy}'")
+        if strategy != 'ucs' and heuristics is None:
+            raise ValueError(f"La estrategia '{strategy}' necesita heurísticas")
+        self.strategy = strategy
+        self.heuristics = heuristics or {}
+        self.frontier = []
+        # Contador de desempate: a igual prioridad sale el que entró primero
+        # (y así nunca se comparan los nodos entre sí)
+        self.counter = itertools.count()
+
+    def add(self, node, g=0):
+        h = self.heuristics.get(node, 0)
+        if self.strategy == 'ucs':
+            priority = g
+        elif self.strategy == 'greedy':
+            priority = h
+        else:
+            priority = g + h
+        heapq.heappush(self.frontier, (priority, next(self.counter), node))
+
+    def remove(self):
+        return heapq.heappop(self.frontier)[2]
+
+    def is_empty(self):
+        return len(self.frontier) == 0
+
+    def __len__(self):
+        return len(self.frontier)
+
+# --- Estadísticas de la búsqueda ---
+
+class SearchStats:
+    """
+    Contadores para perfilar cualquier estrategia con el mismo driver.
+
+    Atributos:
+        nodes_generated: nodos metidos a la frontera (incluye el inicial).
+        nodes_expanded: nodos a los que se les generaron vecinos.
+        peak_frontier_size: tamaño máximo que alcanzó la frontera.
+        duplicate_hits: nodos sacados de la frontera que ya estaban explorados.
+        phase_times: segundos acumulados por fase ('remove', 'expand', 'path').
+    """
+
+    def __init__(self):
+        self.nodes_generated = 0
+        self.nodes_expanded = 0
+        self.peak_frontier_size = 0
+        self.duplicate_hits = 0
+        self.phase_times = {'remove': 0.0, 'expand': 0.0, 'path': 0.0}
+
+    def total_time(self):
+        return sum(self.phase_times.values())
+
+    def __repr__(self):
+        times = ', '.join(f"{phase}={seconds * 1000:.3f}ms"
+                          for phase, seconds in self.phase_times.items())
+        return (f"SearchStats(generados={self.nodes_generated}, "
+                f"expandidos={self.nodes_expanded}, "
+                f"frontera_max={self.peak_frontier_size}, "
+                f"duplicados={self.duplicate_hits}, {times})")
+
 # --- Algoritmo Genérico de Búsqueda en Grafos ---
 
-def generic_graph_search(graph, start_node, goal_node, frontier_object):
+def generic_graph_search(graph, start_node, goal_node, frontier_object,
+                         weighted=False, trace=None, stats=None, visited=None, arena=None):
     """
     Implementa el algoritmo genérico de Búsqueda en Grafos.
     
     Args:
         graph (dict): El grafo como lista de adyacencia.
+                      También acepta un GrafoCSR o un GrafoImplicito.
         start_node (str): El nodo de inicio.
         goal_node (str): El nodo objetivo.
-        frontier_object: Una instancia de QueueFrontier (BFS) o StackFrontier (DFS).
+        frontier_object: Una instancia de QueueFrontier (BFS), StackFrontier (DFS)
+                         o PriorityFrontier (UCS / Voraz / A*).
+        weighted (bool): Si es True, las aristas vienen como (vecino, costo),
+                         igual que en A*. Si no, cada arista cuesta 1.
+        trace (optional): Sink de eventos (PrintSink, CountSink, ...).
+                          Con None no se imprime ni se registra nada.
+        stats (SearchStats, optional): Si se pasa, se llena con las estadísticas.
+        visited (optional): Conjunto de explorados a usar (vacío). Por defecto
+                            un set; también BitsetVisited o BloomVisited.
+        arena (NodeArena, optional): Almacén de nodos (vacío). Si se pasa, al
+                          final contiene todos los nodos descubiertos. Por
+                          defecto NodeArena.for_graph(graph) (densa con un GrafoCSR).
     """
+    if stats is None:
+        stats = SearchStats()
+    clock = time.perf_counter
     
     # 1. El conjunto de "Explorados" o "Visitados".
     # Esta es la "memoria" que nos protege de los ciclos.
-    visited = set()
+    if visited is None:
+        visited = set()
     
     # 2. La Frontera (el tipo de objeto define la estrategia)
     frontier = frontier_object
     
-    # 3. Guardamos los "padres" para reconstruir el camino
-    path_from = {start_node: None}
+    # 3. Guardamos los "padres" para reconstruir el camino,
+    #    y el costo g(n) del mejor camino conocido a cada nodo
+    #    (todo en la arena de nodos, en lugar de dos diccionarios)
+    if arena is None:
+        arena = NodeArena.for_graph(graph)
+    arena.add(start_node)
     
     # 4. Empezamos con el nodo inicial
-    frontier.add(start_node)
-    
-    print(f"Iniciando búsqueda genérica desde '{start_node}'...")
+    frontier.add(start_node, 0)
+    stats.nodes_generated += 1
+    stats.peak_frontier_size = max(stats.peak_frontier_size, len(frontier))
 
     # 5. Bucle principal
     while not frontier.is_empty():
         
         # 6. Sacamos un nodo de la frontera
-        # (Si es Cola -> saca el más viejo. Si es Pila -> saca el más nuevo)
+        # (Si es Cola -> saca el más viejo. Si es Pila -> saca el más nuevo.
+        #  Si es Prioridad -> saca el de menor prioridad)
+        phase_start = clock()
         current_node = frontier.remove()
+        stats.phase_times['remove'] += clock() - phase_start
         
-        print(f"  -> Explorando: '{current_node}'")
+        if trace is not None:
+            trace(VISIT, current_node)
         
         # 7. Si es el objetivo, ¡terminamos!
         if current_node == goal_node:
-            print(f"¡Objetivo '{goal_node}' encontrado!")
+            if trace is not None:
+                trace(GOAL, current_node)
             
             # Reconstruir camino
-            path = []
-            while current_node is not None:
-                path.append(current_node)
-                current_node = path_from[current_node]
-            path.reverse()
+            phase_start = clock()
+            path = arena.path(arena.index_of(current_node))
+            stats.phase_times['path'] += clock() - phase_start
             return path
 
         # 8. ¡LA CLAVE DEL GRAFO!
         # Si ya lo exploramos, lo ignoramos para evitar ciclos.
         if current_node in visited:
-            print(f"    (Nodo '{current_node}' ya explorado, ignorando)")
+            stats.duplicate_hits += 1
+            if trace is not None:
+                trace(PRUNE, current_node)
             continue
             
         # 9. Si no, lo marcamos como explorado
+        phase_start = clock()
         visited.add(current_node)
+        stats.nodes_expanded += 1
         
         # 10. Añadimos a sus vecinos a la frontera
-        for neighbor in graph.get(current_node, []):
+        # (Con costos, en formato (vecino, costo) sea dict, GrafoCSR o GrafoImplicito)
+        if weighted:
+            edges = neighbor_cost_edges(graph, current_node)
+        else:
+            edges = graph.get(current_node, [])
+        current_index = arena.index_of(current_node)
+        current_g = arena.g[current_index]
+        for edge in edges:
+            neighbor, edge_cost = edge if weighted else (edge, 1)
+            new_g = current_g + edge_cost
             
             # Solo añadimos si NO está visitado Y NO está ya en el camino
-            # (path_from es una forma de saber si ya lo descubrimos)
-            if neighbor not in path_from:
-                path_from[neighbor] = current_node # Guardamos el camino
-                frontier.add(neighbor)
-                print(f"    -> Descubierto vecino: '{neighbor}'")
+            # (estar en la arena es una forma de saber si ya lo descubrimos).
+            # Con una frontera de prioridad también lo volvemos a meter
+            # si encontramos un camino MÁS BARATO (como en UCS).
+            neighbor_index = arena.index_of(neighbor)
+            if neighbor_index is None:
+                arena.add(neighbor, current_index, new_g) # Guardamos el camino
+            elif (frontier.uses_costs and neighbor not in visited
+                  and new_g < arena.g[neighbor_index]):
+                arena.update(neighbor_index, current_index, new_g)
+            else:
+                continue
+            frontier.add(neighbor, new_g)
+            stats.nodes_generated += 1
+            if trace is not None:
+                trace(ENQUEUE, neighbor, new_g)
+        stats.peak_frontier_size = max(stats.peak_frontier_size, len(frontier))
+        stats.phase_times['expand'] += clock() - phase_start
+
+    return None
+
+# --- BFS en memoria externa (la frontera vive en disco) ---
+
+class ExternalSearchStats(SearchStats):
+    """
+    SearchStats de la BFS en memoria externa, con contadores de disco.
+    duplicate_hits cuenta los estados generados que se descartaron: repetidos
+    dentro de una corrida, entre corridas o ya presentes en capas anteriores.
+
+    Atributos extra:
+        layers: capas (niveles) que se escribieron.
+        runs_written: corridas ordenadas que se volcaron a disco.
+        bytes_written: bytes escritos en corridas y capas.
+        peak_states_in_memory: máximo de estados en el búfer a la vez.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.phase_times['merge'] = 0.0
+        self.layers = 0
+        self.runs_written = 0
+        self.bytes_written = 0
+        self.peak_states_in_memory = 0
+
+    def __repr__(self):
+        return (super().__repr__()[:-1] + f", capas={self.layers}, "
+                f"corridas={self.runs_written}, bytes_escritos={self.bytes_written}, "
+                f"memoria_max={self.peak_states_in_memory} estados)")
+
+
+def _find_parent(graph, state, layer_file, encode, decode, chunk_items):
+    """
+    Ayudante: un estado de 'layer_file' que tenga a 'state' como vecino.
+    Primero prueba con los vecinos de 'state' (basta en grafos no dirigidos,
+    con búsqueda binaria en el archivo); si no, recorre la capa completa.
+    """
+    for neighbor in graph.get(decode(state), []):
+        code = encode(neighbor)
+        if contains_sorted(layer_file, code) and \
+                state in (encode(n) for n in graph.get(neighbor, [])):
+            return code
+    for code in iter_sorted_file(layer_file, chunk_items):
+        if state in (encode(n) for n in graph.get(decode(code), [])):
+            return code
+    return None
+
+
+def external_memory_bfs(graph, start_node, goal_node, work_dir=None,
+                        max_states_in_memory=1 << 20, dedup_layers=2,
+                        encode=None, decode=None, stats=None, merge_fan_in=16):
+    """
+    BFS en memoria externa (detección de duplicados diferida, Munagala–Ranade).
+
+    La frontera NUNCA está completa en memoria: cada capa es un archivo de
+    estados (enteros) ordenados. Para generar la capa siguiente:
+      1. Se lee la capa actual por bloques y se generan los vecinos; cuando
+         el búfer llega a 'max_states_in_memory', se ordena y se vuelca a
+         disco como una "corrida".
+      2. Las corridas se mezclan quitando repetidos y los estados que ya
+         están en las 'dedup_layers' capas anteriores. Cada mezcla abre a lo
+         más 'merge_fan_in' archivos (con más corridas, se mezcla en varias
+         pasadas) y lee bloques de max_states_in_memory / (merge_fan_in + 1)
+         estados, así que la memoria sigue acotada por max_states_in_memory.
+    En un grafo NO dirigido (o un espacio de estados reversible, como el
+    8-puzzle) un vecino solo puede estar en la capa anterior, la actual o la
+    siguiente, así que basta con comparar contra DOS capas. Para grafos
+    dirigidos usa dedup_layers=None (compara contra todas).
+
+    Args:
+        graph: Grafo como lista de adyacencia (dict, GrafoCSR, GrafoImplicito).
+        start_node, goal_node: Nodos de inicio y objetivo.
+        work_dir (str, optional): Carpeta para los archivos temporales.
+        max_states_in_memory (int): Tamaño del búfer de estados generados (y
+                      presupuesto de los bloques de lectura de la mezcla).
+        dedup_layers (int | None): Capas anteriores contra las que se compara.
+        encode, decode (callable, optional): Convierten un nodo en un entero
+                      >= 0 (64 bits) y de vuelta. Por defecto los nodos ya son
+                      enteros (ids, estados empaquetados con StatePacker).
+                      Para un GrafoCSR con nombres: graph.id_of / graph.name_of.
+        stats (ExternalSearchStats, optional): Si se pasa, se llena con las estadísticas.
+        merge_fan_in (int): Máximo de archivos abiertos en cada mezcla.
+
+    Returns:
+        list: El camino encontrado, o None si no hay camino.
+    """
+    # (Los bloques de lectura de una mezcla se reparten el mismo presupuesto)
+    chunk_items = max(1, max_states_in_memory // (merge_fan_in + 1))
+    if encode is None:
+        encode = int
+    if decode is None:
+        decode = int
+    if stats is None:
+        stats = ExternalSearchStats()
+    clock = time.perf_counter
+
+    start, goal = encode(start_node), encode(goal_node)
+    if start == goal:
+        return [start_node]
+
+    with tempfile.TemporaryDirectory(dir=work_dir) as directory:
+        def layer_file(k):
+            return os.path.join(directory, f'capa_{k}.bin')
+
+        # 1. La capa 0 es solo el inicio
+        write_sorted_run([start], layer_file(0))
+        layer = 0
+        found_parent = None
+
+        while run_length(layer_file(layer)) > 0:
+            stats.layers = layer + 1
+
+            # 2. Expandimos la capa actual por bloques, volcando corridas a disco
+            phase_start = clock()
+            runs = []
+            buffer = array.array('Q')
+
+            def spill():
+                run = os.path.join(directory, f'corrida_{layer}_{len(runs)}.bin')
+                written = write_sorted_run(buffer, run)
+                stats.bytes_written += 8 * written
+                stats.duplicate_hits += len(buffer) - written
+                stats.runs_written += 1
+                runs.append(run)
+                del buffer[:]
+
+            for state in iter_sorted_file(layer_file(layer), chunk_items):
+                stats.nodes_expanded += 1
+                for neighbor in graph.get(decode(state), []):
+                    code = encode(neighbor)
+                    stats.nodes_generated += 1
+                    if code == goal:
+                        found_parent = state
+                        break
+                    buffer.append(code)
+                    if len(buffer) >= max_states_in_memory:
+                        stats.peak_states_in_memory = max(stats.peak_states_in_memory,
+                                                          len(buffer))
+                        spill()
+                if found_parent is not None:
+                    break
+            stats.peak_states_in_memory = max(stats.peak_states_in_memory, len(buffer))
+            stats.phase_times['expand'] += clock() - phase_start
+
+            # 3. ¡Objetivo! Reconstruimos el camino hacia atrás, capa por capa
+            if found_parent is not None:
+                phase_start = clock()
+                path = [goal, found_parent]
+                for k in range(layer - 1, -1, -1):
+                    path.append(_find_parent(graph, path[-1], layer_file(k), encode, decode,
+                                             chunk_items))
+                path.reverse()
+                stats.phase_times['path'] += clock() - phase_start
+                return [decode(code) for code in path]
+
+            # 4. Mezclamos las corridas en la capa siguiente, sin repetidos ni
+            #    estados de las capas anteriores
+            phase_start = clock()
+            if buffer or not runs:
+                spill()
+            first_layer = 0 if dedup_layers is None else max(0, layer - dedup_layers + 1)
+            previous = [layer_file(k) for k in range(first_layer, layer + 1)]
+            size, dropped = merge_runs(runs, layer_file(layer + 1), exclude_paths=previous,
+                                       chunk_items=chunk_items, max_fan_in=merge_fan_in)
+            stats.duplicate_hits += dropped
+            stats.bytes_written += 8 * size
+            stats.peak_frontier_size = max(stats.peak_frontier_size, size)
+            for run in runs:
+                os.remove(run)
+            stats.phase_times['merge'] += clock() - phase_start
+            layer += 1
 
-    print(f"Objetivo '{goal_node}' no encontrado.")
     return None
 
 # --- Grafo de ejemplo CON CICLOS ---
@@ -117,13 +442,59 @@ graph_with_cycles = {
 # --- PRUEBA 1: Usando la Cola (BFS) ---
 print("--- PRUEBA CON BÚSQUEDA EN ANCHURA (BFS) ---")
 frontier_bfs = QueueFrontier()
-path_bfs = generic_graph_search(graph_with_cycles, 'A', 'E', frontier_bfs)
+print("Iniciando búsqueda genérica desde 'A'...")
+path_bfs = generic_graph_search(graph_with_cycles, 'A', 'E', frontier_bfs, trace=PrintSink())
 if path_bfs:
     print(f"Camino BFS: {' -> '.join(path_bfs)}\n")
 
 # --- PRUEBA 2: Usando la Pila (DFS) ---
 print("--- PRUEBA CON BÚSQUEDA EN PROFUNDIDAD (DFS) ---")
 frontier_dfs = StackFrontier()
-path_dfs = generic_graph_search(graph_with_cycles, 'A', 'E', frontier_dfs)
+print("Iniciando búsqueda genérica desde 'A'...")
+path_dfs = generic_graph_search(graph_with_cycles, 'A', 'E', frontier_dfs, trace=PrintSink())
 if path_dfs:
-    print(f"Camino DFS: {' -> '.join(path_dfs)}\n")
\ No newline at end of file
+    print(f"Camino DFS: {' -> '.join(path_dfs)}\n")
+
+# --- PRUEBA 3: Todas las estrategias con el MISMO driver, sin imprimir ---
+# (Grafo con costos en formato (vecino, costo), el mismo del ejemplo de A*)
+graph_costs = {
+    'A': [('B', 10), ('C', 100)],
+    'B': [('D', 1), ('C', 2)],
+    'D': [('C', 10)],
+    'C': []
+}
+heuristic_values = {'A': 3, 'B': 2, 'D': 8, 'C': 0}
+
+print("--- PRUEBA CON TODAS LAS ESTRATEGIAS (estadísticas, sin imprimir) ---")
+strategies = {
+    'BFS': QueueFrontier(),
+    'DFS': StackFrontier(),
+    'UCS': PriorityFrontier('ucs'),
+    'Voraz': PriorityFrontier('greedy', heuristic_values),
+    'A*': PriorityFrontier('astar', heuristic_values),
+}
+for name, frontier in strategies.items():
+    stats = SearchStats()
+    path = generic_graph_search(graph_costs, 'A', 'C', frontier,
+                                weighted=True, stats=stats)
+    print(f"{name:>6}: {' -> '.join(path)}  {stats}")
+
+# --- PRUEBA 4: Grafo implícito (8-puzzle), estados generados a pedido ---
+print("\n--- PRUEBA CON GrafoImplicito (8-puzzle) ---")
+puzzle = SlidingPuzzle(3)
+start_state = puzzle.scrambled(30, seed=1)
+for name, frontier in [('BFS', QueueFrontier()),
+                       ('A*', PriorityFrontier('astar', puzzle.heuristics))]:
+    stats = SearchStats()
+    path = generic_graph_search(puzzle, start_state, puzzle.goal, frontier,
+                                weighted=True, stats=stats)
+    print(f"{name:>6}: {len(path) - 1} movimientos  {stats}")
+
+# --- PRUEBA 5: BFS en memoria externa (frontera en disco) ---
+# (Con un búfer de solo 2000 estados: las capas se escriben en corridas
+#  ordenadas y se mezclan, pero el camino es igual de corto que el de BFS)
+print("\n--- PRUEBA CON BFS EN MEMORIA EXTERNA (8-puzzle) ---")
+stats = ExternalSearchStats()
+path = external_memory_bfs(puzzle, start_state, puzzle.goal,
+                           max_states_in_memory=2000, stats=stats)
+print(f"   BFS externa: {len(path) - 1} movimientos  {stats}")
@@ -1,6 +1,14 @@
 import heapq
+import os
+import sys
 
-def greedy_best_first_search(graph, start_node, goal_node, heuristics):
+# Añadimos la carpeta 'Enfoque_01_Busqueda_en_grafos' al path para usar el paquete 'grafos'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from grafos import (ENQUEUE, GOAL, PRUNE, VISIT, BloomVisited, HeuristicCache, PrintSink,
+                    SlidingPuzzle, as_heuristic, search_peak_bytes, visited_memory_bytes)
+
+def greedy_best_first_search(graph, start_node, goal_node, heuristics, trace=None,
+                             visited=None):
     """
     Implementa la Búsqueda Voraz Primero el Mejor (Greedy Best-First Search).
 
@@ -8,25 +16,37 @@ def greedy_best_first_search(graph, start_node, goal_node, heuristics):
         graph (dict): El grafo como lista de adyacencia.
         start_node (str): El nodo de inicio.
         goal_node (str): El nodo objetivo.
-        heuristics (dict): Un diccionario con el valor heurístico (h(n))
-                           para cada nodo.
+        heuristics (dict | callable): Un diccionario con el valor heurístico (h(n))
+                           para cada nodo, una función h(nodo) o una
+                           HeuristicCache (por ejemplo vectorizada).
+        trace (optional): Sink de eventos (PrintSink, CountSink, ...). El valor
+                          de cada evento es h(n). Con None no se imprime nada.
+        visited (optional): Conjunto de explorados a usar (vacío). Por defecto
+                            un set; también BitsetVisited o BloomVisited.
+
+    Returns:
+        list: El camino encontrado, o None si no hay camino.
     """
     
     # 1. Una cola de prioridad.
     # Guardará tuplas de (valor_heuristico, nodo).
     priority_queue = []
+
+    # (Una función h(n) se envuelve en una caché: un nodo que se vuelve a
+    #  meter a la cola por otro camino no paga su h(n) dos veces)
+    heuristics = as_heuristic(heuristics)
+    batched = isinstance(heuristics, HeuristicCache) and heuristics.vectorized
     
     # 2. Calcular la heurística del nodo inicial y añadirlo a la cola.
     h_start = heuristics.get(start_node, float('inf'))
     heapq.heappush(priority_queue, (h_start, start_node))
     
     # 3. Un conjunto para guardar los nodos que YA hemos explorado
-    visited = set()
+    if visited is None:
+        visited = set()
     
     # 4. Un diccionario para reconstruir el camino
     path_from = {start_node: None}
-    
-    print(f"Iniciando Búsqueda Voraz desde '{start_node}' para encontrar '{goal_node}'")
 
     while priority_queue:
         
@@ -34,18 +54,22 @@ def greedy_best_first_search(graph, start_node, goal_node, heuristics):
         # Sacamos el nodo con el MENOR valor HEURÍSTICO (h(n))
         current_h, current_node = heapq.heappop(priority_queue)
         
-        print(f"\n  Visitando nodo: '{current_node}' (Heurística: {current_h})")
+        if trace is not None:
+            trace(VISIT, current_node, current_h)
         
         # 6. Si ya lo exploramos (porque encontramos un camino peor antes),
         # lo ignoramos.
         if current_node in visited:
+            if trace is not None:
+                trace(PRUNE, current_node, current_h)
             continue
             
         visited.add(current_node)
 
         # 7. ¡OBJETIVO ENCONTRADO!
         if current_node == goal_node:
-            print(f"¡Objetivo '{goal_node}' alcanzado!")
+            if trace is not None:
+                trace(GOAL, current_node, current_h)
             
             # Reconstruir el camino
             path = []
@@ -54,25 +78,30 @@ def greedy_best_first_search(graph, start_node, goal_node, heuristics):
                 path.append(node)
                 node = path_from[node]
             path.reverse()
-            print(f"  Camino encontrado: {' -> '.join(path)}")
-            return
+            return path
         
         # 8. Exploramos los vecinos
-        for neighbor in graph.get(current_node, []):
+        # (Con una heurística vectorizada, h(n) de todos se calcula de una vez)
+        neighbors = [neighbor for neighbor in graph.get(current_node, [])
+                     if neighbor not in visited]
+        if batched:
+            batch_h = heuristics.get_many(neighbors)
+        for i, neighbor in enumerate(neighbors):
+            
+            # 9. Obtenemos la heurística del vecino
+            h_neighbor = (batch_h[i] if batched
+                          else heuristics.get(neighbor, float('inf')))
             
-            if neighbor not in visited:
-                # 9. Obtenemos la heurística del vecino
-                h_neighbor = heuristics.get(neighbor, float('inf'))
-                
-                # 10. Lo metemos a la cola de prioridad
-                heapq.heappush(priority_queue, (h_neighbor, neighbor))
-                
-                # Guardamos el camino
-                # (Nota: si ya tenía un padre, esto lo puede sobrescribir)
-                path_from[neighbor] = current_node
-                print(f"    -> Encolando vecino: '{neighbor}' (Heurística: {h_neighbor})")
-                
-    print(f"No se pudo encontrar un camino de '{start_node}' a '{goal_node}'.")
+            # 10. Lo metemos a la cola de prioridad
+            heapq.heappush(priority_queue, (h_neighbor, neighbor))
+            
+            # Guardamos el camino
+            # (Nota: si ya tenía un padre, esto lo puede sobrescribir)
+            path_from[neighbor] = current_node
+            if trace is not None:
+                trace(ENQUEUE, neighbor, h_neighbor)
+            
+    return None
 
 # --- Grafo de ejemplo ---
 #       A
@@ -107,4 +136,34 @@ heuristic_values = {
 }
 
 # --- Ejecutamos el algoritmo ---
-greedy_best_first_search(graph_example, 'A', 'G', heuristic_values)
\ No newline at end of file
+# (PrintSink imprime cada evento con su h(n); sin 'trace' no se imprime nada)
+print("Iniciando Búsqueda Voraz desde 'A' para encontrar 'G'")
+path = greedy_best_first_search(graph_example, 'A', 'G', heuristic_values, trace=PrintSink())
+print(f"  Camino encontrado: {' -> '.join(path)}")
+
+# --- Espacio de estados enorme: 15-puzzle con un filtro de Bloom ---
+# (El filtro ocupa unos pocos bits por estado; a cambio, con probabilidad
+#  ~1% puede creer que un estado nuevo ya fue explorado. Solo se comprime
+#  el conjunto de explorados: path_from y la cola siguen guardando cada
+#  estado descubierto, así que el pico total de la búsqueda baja menos)
+print("\n--- PRUEBA CON BloomVisited (15-puzzle) ---")
+puzzle = SlidingPuzzle(4)
+start_state = puzzle.scrambled(100, seed=1)
+for name, make_visited in [('set de Python', set),
+                           ('BloomVisited (1%)',
+                            lambda: BloomVisited(10000, false_positive_rate=0.01))]:
+    def search():
+        visited = make_visited()
+        return visited, greedy_best_first_search(puzzle, start_state, puzzle.goal,
+                                                 puzzle.heuristics, visited=visited)
+    (visited, path), peak = search_peak_bytes(search)
+    print(f"  {name:<18} {len(path) - 1} movimientos, {len(visited)} explorados, "
+          f"conjunto={visited_memory_bytes(visited)} bytes, pico total={peak} bytes")
+
+# --- Heurística como función, con caché ---
+# (Voraz mete a la cola el mismo estado por varios caminos; con la caché
+#  la distancia de Manhattan de cada estado se calcula una sola vez)
+print("\n--- PRUEBA CON HeuristicCache (15-puzzle) ---")
+cache = HeuristicCache(puzzle.manhattan)
+path = greedy_best_first_search(puzzle, start_state, puzzle.goal, cache)
+print(f"  {len(path) - 1} movimientos  {cache}")
@@ -1,91 +1,906 @@
+import collections
 import heapq
+import itertools
+import os
+import sys
+import tempfile
+import time
 
-def a_star_search(graph, start_node, goal_node, heuristics):
+import numpy as np
+
+# Añadimos la carpeta 'Enfoque_01_Busqueda_en_grafos' al path para usar el paquete 'grafos'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from grafos import (ENQUEUE, GOAL, PRUNE, VISIT, BinaryTraceSink, BucketQueue, CountSink,
+                    GrafoCSR, HeuristicCache, IndexedDaryHeap, Landmarks, LazyHeapQueue,
+                    NodeArena, PrintSink, SlidingPuzzle, TranspositionTable, as_heuristic,
+                    grid_graph, neighbor_cost_edges, read_binary_trace, scale_free_graph)
+
+def a_star_search(graph, start_node, goal_node, heuristics, priority_queue=None, trace=None,
+                  arena=None, tie_breaking='small_g', weight=1):
     """
     Implementa la Búsqueda A* (A-Star).
 
     Args:
         graph (dict): El grafo con costos. 
                       Formato: {'A': [('B', cost), ('C', cost)], ...}
+                      También acepta un GrafoCSR o un GrafoImplicito.
         start_node (str): El nodo de inicio.
         goal_node (str): El nodo objetivo.
-        heuristics (dict): Un diccionario con el valor heurístico (h(n))
-                           para cada nodo.
+        heuristics (dict | callable): Un diccionario con el valor heurístico (h(n))
+                           para cada nodo (con un GrafoImplicito: graph.heuristics),
+                           una función h(nodo) o una HeuristicCache (por ejemplo
+                           vectorizada, que evalúa todos los vecinos de una vez).
+        priority_queue (optional): LazyHeapQueue() (por defecto), IndexedDaryHeap()
+                          o BucketQueue() (costos y heurística enteros).
+        trace (optional): Sink de eventos (PrintSink, CountSink, ...). El valor
+                          de cada evento es f(n). Con None no se imprime nada.
+        arena (NodeArena, optional): Almacén de nodos (vacío). Si se pasa, al
+                          final contiene todos los nodos descubiertos. Por
+                          defecto NodeArena.for_graph(graph) (densa con un GrafoCSR).
+        tie_breaking (str): Qué nodo sale primero entre los de igual f(n):
+                          'small_g' (el de menor g, como siempre) o 'large_g'
+                          (el de mayor g, es decir, el más cercano al objetivo
+                          según h; en rejillas expande muchos menos nodos).
+        weight (float): A* ponderado: f(n) = g(n) + weight * h(n). Con
+                          weight > 1 se expanden menos nodos y el costo del
+                          camino es a lo más weight veces el óptimo.
+
+    Returns:
+        (path, cost): el camino encontrado y su costo, o (None, inf) si no hay camino.
     """
+    if weight < 1:
+        raise ValueError("weight debe ser >= 1")
+    if tie_breaking not in ('small_g', 'large_g'):
+        raise ValueError(f"Desempate desconocido: '{tie_breaking}' (usa 'small_g' o 'large_g')")
     
-    # 1. Cola de prioridad. Guardará tuplas de (f(n), g(n), nodo)
-    #    f(n) = g(n) + h(n). Lo ponemos primero para que heapq ordene por él.
-    priority_queue = []
+    # 1. Cola de prioridad. La prioridad de cada nodo es la tupla (f(n), g(n))
+    #    f(n) = g(n) + h(n). Lo ponemos primero para que la cola ordene por él.
+    #    Para preferir el MAYOR g entre iguales f, la tupla es (f(n), h(n), g(n)):
+    #    con f fijo, menor h es lo mismo que mayor g (y h >= 0 sirve también
+    #    para las sub-cubetas de la BucketQueue).
+    if priority_queue is None:
+        priority_queue = LazyHeapQueue()
+    large_g = tie_breaking == 'large_g'
+
+    # (Una función h(n) se envuelve en una caché, así se calcula una vez por nodo)
+    heuristics = as_heuristic(heuristics)
+    batched = isinstance(heuristics, HeuristicCache) and heuristics.vectorized
     
     # 2. Inicializamos g(n) y h(n) para el nodo inicial
     g_start = 0
     h_start = heuristics.get(start_node, 0)
-    f_start = g_start + h_start
-    
-    heapq.heappush(priority_queue, (f_start, g_start, start_node))
+    f_start = g_start + weight * h_start
+    if f_start == float('inf'):
+        return None, float('inf')  # h = inf: el objetivo es inalcanzable
     
-    # 3. Diccionario para guardar el costo g(n) MÁS BAJO encontrado 
-    #    hasta ahora para llegar a cada nodo. (¡Igual que en UCS!)
-    g_costs = {start_node: 0}
-    
-    # 4. Diccionario para reconstruir el camino
-    path_from = {start_node: None}
-    
-    print(f"Iniciando Búsqueda A* desde '{start_node}' para encontrar '{goal_node}'")
+    # 3. La arena de nodos guarda, para cada nodo descubierto, el costo g(n)
+    #    MÁS BAJO encontrado hasta ahora (¡Igual que en UCS!), su padre
+    #    para reconstruir el camino y su h(n), que así se calcula una sola vez.
+    #    En la cola van los índices de la arena, no los nodos.
+    if arena is None:
+        arena = NodeArena.for_graph(graph)
+    start_index = arena.add(start_node, g=g_start, h=h_start)
+    priority_queue.add(start_index, (f_start, h_start, g_start) if large_g else (f_start, g_start))
 
-    while priority_queue:
+    while not priority_queue.is_empty():
         
-        # 5. ¡LA CLAVE DE A*!
+        # 4. ¡LA CLAVE DE A*!
         # Sacamos el nodo con el MENOR f(n) = g(n) + h(n)
-        current_f, current_g, current_node = heapq.heappop(priority_queue)
+        priority, current_index = priority_queue.remove()
+        current_f, current_g = priority[0], priority[-1]
+        current_node = arena.states[current_index]
         
-        print(f"\n  Visitando nodo: '{current_node}' "
-              f"(f={current_f:.2f}, g={current_g:.2f}, h={current_f-current_g:.2f})")
+        if trace is not None:
+            trace(VISIT, current_node, current_f)
 
-        # 6. Optimización: Si encontramos un camino MÁS CORTO a este nodo
+        # 5. Optimización: Si encontramos un camino MÁS CORTO a este nodo
         #    antes, ignoramos esta versión "más larga".
-        if current_g > g_costs.get(current_node, float('inf')):
+        if current_g > arena.g[current_index]:
+            if trace is not None:
+                trace(PRUNE, current_node, current_f)
             continue
 
-        # 7. ¡OBJETIVO ENCONTRADO!
+        # 6. ¡OBJETIVO ENCONTRADO!
         if current_node == goal_node:
-            print(f"¡Objetivo '{goal_node}' alcanzado con costo total {current_g}!")
-            
-            path = []
-            node = goal_node
-            while node is not None:
-                path.append(node)
-                node = path_from[node]
-            path.reverse()
-            print(f"  Camino encontrado: {' -> '.join(path)}")
-            return
+            if trace is not None:
+                trace(GOAL, current_node, current_g)
+            return arena.path(current_index), current_g
+
+        # 7. Exploramos los vecinos
+        # (Sea dict, GrafoCSR o GrafoImplicito, en formato (vecino, costo))
+        edges = neighbor_cost_edges(graph, current_node)
 
-        # 8. Exploramos los vecinos
-        for neighbor, edge_cost in graph.get(current_node, []):
+        # (Con una heurística vectorizada, h(n) de todos los vecinos nuevos
+        #  se calcula en una sola llamada)
+        if batched:
+            new_neighbors = [neighbor for neighbor, _ in edges
+                             if arena.index_of(neighbor) is None]
+            batch_h = dict(zip(new_neighbors, heuristics.get_many(new_neighbors)))
+        for neighbor, edge_cost in edges:
             
-            # 9. Calculamos el nuevo g(n) para este vecino
+            # 8. Calculamos el nuevo g(n) para este vecino
             new_g = current_g + edge_cost
             
-            # 10. ¡Igual que en UCS! Si es un camino MÁS BARATO al vecino...
-            if new_g < g_costs.get(neighbor, float('inf')):
+            # 9. ¡Igual que en UCS! Si es un camino MÁS BARATO al vecino...
+            neighbor_index = arena.index_of(neighbor)
+            if neighbor_index is None or new_g < arena.g[neighbor_index]:
                 
-                # ...actualizamos su g(n)
-                g_costs[neighbor] = new_g
-                
-                # ...calculamos su h(n)
-                h_neighbor = heuristics.get(neighbor, 0)
+                # ...actualizamos su g(n) y guardamos el camino
+                # (su h(n) solo se calcula la primera vez que lo vemos)
+                if neighbor_index is None:
+                    h_neighbor = (batch_h[neighbor] if batched
+                                  else heuristics.get(neighbor, 0))
+                    neighbor_index = arena.add(neighbor, current_index, new_g, h_neighbor)
+                else:
+                    arena.update(neighbor_index, current_index, new_g)
                 
                 # ...calculamos su f(n)
-                f_neighbor = new_g + h_neighbor
-                
-                # ...guardamos el camino
-                path_from[neighbor] = current_node
+                h_neighbor = arena.h[neighbor_index]
+                f_neighbor = new_g + weight * h_neighbor
+                if f_neighbor == float('inf'):
+                    continue  # h = inf: desde aquí no se llega al objetivo
                 
                 # ...y lo metemos a la cola de prioridad
-                heapq.heappush(priority_queue, (f_neighbor, new_g, neighbor))
-                print(f"    -> Encolando vecino: '{neighbor}' (f={f_neighbor:.2f})")
+                # (o bajamos su prioridad si ya estaba, con decrease-key)
+                priority_queue.add(neighbor_index, (f_neighbor, h_neighbor, new_g) if large_g
+                                   else (f_neighbor, new_g))
+                if trace is not None:
+                    trace(ENQUEUE, neighbor, f_neighbor)
                 
-    print(f"No se pudo encontrar un camino de '{start_node}' a '{goal_node}'.")
+    return None, float('inf')
+
+# --- A* con memoria acotada: IDA* y SMA* ---
+#
+# A* guarda un nodo en la arena (y en la cola) por cada estado generado, y en
+# espacios grandes se queda sin memoria antes de llegar. Las dos variantes
+# siguientes tienen la MISMA firma que a_star_search y devuelven lo mismo,
+# pero limitan la memoria a cambio de volver a expandir estados.
+#
+# Sin NINGÚN control de duplicados, las dos recorrerían todos los caminos
+# simples del grafo (exponencial, y sin fin práctico si el objetivo es
+# inalcanzable). Por eso cada una recuerda, en una tabla de tamaño FIJO,
+# el mejor g con que llegó a cada estado y poda las copias que no lo
+# mejoran. Si la tabla se llena solo se pierde poda, nunca la solución.
+
+class MemoryBoundedStats:
+    """
+    Cuánto trabajo extra pagan IDA* y SMA* por ahorrar memoria.
+
+    Atributos:
+        expansions: nodos expandidos en total (contando repeticiones).
+        reexpansions: expansiones repetidas. En IDA*, todas las de las
+                      iteraciones anteriores a la última; en SMA*, las de
+                      nodos que regeneran hijos que antes se olvidaron.
+        iterations: umbrales de f probados (IDA*).
+        peak_nodes: máximo de nodos en memoria a la vez.
+        dropped: hojas olvidadas por falta de memoria (SMA*).
+        duplicates: copias de un estado podadas por la tabla de g.
+    """
+
+    def __init__(self):
+        self.expansions = 0
+        self.reexpansions = 0
+        self.iterations = 0
+        self.peak_nodes = 0
+        self.dropped = 0
+        self.duplicates = 0
+
+    def __repr__(self):
+        return (f"MemoryBoundedStats(expansiones={self.expansions}, "
+                f"reexpansiones={self.reexpansions}, iteraciones={self.iterations}, "
+                f"nodos_max={self.peak_nodes}, olvidados={self.dropped}, "
+                f"duplicados={self.duplicates})")
+
+
+def ida_star_search(graph, start_node, goal_node, heuristics, trace=None, stats=None,
+                    table=None):
+    """
+    Implementa IDA* (A* con Profundización Iterativa).
+
+    Es una búsqueda en profundidad que poda los nodos con f(n) = g(n) + h(n)
+    mayor que un umbral. Si no encuentra el objetivo, repite con el umbral
+    igual al menor f que se pasó. Solo guarda el camino actual: memoria
+    lineal en la profundidad de la solución. Con h admisible el camino es
+    óptimo, igual que en A*.
+
+    Además usa una tabla de transposición (como dls_with_table): al terminar
+    un nodo anota con qué g se recorrió. Una copia de n con un g mayor ya no
+    se expande (en ninguna iteración: hay un camino más barato a n), y
+    tampoco una con el mismo g en la misma iteración (ya se recorrió).
+
+    Args:
+        graph, start_node, goal_node, heuristics: Igual que en a_star_search.
+        trace (optional): Sink de eventos (el valor es f(n)). PRUNE marca los
+                          nodos que superan el umbral o que poda la tabla.
+        stats (MemoryBoundedStats, optional): Si se pasa, se llena con las estadísticas.
+        table (TranspositionTable, optional): Tabla a usar. Por defecto
+                          TranspositionTable() (2^16 casillas).
+
+    Returns:
+        (path, cost): el camino encontrado y su costo, o (None, inf) si no hay camino.
+    """
+    if stats is None:
+        stats = MemoryBoundedStats()
+    if table is None:
+        table = TranspositionTable()
+    # (La "profundidad" que guarda la tabla es la tupla (-g, iteración): la
+    #  entrada poda si su g es menor, o igual y de esta misma iteración)
+    heuristics = as_heuristic(heuristics)
+
+    # 1. El primer umbral es h(inicio)
+    threshold = heuristics.get(start_node, 0)
+    previous_expansions = 0
+    while threshold < float('inf'):
+        stats.iterations += 1
+        stats.reexpansions += previous_expansions
+        expansions_before = stats.expansions
+        next_threshold = float('inf')
+
+        # 2. Profundidad con una pila de iteradores (sin recursión): 'path' es
+        #    el camino actual y 'costs' el g(n) de cada nodo del camino
+        if trace is not None:
+            trace(VISIT, start_node, threshold)
+        if start_node == goal_node:
+            if trace is not None:
+                trace(GOAL, start_node, 0)
+            return [start_node], 0
+        path, costs, on_path = [start_node], [0], {start_node}
+        stack = [iter(neighbor_cost_edges(graph, start_node))]
+        stats.expansions += 1
+
+        while stack:
+            stats.peak_nodes = max(stats.peak_nodes, len(path))
+            edge = next(stack[-1], None)
+            if edge is None:
+                # Ya se probaron todos los vecinos: retrocedemos y anotamos
+                # que desde aquí, con este presupuesto, no hay objetivo
+                stack.pop()
+                table.store_failure(path[-1], (-costs.pop(), stats.iterations))
+                on_path.discard(path.pop())
+                continue
+            neighbor, edge_cost = edge
+            if neighbor in on_path:
+                continue  # Evitamos ciclos en el camino actual
+
+            # 3. Si ya se recorrió una copia con un g menor (o igual en esta
+            #    iteración), la podamos: nunca está en un camino óptimo
+            g = costs[-1] + edge_cost
+            f = g + heuristics.get(neighbor, 0)
+            if table.is_known_failure(neighbor, (-g, stats.iterations)):
+                stats.duplicates += 1
+                if trace is not None:
+                    trace(PRUNE, neighbor, f)
+                continue
+
+            # 4. Si f(n) pasa el umbral, lo podamos y recordamos el menor f
+            if f > threshold:
+                if f < next_threshold:
+                    next_threshold = f
+                if trace is not None:
+                    trace(PRUNE, neighbor, f)
+                continue
+
+            if trace is not None:
+                trace(VISIT, neighbor, f)
+            path.append(neighbor)
+            if neighbor == goal_node:
+                if trace is not None:
+                    trace(GOAL, neighbor, g)
+                return path, g
+
+            # 5. Expandimos el vecino
+            costs.append(g)
+            on_path.add(neighbor)
+            stack.append(iter(neighbor_cost_edges(graph, neighbor)))
+            stats.expansions += 1
+
+        # 6. Nuevo umbral: el menor f que superó el anterior
+        previous_expansions = stats.expansions - expansions_before
+        threshold = next_threshold
+
+    return None, float('inf')
+
+
+class _BestGTable:
+    """
+    Mejor g conocido de cada estado y el padre con que se llegó, en un número
+    fijo de casillas (hash(estado) % capacity; el último que llega se queda).
+
+    Una copia está dominada si su g es mayor, o igual pero desde otro padre.
+    Con el MISMO padre es la copia guardada que SMA* regenera, y no se poda.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.states = [None] * capacity
+        self.costs = [0] * capacity
+        self.parents = [None] * capacity
+
+    def is_dominated(self, state, parent, g):
+        slot = hash(state) % self.capacity
+        if self.states[slot] is None or self.states[slot] != state:
+            return False
+        stored = self.costs[slot]
+        return stored < g or (stored == g and self.parents[slot] != parent)
+
+    def store(self, state, parent, g):
+        slot = hash(state) % self.capacity
+        if self.states[slot] is not None and self.states[slot] == state and self.costs[slot] <= g:
+            return
+        self.states[slot] = state
+        self.costs[slot] = g
+        self.parents[slot] = parent
+
+
+class _SMANode:
+    """Nodo del árbol de SMA*. 'forgotten' guarda el f de los hijos olvidados."""
+
+    __slots__ = ('state', 'parent', 'g', 'own_f', 'f', 'depth', 'children', 'forgotten',
+                 'expanded', 'version', 'in_open')
+
+    def __init__(self, state, parent, g, f):
+        self.state = state
+        self.parent = parent
+        self.g = g
+        self.own_f = f         # Su propio f (sin respaldar)
+        self.f = f             # f respaldado
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.children = {}     # {estado: _SMANode} de los hijos en memoria
+        self.forgotten = {}    # {estado: f} de los hijos olvidados
+        self.expanded = False
+        self.version = 0       # Invalida las entradas viejas de los heaps
+        self.in_open = False
+
+    def on_path(self, state):
+        node = self
+        while node is not None:
+            if node.state == state:
+                return True
+            node = node.parent
+        return False
+
+    def path(self):
+        path, node = [], self
+        while node is not None:
+            path.append(node.state)
+            node = node.parent
+        path.reverse()
+        return path
+
+
+def sma_star_search(graph, start_node, goal_node, heuristics, max_nodes=10000, trace=None,
+                    stats=None, table_size=1 << 16):
+    """
+    Implementa SMA* (A* Simplificado con Memoria Acotada).
+
+    Funciona como A* hasta tener 'max_nodes' nodos en memoria. Entonces
+    olvida la hoja PEOR (mayor f; entre iguales, la menos profunda) y su padre
+    recuerda el f del hijo olvidado, para regenerarlo solo si vuelve a ser lo
+    más prometedor. Cada padre lleva el f "respaldado": el menor f de sus
+    hijos (en memoria u olvidados).
+
+    Un hijo cuyo estado ya se generó con un g menor (o igual, desde otro
+    padre) no se genera: lo cubre la otra copia. Así, si el objetivo es
+    inalcanzable, todo termina en callejones sin salida y se devuelve
+    (None, inf) sin recorrer todos los caminos simples.
+
+    Args:
+        graph, start_node, goal_node, heuristics: Igual que en a_star_search.
+        max_nodes (int): Máximo de nodos en memoria (>= 2). Si la solución
+                         más corta tiene más pasos que esto, no se encuentra.
+        trace (optional): Sink de eventos (el valor es f(n)). PRUNE marca las
+                          hojas olvidadas.
+        stats (MemoryBoundedStats, optional): Si se pasa, se llena con las estadísticas.
+        table_size (int): Casillas de la tabla de mejores g (memoria fija,
+                          aparte de los max_nodes nodos).
+
+    Returns:
+        (path, cost): el camino encontrado y su costo, o (None, inf) si no hay camino.
+    """
+    if max_nodes < 2:
+        raise ValueError("SMA* necesita max_nodes >= 2")
+    if stats is None:
+        stats = MemoryBoundedStats()
+    heuristics = as_heuristic(heuristics)
+    infinity = float('inf')
+    best_g = _BestGTable(table_size)
+
+    # 1. Dos heaps sobre los nodos "abiertos": el mejor (menor f, más profundo)
+    #    para expandir y el peor (mayor f, menos profundo) para olvidar (solo
+    #    las hojas, que son las únicas que se pueden olvidar).
+    #    Las entradas viejas se reconocen por la versión del nodo.
+    best_heap, worst_heap = [], []
+    counter = itertools.count()
+
+    def push(node, key):
+        node.version += 1
+        node.in_open = True
+        tie = next(counter)
+        heapq.heappush(best_heap, (key, -node.depth, tie, node.version, node))
+        if not node.children:
+            heapq.heappush(worst_heap, (-key, node.depth, tie, node.version, node))
+
+    def pop_valid(heap):
+        while heap:
+            entry = heapq.heappop(heap)
+            node = entry[-1]
+            if node.in_open and entry[-2] == node.version:
+                node.in_open = False
+                node.version += 1
+                return node
+        return None
+
+    def backup(node):
+        # El f respaldado sube por los ancestros mientras cambie
+        while node is not None:
+            values = [child.f for child in node.children.values()]
+            values.extend(node.forgotten.values())
+            if not values:
+                return
+            new_f = min(values)
+            if new_f == node.f:
+                return
+            node.f = new_f
+            if node.in_open:
+                push(node, min(node.forgotten.values(), default=node.f))
+            node = node.parent
+
+    def drop_worst(protected):
+        # Olvidamos la peor hoja (sin hijos en memoria); nunca la raíz
+        skipped = []
+        dropped = None
+        while True:
+            node = pop_valid(worst_heap)
+            if node is None:
+                break
+            if node is protected or node.parent is None or node.children:
+                skipped.append(node)
+                continue
+            dropped = node
+            break
+        for node in skipped:
+            push(node, min(node.forgotten.values()) if node.forgotten else node.f)
+        if dropped is None:
+            return False
+        parent = dropped.parent
+        del parent.children[dropped.state]
+        parent.forgotten[dropped.state] = dropped.f
+        stats.dropped += 1
+        if trace is not None:
+            trace(PRUNE, dropped.state, dropped.f)
+        # El padre vuelve a abrirse para poder regenerar al olvidado
+        push(parent, min(parent.forgotten.values()))
+        return True
+
+    root = _SMANode(start_node, None, 0, heuristics.get(start_node, 0))
+    best_g.store(start_node, None, 0)
+    push(root, root.f)
+    in_memory = 1
+
+    while True:
+        # 2. El nodo más prometedor
+        node = pop_valid(best_heap)
+        if node is None or node.f == infinity:
+            return None, infinity
+        if trace is not None:
+            trace(VISIT, node.state, node.f)
+
+        # 3. ¡OBJETIVO! (como en A*, al sacarlo)
+        if node.state == goal_node:
+            if trace is not None:
+                trace(GOAL, node.state, node.g)
+            return node.path(), node.g
+
+        # 4. Generamos sus hijos: todos la primera vez, o solo los olvidados
+        if node.expanded:
+            stats.reexpansions += 1
+            wanted = node.forgotten
+        else:
+            wanted = None
+        node.expanded = True
+        stats.expansions += 1
+        generated = {}
+        for neighbor, edge_cost in neighbor_cost_edges(graph, node.state):
+            if neighbor in node.children or (wanted is not None and neighbor not in wanted):
+                continue
+            g = node.g + edge_cost
+            if neighbor in generated and generated[neighbor].g <= g:
+                continue  # Arista repetida más cara
+            if node.on_path(neighbor):
+                continue  # Evitamos ciclos en el camino
+            if best_g.is_dominated(neighbor, node.state, g):
+                stats.duplicates += 1
+                continue  # Otra copia llega igual o más barato
+            # (f nunca baja respecto del padre: "pathmax")
+            f = max(node.own_f, g + heuristics.get(neighbor, 0))
+            if neighbor in node.forgotten:
+                f = max(f, node.forgotten[neighbor])
+            # Si ya no cabe un paso más en memoria, por aquí no hay solución
+            if neighbor != goal_node and node.depth + 2 >= max_nodes:
+                f = infinity
+            generated[neighbor] = _SMANode(neighbor, node, g, f)
+        for child in generated.values():
+            best_g.store(child.state, node.state, child.g)
+        node.forgotten = {}
+
+        # 5. Hacemos lugar olvidando las peores hojas (nunca a 'node')
+        new_children = sorted(generated.values(), key=lambda child: child.f)
+        while in_memory + len(new_children) > max_nodes and drop_worst(node):
+            in_memory -= 1
+        if in_memory + len(new_children) > max_nodes:
+            # No hay más que olvidar: guardamos solo los mejores hijos
+            keep = max(0, max_nodes - in_memory)
+            for child in new_children[keep:]:
+                node.forgotten[child.state] = min(child.f, node.forgotten.get(child.state, infinity))
+            new_children = new_children[:keep]
+
+        for child in new_children:
+            node.children[child.state] = child
+            push(child, child.f)
+            if trace is not None:
+                trace(ENQUEUE, child.state, child.f)
+        in_memory += len(new_children)
+        stats.peak_nodes = max(stats.peak_nodes, in_memory)
+
+        # 6. Si quedaron hijos olvidados, 'node' sigue abierto para regenerarlos.
+        #    Y el f respaldado sube por los ancestros.
+        if not node.children and not node.forgotten and node.parent is not None:
+            # Callejón sin salida: el padre lo recuerda con f infinito
+            parent = node.parent
+            del parent.children[node.state]
+            parent.forgotten[node.state] = infinity
+            in_memory -= 1
+            push(parent, min(parent.forgotten.values()))
+            backup(parent)
+            continue
+        if node.forgotten:
+            push(node, min(node.forgotten.values()))
+        backup(node)
+
+# --- ARA*: A* "anytime" (Anytime Repairing A*) ---
+#
+# Con un A* ponderado (weight = ε > 1) se encuentra rápido un camino de costo
+# a lo más ε veces el óptimo. ARA* empieza con un ε grande y lo va bajando;
+# en cada ronda NO empieza de cero: reusa los g(n) ya calculados, la cola
+# (OPEN) y los nodos "inconsistentes" (INCONS: los que mejoraron después de
+# ser expandidos en la ronda). Así cada camino mejor cuesta poco trabajo extra.
+
+class AnytimeStats:
+    """
+    Estadísticas de ARA*.
+
+    Atributos:
+        solutions: lista de (segundos, costo, ε) de cada solución publicada.
+        expansions: nodos expandidos en total (todas las rondas).
+        rounds: rondas (valores de ε) que se completaron.
+    """
+
+    def __init__(self):
+        self.solutions = []
+        self.expansions = 0
+        self.rounds = 0
+
+    def __repr__(self):
+        steps = ', '.join(f"{cost} (ε≤{epsilon:.2f}, {seconds * 1000:.1f}ms)"
+                          for seconds, cost, epsilon in self.solutions)
+        return (f"AnytimeStats(rondas={self.rounds}, expansiones={self.expansions}, "
+                f"soluciones=[{steps}])")
+
+
+def ara_star_search(graph, start_node, goal_node, heuristics, initial_weight=3.0,
+                    weight_step=0.5, deadline=None, trace=None, stats=None, on_solution=None):
+    """
+    Implementa ARA* (A* Reparador Anytime).
+
+    Args:
+        graph, start_node, goal_node, heuristics: Igual que en a_star_search.
+        initial_weight (float): ε de la primera ronda (>= 1).
+        weight_step (float): Cuánto baja ε en cada ronda (hasta llegar a 1).
+        deadline (float, optional): Segundos disponibles. La primera ronda
+                          siempre termina (para tener algún camino); después,
+                          al vencer el plazo se devuelve el mejor camino que
+                          se tenga.
+        trace (optional): Sink de eventos (el valor es la prioridad g + ε·h).
+        stats (AnytimeStats, optional): Si se pasa, se llena con las estadísticas.
+        on_solution (callable, optional): on_solution(path, cost, ε) se llama
+                          con cada camino mejor, apenas se encuentra.
+
+    Returns:
+        (path, cost): el mejor camino encontrado y su costo, o (None, inf).
+        Si ε llegó a 1 sin vencer el plazo, el camino es óptimo.
+    """
+    if initial_weight < 1 or weight_step <= 0:
+        raise ValueError("initial_weight debe ser >= 1 y weight_step > 0")
+    if stats is None:
+        stats = AnytimeStats()
+    heuristics = as_heuristic(heuristics)
+    clock = time.perf_counter
+    started = clock()
+    out_of_time = (lambda: False) if deadline is None else (lambda: clock() - started > deadline)
+    infinity = float('inf')
+
+    # 1. La arena guarda g(n), h(n) y el padre de cada nodo, entre TODAS las rondas
+    arena = NodeArena.for_graph(graph)
+    start_index = arena.add(start_node, h=heuristics.get(start_node, 0))
+    goal_index = None
+    epsilon = initial_weight
+
+    def key(index):
+        return arena.g[index] + epsilon * arena.h[index]
+
+    open_queue = LazyHeapQueue()
+    open_set = {start_index}
+    open_queue.add(start_index, (key(start_index), 0))
+    closed = set()
+    incons = set()
+
+    def improve_path(first_round):
+        """Expande mientras algún nodo de OPEN prometa mejorar al objetivo."""
+        while not open_queue.is_empty():
+            if not first_round and out_of_time():
+                return False
+            (current_key, current_g), current_index = open_queue.remove()
+            if current_index not in open_set or current_g != arena.g[current_index]:
+                continue  # Entrada vieja
+            # El objetivo ya no puede mejorar con lo que queda en OPEN
+            if goal_index is not None and key(goal_index) <= current_key:
+                open_queue.add(current_index, (current_key, current_g))
+                return True
+
+            open_set.discard(current_index)
+            closed.add(current_index)
+            stats.expansions += 1
+            current_node = arena.states[current_index]
+            if trace is not None:
+                trace(VISIT, current_node, current_key)
+
+            for neighbor, edge_cost in neighbor_cost_edges(graph, current_node):
+                new_g = current_g + edge_cost
+                neighbor_index = arena.index_of(neighbor)
+                if neighbor_index is None:
+                    neighbor_index = arena.add(neighbor, current_index, new_g,
+                                               heuristics.get(neighbor, 0))
+                    note_goal(neighbor, neighbor_index)
+                elif new_g < arena.g[neighbor_index]:
+                    arena.update(neighbor_index, current_index, new_g)
+                else:
+                    continue
+                # Mejoró: a OPEN si no se expandió en esta ronda; si no, a INCONS
+                if neighbor_index in closed:
+                    incons.add(neighbor_index)
+                else:
+                    open_set.add(neighbor_index)
+                    open_queue.add(neighbor_index, (key(neighbor_index), new_g))
+                    if trace is not None:
+                        trace(ENQUEUE, neighbor, key(neighbor_index))
+        return True
+
+    def note_goal(node, index):
+        nonlocal goal_index
+        if node == goal_node:
+            goal_index = index
+
+    def publish():
+        # Cota real de suboptimalidad: costo / (mejor f sin ponderar pendiente)
+        pending = open_set | incons
+        lower = min((arena.g[i] + arena.h[i] for i in pending), default=infinity)
+        cost = arena.g[goal_index]
+        bound = min(epsilon, cost / lower) if 0 < lower < infinity else 1.0
+        stats.solutions.append((clock() - started, cost, bound))
+        path = arena.path(goal_index)
+        if on_solution is not None:
+            on_solution(path, cost, bound)
+        if trace is not None:
+            trace(GOAL, goal_node, cost)
+        return bound
+
+    if start_node == goal_node:
+        goal_index = start_index
+
+    # 2. Primera ronda: A* ponderado con el ε inicial
+    improve_path(first_round=True)
+    if goal_index is None:
+        return None, infinity
+    stats.rounds += 1
+    bound = publish()
+
+    # 3. Bajamos ε y reparamos la búsqueda mientras haya tiempo
+    while bound > 1 and epsilon > 1 and not out_of_time():
+        epsilon = max(1.0, epsilon - weight_step)
+        # OPEN = OPEN ∪ INCONS, con las prioridades del nuevo ε; CLOSED se vacía
+        open_set |= incons
+        incons.clear()
+        closed.clear()
+        open_queue = LazyHeapQueue()
+        for index in open_set:
+            open_queue.add(index, (key(index), arena.g[index]))
+        previous_cost = arena.g[goal_index]
+        if not improve_path(first_round=False):
+            break
+        stats.rounds += 1
+        if arena.g[goal_index] < previous_cost or epsilon == 1:
+            bound = publish()
+
+    return arena.path(goal_index), arena.g[goal_index]
+
+
+# --- AO*: búsqueda en grafos Y-O ---
+#
+# En un grafo Y-O cada nodo es un PROBLEMA y cada opción es una manera de
+# descomponerlo:
+#   - Conector O: el nodo tiene varias opciones y basta con resolver UNA.
+#   - Conector Y: una opción con varios hijos; hay que resolverlos TODOS.
+# La solución ya no es un camino sino un "grafo solución" (un árbol Y-O).
+
+class AOStar:
+    """
+    Motor AO* que mantiene el grafo explícito y el mejor grafo solución parcial.
+
+    Args:
+        graph (dict): {nodo: [(hijos, costo), ...]}. Cada opción es una tupla
+                      con los hijos (uno = conector O simple, varios = Y) y el
+                      costo del conector.
+        heuristics (dict | callable, optional): h(n), estimación del costo de
+                      resolver n (por defecto 0).
+        terminals (set, optional): Problemas primitivos (resueltos, costo 0).
+                      Con None, todo nodo sin opciones es primitivo; si se
+                      pasa, un nodo sin opciones que no esté aquí NO tiene
+                      solución (costo infinito).
+        trace (optional): Sink de eventos. VISIT al expandir un nodo, ENQUEUE
+                      al generar uno nuevo y GOAL cuando se resuelve el inicio.
+
+    Los subproblemas compartidos (el grafo es un DAG) se guardan UNA sola vez:
+    un nodo que aparece bajo varios padres se expande y se revisa una vez y
+    todos los padres usan su costo. Después de cada expansión solo se revisan
+    los ANCESTROS del nodo expandido, y solo mientras su costo o su estado de
+    "resuelto" cambien. (Como en la formulación clásica, el grafo no debe
+    tener ciclos.)
+    """
+
+    def __init__(self, graph, heuristics=None, terminals=None, trace=None):
+        self.graph = graph
+        self.heuristics = as_heuristic(heuristics if heuristics is not None else {})
+        self.terminals = terminals
+        self.trace = trace
+        self.cost = {}       # {nodo: costo estimado actual}
+        self.best = {}       # {nodo: índice de la opción marcada (la más barata)}
+        self.parents = {}    # {nodo: set de padres en el grafo explícito}
+        self.expanded = set()
+        self.solved = set()
+        # Estadísticas
+        self.expansions = 0
+        self.revisions = 0
+
+    def add_node(self, node):
+        """Mete un nodo al grafo explícito (si ya estaba, no hace nada)."""
+        if node in self.cost:
+            return  # Subproblema compartido: se reutiliza
+        self.parents[node] = set()
+        if self.graph.get(node):
+            self.cost[node] = self.heuristics.get(node, 0)
+        else:
+            # Hoja: primitiva (resuelta) o sin solución
+            self.expanded.add(node)
+            if self.terminals is None or node in self.terminals:
+                self.cost[node] = 0
+                self.solved.add(node)
+            else:
+                self.cost[node] = float('inf')
+        if self.trace is not None:
+            self.trace(ENQUEUE, node, self.cost[node])
+
+    def unexpanded_tip(self, start_node):
+        """Un nodo sin expandir del mejor grafo solución parcial (siguiendo las marcas)."""
+        stack, seen = [start_node], {start_node}
+        while stack:
+            node = stack.pop()
+            if node in self.solved:
+                continue
+            if node not in self.expanded:
+                return node
+            children, _ = self.graph[node][self.best[node]]
+            for child in children:
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        return None
+
+    def expand(self, node):
+        """Genera los hijos de todas las opciones de 'node'."""
+        self.expanded.add(node)
+        self.expansions += 1
+        if self.trace is not None:
+            self.trace(VISIT, node, self.cost[node])
+        for children, _ in self.graph[node]:
+            for child in children:
+                self.add_node(child)
+                self.parents[child].add(node)
+
+    def revise(self, node):
+        """
+        Recalcula el costo de 'node' y de sus ancestros, hacia arriba, solo
+        mientras algo cambie (costo o resuelto). Devuelve cuántos se revisaron.
+        """
+        pending = collections.deque([node])
+        queued = {node}
+        revised = 0
+        while pending:
+            current = pending.popleft()
+            queued.discard(current)
+            revised += 1
+
+            # 1. La opción más barata: costo del conector + costos de los hijos
+            best_cost, best_option = float('inf'), None
+            for i, (children, edge_cost) in enumerate(self.graph[current]):
+                total = edge_cost + sum(self.cost[child] for child in children)
+                if total < best_cost:
+                    best_cost, best_option = total, i
+
+            # 2. Está resuelto si TODOS los hijos de su opción marcada lo están
+            is_solved = best_option is not None and all(
+                child in self.solved for child in self.graph[current][best_option][0])
+
+            changed = best_cost != self.cost[current] or is_solved != (current in self.solved)
+            self.cost[current] = best_cost
+            self.best[current] = best_option
+            if is_solved:
+                self.solved.add(current)
+            else:
+                self.solved.discard(current)
+
+            # 3. Si cambió, sus padres también pueden cambiar
+            if changed:
+                for parent in self.parents[current]:
+                    if parent not in queued:
+                        queued.add(parent)
+                        pending.append(parent)
+        self.revisions += revised
+        return revised
+
+    def solve(self, start_node):
+        """
+        Corre AO* desde 'start_node'.
+
+        Returns:
+            (solution, cost): solution = {nodo: hijos elegidos} para cada nodo
+            no primitivo del grafo solución, o (None, inf) si no hay solución.
+        """
+        self.add_node(start_node)
+        while start_node not in self.solved and self.cost[start_node] < float('inf'):
+            # 1. Elegimos un nodo sin expandir del mejor grafo solución parcial
+            node = self.unexpanded_tip(start_node)
+            # 2. Lo expandimos y 3. revisamos los costos de sus ancestros
+            self.expand(node)
+            self.revise(node)
+
+        if start_node not in self.solved:
+            return None, float('inf')
+        if self.trace is not None:
+            self.trace(GOAL, start_node, self.cost[start_node])
+        return self.solution(start_node), self.cost[start_node]
+
+    def solution(self, start_node):
+        """El grafo solución marcado: {nodo: hijos de la opción elegida}."""
+        solution, stack = {}, [start_node]
+        while stack:
+            node = stack.pop()
+            if node in solution or not self.graph.get(node):
+                continue
+            children, _ = self.graph[node][self.best[node]]
+            solution[node] = tuple(children)
+            stack.extend(children)
+        return solution
+
+
+def ao_star_search(graph, start_node, heuristics=None, terminals=None, trace=None):
+    """
+    Implementa la Búsqueda AO* en un grafo Y-O (ver AOStar).
+
+    Returns:
+        (solution, cost): el grafo solución {nodo: hijos elegidos} y su
+        costo, o (None, inf) si el problema no tiene solución.
+    """
+    return AOStar(graph, heuristics, terminals, trace).solve(start_node)
 
 # --- Grafo de ejemplo con COSTOS y HEURÍSTICAS ---
 #
@@ -134,7 +949,10 @@ graph_costs = {
 heuristic_values = { 'A': 3, 'B': 2, 'D': 8, 'C': 0 }
 
 # --- Ejecutamos el algoritmo ---
-a_star_search(graph_costs, 'A', 'C', heuristic_values)
+# (PrintSink imprime cada evento con su f(n); sin 'trace' no se imprime nada)
+print("Iniciando Búsqueda A* desde 'A' para encontrar 'C'")
+path, total_cost = a_star_search(graph_costs, 'A', 'C', heuristic_values, trace=PrintSink())
+print(f"  Camino encontrado: {' -> '.join(path)} (costo total: {total_cost})")
 
 # --- ¿Qué pasaría si la heurística fuera MALA? ---
 # h(A) = 3
@@ -150,4 +968,199 @@ graph_costs_2 = {
     'C': []
 }
 # A* ahora debe encontrar A->B->C
-a_star_search(graph_costs_2, 'A', 'C', heuristic_values)
\ No newline at end of file
+path, total_cost = a_star_search(graph_costs_2, 'A', 'C', heuristic_values, trace=PrintSink())
+print(f"  Camino encontrado: {' -> '.join(path)} (costo total: {total_cost})")
+
+# --- El mismo grafo en formato CSR (compacto) ---
+print("\n--- PRUEBA 3: GrafoCSR ---")
+graph_csr = GrafoCSR.from_dict(graph_costs_2, formato='vecino_costo')
+counter = CountSink()
+path, total_cost = a_star_search(graph_csr, 'A', 'C', heuristic_values, trace=counter)
+print(f"  Camino encontrado: {' -> '.join(path)} (costo total: {total_cost})  {counter}")
+
+# --- Con un heap d-ario indexado (decrease-key, sin duplicados) ---
+# (La traza se guarda en binario compacto y se lee después)
+print("\n--- PRUEBA 4: IndexedDaryHeap + traza binaria ---")
+with tempfile.TemporaryDirectory() as temp_dir:
+    trace_path = os.path.join(temp_dir, 'traza_a_estrella.bin')
+    with BinaryTraceSink(trace_path) as sink:
+        path, total_cost = a_star_search(graph_costs_2, 'A', 'C', heuristic_values,
+                                         priority_queue=IndexedDaryHeap(), trace=sink)
+    print(f"  Camino encontrado: {' -> '.join(path)} (costo total: {total_cost})")
+    print(f"  Traza ({os.path.getsize(trace_path)} bytes): {read_binary_trace(trace_path)}")
+
+# --- Grafo implícito: 8-puzzle con la distancia de Manhattan ---
+print("\n--- PRUEBA 5: GrafoImplicito (8-puzzle) ---")
+puzzle = SlidingPuzzle(3)
+start_state = puzzle.scrambled(40, seed=7)
+path, total_cost = a_star_search(puzzle, start_state, puzzle.goal, puzzle.heuristics)
+print(f"  Inicio: {puzzle.decode(start_state)}")
+print(f"  Resuelto en {total_cost} movimientos, {puzzle.expansions} estados expandidos")
+
+# --- Heurística como FUNCIÓN (con caché) y vectorizada con numpy ---
+# (En una rejilla de 150x150 no escribimos un diccionario con h(n): la
+#  distancia de Manhattan se calcula a pedido. La versión vectorizada recibe
+#  todos los vecinos nuevos de un nodo y los evalúa en una sola llamada.
+#  Como cada paso cuesta al menos 1, Manhattan es admisible.)
+print("\n--- PRUEBA 6: heurística calculada a pedido (rejilla 150x150) ---")
+grid = grid_graph(150 * 150, seed=3)
+side = 150
+grid_goal = side * side - 1
+goal_row, goal_col = divmod(grid_goal, side)
+
+def manhattan_to_goal(node):
+    row, col = divmod(node, side)
+    return abs(row - goal_row) + abs(col - goal_col)
+
+def manhattan_to_goal_batch(nodes):
+    rows, cols = np.divmod(np.asarray(nodes, dtype=np.int64), side)
+    return np.abs(rows - goal_row) + np.abs(cols - goal_col)
+
+for name, heuristic in [('función', HeuristicCache(manhattan_to_goal)),
+                        ('vectorizada', HeuristicCache(manhattan_to_goal_batch, vectorized=True))]:
+    path, total_cost = a_star_search(grid, 0, grid_goal, heuristic)
+    print(f"  {name:<12} costo={total_cost}  {heuristic}")
+
+# --- Cola de cubetas y desempate por mayor g (costos enteros) ---
+# (En una rejilla con todas las aristas de costo 1, miles de nodos tienen
+#  el mismo f(n). Preferir el de mayor g va "derecho" al objetivo; la
+#  BucketQueue evita el heap porque f y h son enteros pequeños.)
+print("\n--- PRUEBA 7: BucketQueue y desempate (rejilla 150x150, costo 1) ---")
+unit_grid = grid_graph(150 * 150, seed=3, max_weight=1)
+for queue_class in (LazyHeapQueue, BucketQueue):
+    for tie_breaking in ('small_g', 'large_g'):
+        counter = CountSink()
+        start = time.perf_counter()
+        path, total_cost = a_star_search(unit_grid, 0, grid_goal, manhattan_to_goal,
+                                         priority_queue=queue_class(), trace=counter,
+                                         tie_breaking=tie_breaking)
+        elapsed = time.perf_counter() - start
+        print(f"  {queue_class.__name__:<14} {tie_breaking:<8} costo={total_cost}  "
+              f"expandidos={counter.counts[VISIT] - counter.counts[PRUNE]:>6}  {elapsed:.3f} s")
+
+# --- AO*: grafo Y-O de ejemplo ---
+#
+#              A
+#        (1) /   \ (1)        A se resuelve con B,  O  con C Y D (conector Y)
+#           B    C===D
+#      (1) / \   |    \ (1)
+#         E   F  G    H       E, G y H son primitivos; F no tiene solución
+#
+# Heurísticas (optimistas): h(B)=2, h(C)=1, h(D)=1
+# Al principio las dos opciones de A estiman 3. AO* prueba B, descubre que
+# cuesta 5 (E) y revisa A hacia arriba: ahora conviene C Y D (costo 3).
+print("\n--- PRUEBA 8: AO* en un grafo Y-O ---")
+and_or_graph = {
+    'A': [(('B',), 1), (('C', 'D'), 1)],
+    'B': [(('E',), 5), (('F',), 1)],
+    'C': [(('G',), 1)],
+    'D': [(('H',), 1)],
+    'E': [], 'F': [], 'G': [], 'H': [],
+}
+and_or_heuristics = {'A': 0, 'B': 2, 'C': 1, 'D': 1}
+solution, total_cost = ao_star_search(and_or_graph, 'A', and_or_heuristics,
+                                      terminals={'E', 'G', 'H'}, trace=PrintSink())
+print(f"  Grafo solución: {solution} (costo total: {total_cost})")
+
+# --- AO* con subproblemas compartidos (DAG) ---
+# (Para "armar" una pieza de tamaño n: juntar n-1 y n-2 (costo 1) O juntar
+#  dos mitades (costo 2). Como árbol habría ~2^n subproblemas; como DAG
+#  cada tamaño aparece una sola vez y se expande una sola vez.)
+print("\n--- PRUEBA 9: AO* con subproblemas compartidos ---")
+size = 40
+build_graph = {1: [], 2: []}
+for n in range(3, size + 1):
+    build_graph[n] = [((n - 1, n - 2), 1), ((n // 2, n - n // 2), 2)]
+solver = AOStar(build_graph)
+solution, total_cost = solver.solve(size)
+print(f"  Costo para armar {size}: {total_cost}  ({len(solution)} nodos en la solución, "
+      f"{solver.expansions} expansiones, {solver.revisions} revisiones, "
+      f"{len(solver.cost)} nodos en el grafo explícito)")
+
+# --- A* con memoria acotada: IDA* y SMA* ---
+# (A* guarda cada estado que genera; IDA* solo el camino actual y SMA* a lo
+#  más 'max_nodes' nodos. Los tres dan la solución óptima; la diferencia es
+#  cuánto trabajo se repite.)
+print("\n--- PRUEBA 10: IDA* y SMA* (8-puzzle) ---")
+start_state = puzzle.scrambled(200, seed=3)
+arena = NodeArena()
+path, total_cost = a_star_search(puzzle, start_state, puzzle.goal, puzzle.manhattan, arena=arena)
+print(f"  A*:   {total_cost} movimientos, {len(arena)} nodos en memoria")
+stats = MemoryBoundedStats()
+path, total_cost = ida_star_search(puzzle, start_state, puzzle.goal, puzzle.manhattan, stats=stats)
+print(f"  IDA*: {total_cost} movimientos  {stats}")
+stats = MemoryBoundedStats()
+path, total_cost = sma_star_search(puzzle, start_state, puzzle.goal, puzzle.manhattan,
+                                   max_nodes=300, stats=stats)
+print(f"  SMA*: {total_cost} movimientos  {stats}")
+
+# --- A* ponderado y ARA* (anytime) ---
+# (En la rejilla de la PRUEBA 6, A* normal revisa casi toda la rejilla.
+#  ARA* entrega enseguida un camino "bueno" (ε = 3) y lo va mejorando,
+#  reusando la búsqueda, hasta el óptimo o hasta que se acabe el plazo.)
+print("\n--- PRUEBA 11: A* ponderado y ARA* (rejilla 150x150) ---")
+for weight in (1, 3):
+    start = time.perf_counter()
+    path, total_cost = a_star_search(grid, 0, grid_goal, manhattan_to_goal, weight=weight)
+    print(f"  A* con weight={weight}: costo={total_cost}  {time.perf_counter() - start:.3f} s")
+stats = AnytimeStats()
+path, total_cost = ara_star_search(grid, 0, grid_goal, manhattan_to_goal, initial_weight=3.0,
+                                   weight_step=0.5, deadline=2.0, stats=stats)
+print(f"  ARA*: costo={total_cost}  {stats}")
+
+# --- Heurística ALT (hitos + desigualdad triangular) ---
+# (Sirve para grafos SIN coordenadas, como una red libre de escala. Las
+#  tablas se calculan una vez, se guardan en disco y se reusan para
+#  cualquier par inicio/objetivo. La heurística es admisible: el costo es
+#  el mismo que con h = 0, pero se expanden muchos menos nodos.)
+print("\n--- PRUEBA 12: heurística ALT (hitos) ---")
+with tempfile.TemporaryDirectory() as temp_dir:
+    tables_path = os.path.join(temp_dir, 'hitos.npz')
+    for name, network, start_node, goal_node in [
+            ('rejilla 150x150', grid, 0, grid_goal),
+            ('libre de escala (20000 nodos)', scale_free_graph(20000, seed=5), 17, 19999)]:
+        start = time.perf_counter()
+        Landmarks.build(network, num_landmarks=8, strategy='avoid', undirected=True).save(tables_path)
+        landmarks = Landmarks.load(tables_path, network, undirected=True)
+        print(f"  {name}: preprocesamiento {time.perf_counter() - start:.2f} s, {landmarks}")
+        for label, heuristic in [('h = 0', {}), ('ALT', landmarks.heuristic(goal_node))]:
+            counter = CountSink()
+            path, total_cost = a_star_search(network, start_node, goal_node, heuristic, trace=counter)
+            print(f"    {label:<6} costo={total_cost}  expandidos={counter.counts[VISIT] - counter.counts[PRUNE]}")
+
+# --- Heurística infinita (nodos que no llegan al objetivo) ---
+# (En un grafo dirigido, ALT da h = inf a los nodos desde los que no se
+#  llega al objetivo. A* ya no los mete a la cola, así que la BucketQueue
+#  no recibe prioridades infinitas. Si igual le llega una, lanza ValueError.)
+print("\n--- PRUEBA 13: h = inf con BucketQueue ---")
+dead_end_graph = GrafoCSR.from_dict({0: [(1, 1), (3, 1)], 1: [(2, 1)], 2: [], 3: []},
+                                    formato='vecino_costo')
+dead_end_h = Landmarks.build(dead_end_graph, 2).heuristic(2)
+print(f"  h(3) = {dead_end_h.get(3)}")
+for queue_class in (LazyHeapQueue, BucketQueue):
+    path, total_cost = a_star_search(dead_end_graph, 0, 2, dead_end_h, priority_queue=queue_class())
+    print(f"  {queue_class.__name__:<13} camino={path}  costo={total_cost}")
+try:
+    BucketQueue().add(3, (float('inf'), 0))
+except ValueError as error:
+    print(f"  BucketQueue.add(inf): ValueError: {error}")
+
+# --- IDA* y SMA* con el objetivo inalcanzable ---
+# (Rejilla 20x20 donde a la esquina (19, 19) no entra ninguna arista. Sin
+#  la tabla de g, IDA* y SMA* recorrerían todos los caminos simples de la
+#  rejilla; con ella cada estado se recorre con su mejor g y terminan.)
+print("\n--- PRUEBA 14: objetivo inalcanzable (rejilla 20x20) ---")
+walled_goal = (19, 19)
+walled_grid = {(i, j): [((i + di, j + dj), 1) for di, dj in ((0, 1), (1, 0), (0, -1), (-1, 0))
+                        if 0 <= i + di < 20 and 0 <= j + dj < 20
+                        and (i + di, j + dj) != walled_goal]
+               for i in range(20) for j in range(20)}
+walled_h = {(i, j): abs(19 - i) + abs(19 - j) for i, j in walled_grid}
+for name, search in [('IDA*', ida_star_search),
+                     ('SMA*', lambda *args, **kwargs: sma_star_search(*args, max_nodes=1000,
+                                                                       **kwargs))]:
+    stats = MemoryBoundedStats()
+    start = time.perf_counter()
+    path, total_cost = search(walled_grid, (0, 0), walled_goal, walled_h, stats=stats)
+    print(f"  {name}: camino={path}  costo={total_cost}  "
+          f"({time.perf_counter() - start:.2f} s)  {stats}")
@@ -0,0 +1,251 @@
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+try:
+    import resource  # Solo existe en Linux / macOS
+except ImportError:
+    resource = None
+
+# Añadimos la carpeta 'Enfoque_01_Busqueda_en_grafos' al path para usar el paquete 'grafos'
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+from grafos import GOAL, PRUNE, VISIT, CountSink
+from grafos.generadores import GENERATORS
+
+# --- Suite de benchmarks de las búsquedas no informadas ---
+#
+# Para cada familia de grafos (rejilla, Erdős–Rényi, libre de escala) y cada
+# tamaño, genera el grafo con una semilla fija y corre cada algoritmo en un
+# proceso hijo. Así el pico de memoria (RSS) de un algoritmo no se mezcla con
+# el de los demás. Los resultados se guardan en JSON para comparar versiones:
+#
+#   python bench_busquedas.py --sizes 1000 10000 --output hoy.json
+#   python bench_busquedas.py --sizes 1000 10000 --compare ayer.json
+#
+# Con 10^7 nodos hacen falta varios GB de RAM (los nombres de los nodos son
+# objetos de Python); para esos tamaños conviene usar --timeout.
+
+SCRIPTS_DIR = os.path.join(BASE_DIR, '01_Busqueda_No_Informada')
+
+
+def load_script(file_name):
+    """
+    Carga uno de los scripts numerados como módulo (no se pueden importar
+    normalmente porque su nombre empieza con un número). Sus demos se
+    ejecutan al cargarlo, así que silenciamos lo que imprimen.
+    """
+    path = os.path.join(SCRIPTS_DIR, file_name)
+    spec = importlib.util.spec_from_file_location(os.path.splitext(file_name)[0], path)
+    module = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+
+def load_algorithms(dls_limit, iddfs_limit):
+    """
+    Devuelve {nombre: función(graph, start, goal, trace=None)} con todos los
+    algoritmos, para llamarlos a todos de la misma forma. Las expansiones se
+    cuentan como eventos VISIT menos PRUNE (entradas viejas descartadas o
+    nodos en el límite de profundidad, que no se expanden).
+    """
+    anchura = load_script('001_BG_BusNoInf_Anchura.py')
+    costo_uniforme = load_script('002_BG_BusNoInf_Anchura_CostoUniforme.py')
+    limitada = load_script('004_BG_BusNoInf_Profundidad_Limitada.py')
+    iterativa = load_script('005_BG_BusNoInf_Profundidad_iterativa.py')
+    bidireccional = load_script('006_BG_BusNoInf_Bidireccional.py')
+    generica = load_script('007_BG_BusNoInf_Grafos.py')
+
+    def generic_bfs(graph, start, goal, trace=None):
+        return generica.generic_graph_search(graph, start, goal,
+                                             generica.QueueFrontier(), trace=trace)
+
+    return {
+        'bfs': lambda graph, start, goal, trace=None: anchura.bfs(graph, start, trace),
+        'ucs': lambda graph, start, goal, trace=None: costo_uniforme.ucs(graph, start, goal,
+                                                                         trace=trace),
+        'dls': lambda graph, start, goal, trace=None: limitada.dls(graph, start, goal,
+                                                                   dls_limit, trace=trace),
+        'iddfs': lambda graph, start, goal, trace=None: iterativa.iddfs(graph, start, goal,
+                                                                        iddfs_limit, trace),
+        'bidirectional_bfs': lambda graph, start, goal, trace=None:
+            bidireccional.bidirectional_bfs(graph, start, goal, trace),
+        'generic_graph_search': generic_bfs,
+    }
+
+
+def peak_rss_kb():
+    """Pico de memoria residente del proceso actual, en KB (None si no se puede medir)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux lo da en KB, macOS en bytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def run_one(search, graph, start, goal):
+    """
+    Corre una búsqueda dos veces: la primera sin trace (para medir tiempo y
+    memoria sin ruido) y la segunda con un CountSink (para contar expansiones).
+
+    Ojo: el hijo hereda el pico de RSS del padre (que ya tiene el grafo), así
+    que 'rss_growth_kb' es lo que realmente añadió la búsqueda.
+    """
+    rss_before = peak_rss_kb()
+    begin = time.perf_counter()
+    search(graph, start, goal)
+    elapsed = time.perf_counter() - begin
+    rss_after = peak_rss_kb()
+
+    counter = CountSink()
+    search(graph, start, goal, trace=counter)
+    return {
+        'time_s': elapsed,
+        'peak_rss_kb': rss_after,
+        'rss_growth_kb': None if rss_after is None else rss_after - rss_before,
+        'nodes_expanded': counter.counts[VISIT] - counter.counts[PRUNE],
+        'goal_reached': counter.counts[GOAL] > 0,
+    }
+
+
+def _child(connection, search, graph, start, goal):
+    """Cuerpo del proceso hijo: corre la búsqueda y manda el resultado por la tubería."""
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 100000))
+    connection.send(run_one(search, graph, start, goal))
+    connection.close()
+
+
+def run_isolated(search, graph, start, goal, timeout):
+    """
+    Corre run_one en un proceso hijo (creado con fork, que hereda el grafo ya
+    generado sin copiarlo). Si el sistema no tiene fork, corre en este proceso.
+    """
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return run_one(search, graph, start, goal)
+
+    context = multiprocessing.get_context('fork')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_child, args=(sender, search, graph, start, goal))
+    process.start()
+    sender.close()
+
+    if receiver.poll(timeout):
+        result = receiver.recv()
+    else:
+        result = {'error': 'timeout' if process.is_alive() else f'exitcode {process.exitcode}'}
+    process.kill()
+    process.join()
+    return result
+
+
+def run_suite(families, sizes, algorithms, seed=42, timeout=600.0,
+              dls_limit=12, iddfs_limit=3):
+    """
+    Corre todos los algoritmos sobre todas las familias y tamaños.
+
+    Returns:
+        dict: metadatos del entorno y una lista de resultados (uno por corrida).
+    """
+    searches = load_algorithms(dls_limit, iddfs_limit)
+    report = {
+        'metadata': {
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'seed': seed,
+            'dls_limit': dls_limit,
+            'iddfs_limit': iddfs_limit,
+        },
+        'results': [],
+    }
+
+    for family in families:
+        for size in sizes:
+            # 1. Generamos el grafo (misma semilla = mismo grafo en cada versión)
+            begin = time.perf_counter()
+            graph = GENERATORS[family](size, seed=seed)
+            build_time = time.perf_counter() - begin
+
+            # 2. Inicio y objetivo también salen de la semilla
+            rng = np.random.default_rng(seed)
+            start, goal = (int(v) for v in rng.integers(0, graph.num_nodes, 2))
+            print(f"{family} n={graph.num_nodes} m={graph.num_edges} "
+                  f"(generado en {build_time:.2f}s), {start} -> {goal}")
+
+            # 3. Cada algoritmo en su propio proceso
+            for name in algorithms:
+                result = run_isolated(searches[name], graph, start, goal, timeout)
+                result.update({'family': family, 'algorithm': name,
+                               'nodes': graph.num_nodes, 'edges': graph.num_edges,
+                               'start': start, 'goal': goal})
+                report['results'].append(result)
+
+                if 'error' in result:
+                    print(f"  {name:<22} {result['error']}")
+                else:
+                    print(f"  {name:<22}{result['time_s']:>10.3f}s"
+                          f"{result['nodes_expanded']:>12} expandidos"
+                          f"{result['peak_rss_kb'] or 0:>12} KB")
+    return report
+
+
+def compare_reports(old, new):
+    """Imprime la razón de tiempos nuevo/viejo de cada corrida presente en ambos reportes."""
+    def key(result):
+        return (result['family'], result['nodes'], result['algorithm'])
+
+    old_results = {key(r): r for r in old['results'] if 'error' not in r}
+    print(f"\n{'Familia':<13}{'Nodos':>10}  {'Algoritmo':<22}{'Antes (s)':>11}"
+          f"{'Ahora (s)':>11}{'Razón':>8}")
+    for result in new['results']:
+        previous = old_results.get(key(result))
+        if previous is None or 'error' in result:
+            continue
+        ratio = result['time_s'] / previous['time_s'] if previous['time_s'] else float('inf')
+        print(f"{result['family']:<13}{result['nodes']:>10}  {result['algorithm']:<22}"
+              f"{previous['time_s']:>11.3f}{result['time_s']:>11.3f}{ratio:>8.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de las búsquedas en grafos.")
+    parser.add_argument('--families', nargs='+', default=list(GENERATORS),
+                        choices=list(GENERATORS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 10000, 100000],
+                        help="Número de nodos (se aceptan hasta 10^7).")
+    parser.add_argument('--algorithms', nargs='+',
+                        default=['bfs', 'ucs', 'dls', 'iddfs', 'bidirectional_bfs',
+                                 'generic_graph_search'])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--timeout', type=float, default=600.0,
+                        help="Segundos máximos por corrida.")
+    parser.add_argument('--dls-limit', type=int, default=12)
+    parser.add_argument('--iddfs-limit', type=int, default=3)
+    parser.add_argument('--output', default='bench_busquedas.json')
+    parser.add_argument('--compare', help="Reporte JSON anterior para comparar tiempos.")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.families, args.sizes, args.algorithms, seed=args.seed,
+                       timeout=args.timeout, dls_limit=args.dls_limit,
+                       iddfs_limit=args.iddfs_limit)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResultados guardados en {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare_reports(json.load(f), report)
+
+
+if __name__ == '__main__':
+    main()
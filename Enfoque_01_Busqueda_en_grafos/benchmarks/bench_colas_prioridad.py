@@ -0,0 +1,73 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+# Añadimos la carpeta 'Enfoque_01_Busqueda_en_grafos' al path para usar el paquete 'grafos'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from grafos import BucketQueue, GrafoCSR, IndexedDaryHeap, LazyHeapQueue
+
+
+def random_dense_graph(num_nodes, avg_degree, seed):
+    """Grafo dirigido aleatorio con costos enteros 1..100 (denso = muchas mejoras de costo)."""
+    rng = np.random.default_rng(seed)
+    num_edges = num_nodes * avg_degree
+    sources = rng.integers(0, num_nodes, num_edges)
+    targets = rng.integers(0, num_nodes, num_edges)
+    weights = rng.integers(1, 101, num_edges)
+    return GrafoCSR.from_arrays(sources, targets, weights, [str(i) for i in range(num_nodes)])
+
+
+def dijkstra_ids(graph, source, priority_queue):
+    """
+    El mismo bucle de UCS pero sobre ids enteros y sin imprimir,
+    para medir SOLO el costo de la cola de prioridad.
+    """
+    costs = {source: 0}
+    priority_queue.add(source, 0)
+    while not priority_queue.is_empty():
+        current_cost, current_node = priority_queue.remove()
+        if current_cost > costs[current_node]:
+            continue  # Entrada vieja (solo pasa con la cola perezosa)
+        neighbors = graph.neighbor_ids(current_node).tolist()
+        weights = graph.edge_weights(current_node).tolist()
+        for neighbor, edge_cost in zip(neighbors, weights):
+            new_cost = current_cost + edge_cost
+            if new_cost < costs.get(neighbor, float('inf')):
+                costs[neighbor] = new_cost
+                priority_queue.add(neighbor, new_cost)
+    return costs
+
+
+def run_benchmark(num_nodes=20000, avg_degree=50, seed=42):
+    graph = random_dense_graph(num_nodes, avg_degree, seed)
+    print(f"Grafo aleatorio: {graph.num_nodes} nodos, {graph.num_edges} aristas\n")
+
+    strategies = [
+        ('heapq perezoso', LazyHeapQueue()),
+        ('d-ario indexado (d=2)', IndexedDaryHeap(d=2)),
+        ('d-ario indexado (d=4)', IndexedDaryHeap(d=4)),
+        ('d-ario indexado (d=8)', IndexedDaryHeap(d=8)),
+        ('cubetas (Dial)', BucketQueue()),
+    ]
+
+    reference = None
+    print(f"{'Estrategia':<24}{'Heap máx':>10}{'Pops':>10}{'Pops/s':>12}{'Tiempo (s)':>12}")
+    for name, priority_queue in strategies:
+        start = time.perf_counter()
+        costs = dijkstra_ids(graph, 0, priority_queue)
+        elapsed = time.perf_counter() - start
+
+        # Todas las estrategias deben dar exactamente los mismos costos
+        if reference is None:
+            reference = costs
+        elif costs != reference:
+            raise AssertionError(f"'{name}' dio costos distintos a la cola perezosa")
+
+        print(f"{name:<24}{priority_queue.peak_size:>10}{priority_queue.pops:>10}"
+              f"{priority_queue.pops / elapsed:>12.0f}{elapsed:>12.3f}")
+
+
+if __name__ == '__main__':
+    run_benchmark()
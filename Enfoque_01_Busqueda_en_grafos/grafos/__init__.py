@@ -0,0 +1,38 @@
+"""
+Estructuras de grafos compartidas por los algoritmos de búsqueda.
+
+Para usarlas desde un script de las carpetas 01_ o 02_, se añade la carpeta
+'Enfoque_01_Busqueda_en_grafos' al sys.path y se importa 'grafos'.
+"""
+
+from .aristas import cost_neighbor_edges, neighbor_cost_edges
+from .colas import BucketQueue, IndexedDaryHeap, LazyHeapQueue
+from .contraccion import ContractionHierarchy
+from .csr import GrafoCSR
+from .disco import (GrafoDisco, convert_adjacency_list, convert_edge_list, open_graph,
+                    save_graph)
+from .externo import contains_sorted, iter_sorted_file, merge_runs, run_length, write_sorted_run
+from .generadores import erdos_renyi_graph, grid_graph, scale_free_graph
+from .heuristicas import HeuristicCache, as_heuristic
+from .hitos import Landmarks
+from .implicito import GrafoImplicito, SlidingPuzzle, StatePacker
+from .nodos import NodeArena, dicts_memory_bytes
+from .transposicion import TranspositionTable
+from .visitados import BitsetVisited, BloomVisited, search_peak_bytes, visited_memory_bytes
+from .trazas import (ENQUEUE, GOAL, PRUNE, VISIT, BinaryTraceSink, CountSink, PrintSink,
+                     read_binary_trace)
+
+__all__ = ['GrafoCSR', 'GrafoDisco', 'open_graph', 'save_graph',
+           'convert_edge_list', 'convert_adjacency_list',
+           'write_sorted_run', 'iter_sorted_file', 'run_length', 'contains_sorted',
+           'merge_runs',
+           'GrafoImplicito', 'StatePacker', 'SlidingPuzzle',
+           'neighbor_cost_edges', 'cost_neighbor_edges',
+           'HeuristicCache', 'as_heuristic', 'Landmarks', 'ContractionHierarchy',
+           'NodeArena', 'dicts_memory_bytes',
+           'IndexedDaryHeap', 'LazyHeapQueue', 'BucketQueue',
+           'TranspositionTable',
+           'BitsetVisited', 'BloomVisited', 'visited_memory_bytes', 'search_peak_bytes',
+           'grid_graph', 'erdos_renyi_graph', 'scale_free_graph',
+           'VISIT', 'ENQUEUE', 'PRUNE', 'GOAL',
+           'PrintSink', 'CountSink', 'BinaryTraceSink', 'read_binary_trace']
@@ -0,0 +1,23 @@
+from .csr import GrafoCSR
+from .implicito import GrafoImplicito
+
+# --- Acceso uniforme a las aristas con costo ---
+#
+# Las búsquedas aceptan tres tipos de grafo: un diccionario de los ejemplos,
+# un GrafoCSR (o GrafoDisco) y un GrafoImplicito. Los dos últimos guardan
+# los costos aparte de los vecinos y arman las tuplas al pedirlas; un
+# diccionario ya las tiene escritas en el formato de su algoritmo.
+
+
+def neighbor_cost_edges(graph, node):
+    """Aristas de 'node' en formato (vecino, costo), como las usa A*."""
+    if isinstance(graph, (GrafoCSR, GrafoImplicito)):
+        return graph.neighbor_cost_edges(node)
+    return graph.get(node, [])
+
+
+def cost_neighbor_edges(graph, node):
+    """Aristas de 'node' en formato (costo, vecino), como las usa UCS."""
+    if isinstance(graph, (GrafoCSR, GrafoImplicito)):
+        return graph.cost_neighbor_edges(node)
+    return graph.get(node, [])
@@ -0,0 +1,241 @@
+import heapq
+import math
+
+
+class LazyHeapQueue:
+    """
+    Cola de prioridad "perezosa" con heapq (la estrategia original de UCS y A*).
+
+    Cada mejora de costo mete una entrada NUEVA; las entradas viejas se quedan
+    en el heap y la búsqueda las descarta al sacarlas. Es simple, pero en
+    grafos densos el heap crece hasta O(E) entradas.
+
+    Protocolo común de las colas (como QueueFrontier/StackFrontier):
+        add(item, priority), remove() -> (priority, item), is_empty()
+    """
+
+    def __init__(self):
+        self.heap = []
+        # Estadísticas para comparar estrategias
+        self.pushes = 0
+        self.pops = 0
+        self.peak_size = 0
+
+    def add(self, item, priority):
+        heapq.heappush(self.heap, (priority, item))
+        self.pushes += 1
+        if len(self.heap) > self.peak_size:
+            self.peak_size = len(self.heap)
+
+    def remove(self):
+        self.pops += 1
+        return heapq.heappop(self.heap)
+
+    def is_empty(self):
+        return len(self.heap) == 0
+
+    def __len__(self):
+        return len(self.heap)
+
+
+class IndexedDaryHeap:
+    """
+    Heap d-ario indexado con decrease-key real.
+
+    Guarda en un diccionario la posición de cada elemento dentro del heap.
+    Si un elemento que ya está en la cola recibe una prioridad menor, se
+    actualiza EN SU LUGAR (decrease-key) en vez de meter un duplicado.
+    Así el heap nunca tiene más de una entrada por nodo y ningún pop se
+    desperdicia. Un d mayor que 2 hace el árbol más bajo (sift-up más barato).
+    """
+
+    def __init__(self, d=4):
+        if d < 2:
+            raise ValueError("El heap d-ario necesita d >= 2")
+        self.d = d
+        self.items = []        # items[i]: elemento en la posición i del heap
+        self.priorities = []   # priorities[i]: su prioridad
+        self.position = {}     # {elemento: posición en el heap}
+        # Estadísticas para comparar estrategias
+        self.pushes = 0
+        self.decreases = 0
+        self.pops = 0
+        self.peak_size = 0
+
+    def add(self, item, priority):
+        """Inserta 'item', o baja su prioridad si ya estaba y la nueva es menor."""
+        i = self.position.get(item)
+        if i is None:
+            # 1. Elemento nuevo: al final del heap y lo subimos
+            self.items.append(item)
+            self.priorities.append(priority)
+            self.position[item] = len(self.items) - 1
+            self.pushes += 1
+            if len(self.items) > self.peak_size:
+                self.peak_size = len(self.items)
+            self._sift_up(len(self.items) - 1)
+        elif priority < self.priorities[i]:
+            # 2. Decrease-key: actualizamos su prioridad y lo subimos
+            self.priorities[i] = priority
+            self.decreases += 1
+            self._sift_up(i)
+
+    def remove(self):
+        """Saca el elemento de menor prioridad. Devuelve (prioridad, elemento)."""
+        self.pops += 1
+        top_item, top_priority = self.items[0], self.priorities[0]
+        del self.position[top_item]
+
+        # El último elemento ocupa la raíz y se hunde hasta su lugar
+        last_item = self.items.pop()
+        last_priority = self.priorities.pop()
+        if self.items:
+            self.items[0] = last_item
+            self.priorities[0] = last_priority
+            self.position[last_item] = 0
+            self._sift_down(0)
+        return top_priority, top_item
+
+    def is_empty(self):
+        return len(self.items) == 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.position
+
+    def _sift_up(self, i):
+        items, priorities, position, d = self.items, self.priorities, self.position, self.d
+        item, priority = items[i], priorities[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if not priority < priorities[parent]:
+                break
+            # Bajamos al padre al hueco y seguimos subiendo
+            items[i], priorities[i] = items[parent], priorities[parent]
+            position[items[i]] = i
+            i = parent
+        items[i], priorities[i] = item, priority
+        position[item] = i
+
+    def _sift_down(self, i):
+        items, priorities, position, d = self.items, self.priorities, self.position, self.d
+        size = len(items)
+        item, priority = items[i], priorities[i]
+        while True:
+            first_child = d * i + 1
+            if first_child >= size:
+                break
+            # El hijo con menor prioridad
+            best = first_child
+            for child in range(first_child + 1, min(first_child + d, size)):
+                if priorities[child] < priorities[best]:
+                    best = child
+            if not priorities[best] < priority:
+                break
+            items[i], priorities[i] = items[best], priorities[best]
+            position[items[i]] = i
+            i = best
+        items[i], priorities[i] = item, priority
+        position[item] = i
+
+
+class BucketQueue:
+    """
+    Cola de cubetas (Dial) para prioridades ENTERAS >= 0.
+
+    En lugar de un heap, hay una cubeta (lista) por cada valor de prioridad
+    y un cursor que apunta a la cubeta más baja que puede tener elementos.
+    Meter y sacar son O(1): con costos enteros pequeños el cursor solo
+    avanza de a pocos pasos (nunca más que el costo máximo de una arista),
+    y no se comparan tuplas ni nombres de nodos.
+
+    La prioridad puede ser un entero o una tupla de enteros (p, d, ...):
+    p elige la cubeta y d desempata DENTRO de ella (sub-cubetas, menor
+    primero); el resto de la tupla solo se devuelve. Los empates exactos
+    salen en orden LIFO (el último que entró).
+
+    Como LazyHeapQueue, no tiene decrease-key: una mejora de costo mete una
+    entrada nueva y la búsqueda descarta la vieja al sacarla.
+    """
+
+    def __init__(self):
+        self.buckets = {}   # {p: {d: [(prioridad, elemento), ...]}}
+        self.lowest = {}    # {p: menor d que puede tener elementos en la cubeta p}
+        self.current = 0    # Menor p que puede tener elementos
+        self.size = 0
+        # Estadísticas para comparar estrategias
+        self.pushes = 0
+        self.pops = 0
+        self.peak_size = 0
+
+    def add(self, item, priority):
+        if isinstance(priority, tuple):
+            key, tie = priority[0], priority[1]
+        else:
+            key, tie = priority, 0
+        # (Con una prioridad no entera el cursor nunca la encontraría;
+        #  isfinite va primero porque int(inf) lanza OverflowError)
+        if (not math.isfinite(key) or not math.isfinite(tie)
+                or key < 0 or tie < 0 or key != int(key) or tie != int(tie)):
+            raise ValueError(f"BucketQueue solo acepta enteros >= 0, llegó {priority}")
+
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            self.buckets[key] = bucket = {}
+            self.lowest[key] = tie
+        elif tie < self.lowest[key]:
+            self.lowest[key] = tie
+        entries = bucket.get(tie)
+        if entries is None:
+            bucket[tie] = entries = []
+        entries.append((priority, item))
+
+        # (Con una heurística inconsistente puede llegar algo por debajo del cursor)
+        if key < self.current:
+            self.current = key
+        self.size += 1
+        self.pushes += 1
+        if self.size > self.peak_size:
+            self.peak_size = self.size
+
+    def remove(self):
+        """Saca el elemento de menor prioridad. Devuelve (prioridad, elemento)."""
+        if self.size == 0:
+            raise IndexError("remove() en una BucketQueue vacía")
+        buckets = self.buckets
+
+        # 1. Avanzamos el cursor hasta la primera cubeta con elementos
+        key = self.current
+        while key not in buckets:
+            key += 1
+        self.current = key
+
+        # 2. Dentro de ella, la sub-cubeta con menor desempate
+        bucket = buckets[key]
+        tie = self.lowest[key]
+        while tie not in bucket:
+            tie += 1
+        entries = bucket[tie]
+        entry = entries.pop()
+
+        # 3. Borramos lo que quedó vacío
+        if entries:
+            self.lowest[key] = tie
+        else:
+            del bucket[tie]
+            if bucket:
+                self.lowest[key] = tie + 1
+            else:
+                del buckets[key]
+                del self.lowest[key]
+        self.size -= 1
+        self.pops += 1
+        return entry
+
+    def is_empty(self):
+        return self.size == 0
+
+    def __len__(self):
+        return self.size
@@ -0,0 +1,312 @@
+import heapq
+
+import numpy as np
+
+from .csr import GrafoCSR
+
+# --- Jerarquías de contracción (Contraction Hierarchies) ---
+#
+# Para grafos que casi no cambian y reciben MUCHAS consultas de camino más
+# corto. El preprocesamiento "contrae" los nodos uno por uno, del menos al
+# más importante: al quitar v, si el camino u -> v -> w era el más corto
+# entre u y w, se añade un atajo u -> w con el mismo costo (el "testigo" es
+# una búsqueda corta que revisa si hay otro camino igual de barato).
+#
+# Cada nodo recibe un rango (su orden de contracción). Una consulta s -> t
+# es un Dijkstra bidireccional que SOLO sube de rango: hacia adelante desde
+# s y hacia atrás desde t. Ambas búsquedas se encuentran en el nodo más
+# importante del camino y exploran muy pocos nodos. Los atajos recuerdan su
+# nodo intermedio, así que el camino se "desempaca" a aristas originales.
+
+
+class ContractionHierarchy:
+    """
+    Jerarquía de contracción de un GrafoCSR (dirigido o no, costos >= 0).
+
+    Atributos:
+        rank (int64, n): orden de contracción de cada nodo.
+        forward: aristas u -> w con rank[u] < rank[w] (búsqueda desde el inicio),
+                 como (offsets, targets, weights).
+        backward: aristas u -> w con rank[u] > rank[w], guardadas en w
+                  (búsqueda hacia atrás desde el objetivo).
+        shortcuts: {(u, w): nodo intermedio} de cada atajo.
+
+    Se construye con ContractionHierarchy.build(graph) o se lee con
+    ContractionHierarchy.load(path, graph).
+    """
+
+    def __init__(self, graph, rank, forward, backward, shortcuts):
+        self.graph = graph
+        self.rank = np.asarray(rank, dtype=np.int64)
+        self.forward = forward
+        self.backward = backward
+        self.shortcuts = shortcuts
+        # Para las consultas, listas de Python (mucho más rápidas de recorrer
+        # de a un elemento que los arreglos de numpy)
+        self._up = _adjacency_lists(*forward)
+        self._down = _adjacency_lists(*backward)
+
+    # --- Preprocesamiento ---
+
+    @classmethod
+    def build(cls, graph, witness_limit=64):
+        """
+        Ordena y contrae todos los nodos.
+
+        Args:
+            graph (GrafoCSR): El grafo.
+            witness_limit (int): Máximo de nodos que asienta cada búsqueda de
+                                 testigos. Si se corta antes, se añade el atajo
+                                 por las dudas (nunca rompe la exactitud, solo
+                                 agrega atajos de más).
+
+        El orden es "perezoso": la prioridad de un nodo es su diferencia de
+        aristas (atajos que crearía - aristas que quita) más cuántos vecinos
+        ya se contrajeron; se recalcula al sacarlo del heap y, si ya no es el
+        mínimo, vuelve a entrar. Si sigue siendo el mínimo, se contrae con
+        los atajos recién calculados (nunca con unos viejos: un testigo
+        calculado antes pudo pasar por un nodo que ya no está).
+        """
+        if not isinstance(graph, GrafoCSR):
+            raise TypeError("ContractionHierarchy necesita un GrafoCSR (usa GrafoCSR.from_dict)")
+        n = graph.num_nodes
+
+        # 1. El grafo "restante" como diccionarios {vecino: costo} en ambos
+        #    sentidos (con aristas repetidas nos quedamos con la más barata)
+        out_edges = [dict() for _ in range(n)]
+        in_edges = [dict() for _ in range(n)]
+        sources = np.repeat(np.arange(n), graph.degrees()).tolist()
+        for u, w, cost in zip(sources, graph.targets.tolist(), graph.weights.tolist()):
+            if u != w and cost < out_edges[u].get(w, float('inf')):
+                out_edges[u][w] = cost
+                in_edges[w][u] = cost
+        # Todas las aristas de la jerarquía: {(u, w): costo} y los atajos
+        edges = {(u, w): cost for u in range(n) for w, cost in out_edges[u].items()}
+        shortcuts = {}
+
+        def needed_shortcuts(v):
+            """Atajos u -> w que hacen falta si se contrae v."""
+            result = []
+            out_v = out_edges[v]
+            if not out_v:
+                return result
+            max_out = max(out_v.values())
+            for u, cost_uv in in_edges[v].items():
+                # Testigo: Dijkstra corto desde u sin pasar por v
+                distances = _witness_search(out_edges, u, v, cost_uv + max_out, witness_limit)
+                for w, cost_vw in out_v.items():
+                    if w != u and distances.get(w, float('inf')) > cost_uv + cost_vw:
+                        result.append((u, w, cost_uv + cost_vw))
+            return result
+
+        deleted_neighbors = [0] * n
+
+        def priority(v, new_shortcuts):
+            return (len(new_shortcuts) - len(in_edges[v]) - len(out_edges[v])
+                    + deleted_neighbors[v])
+
+        queue = [(priority(v, needed_shortcuts(v)), v) for v in range(n)]
+        heapq.heapify(queue)
+        rank = np.empty(n, dtype=np.int64)
+        next_rank = 0
+
+        # 2. Contraemos en orden de prioridad (con actualización perezosa)
+        while queue:
+            _, v = heapq.heappop(queue)
+            new_shortcuts = needed_shortcuts(v)
+            current = priority(v, new_shortcuts)
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, v))
+                continue
+
+            for u, w, cost in new_shortcuts:
+                if cost < edges.get((u, w), float('inf')):
+                    edges[(u, w)] = cost
+                    shortcuts[(u, w)] = v
+                    out_edges[u][w] = cost
+                    in_edges[w][u] = cost
+
+            # v sale del grafo restante
+            for u in in_edges[v]:
+                del out_edges[u][v]
+                deleted_neighbors[u] += 1
+            for w in out_edges[v]:
+                del in_edges[w][v]
+                deleted_neighbors[w] += 1
+            out_edges[v], in_edges[v] = {}, {}
+            rank[v] = next_rank
+            next_rank += 1
+
+        # 3. Repartimos las aristas en el grafo "hacia arriba" y el "hacia atrás"
+        up, down = [], []
+        for (u, w), cost in edges.items():
+            if rank[u] < rank[w]:
+                up.append((u, w, cost))
+            else:
+                down.append((w, u, cost))  # Guardada en w: la búsqueda hacia atrás va de w a u
+        return cls(graph, rank, _csr_arrays(up, n), _csr_arrays(down, n), shortcuts)
+
+    # --- Consultas ---
+
+    def query_ids(self, source_id, target_id):
+        """
+        Dijkstra bidireccional que solo sube de rango.
+
+        Returns:
+            (cost, path_ids): costo mínimo y camino en ids de aristas
+            originales, o (inf, None) si no hay camino.
+        """
+        infinity = float('inf')
+        distances = ({source_id: 0}, {target_id: 0})
+        parents = ({source_id: -1}, {target_id: -1})
+        queues = ([(0, source_id)], [(0, target_id)])
+        adjacency = (self._up, self._down)
+        best, meeting = infinity, -1
+        if source_id == target_id:
+            best, meeting = 0, source_id
+
+        # Alternamos: avanza el lado cuyo tope es menor, hasta que ninguno
+        # pueda mejorar el mejor costo encontrado
+        while True:
+            top_forward = queues[0][0][0] if queues[0] else infinity
+            top_backward = queues[1][0][0] if queues[1] else infinity
+            if min(top_forward, top_backward) >= best:
+                break
+            side = 0 if top_forward <= top_backward else 1
+            cost, node = heapq.heappop(queues[side])
+            own, other = distances[side], distances[1 - side]
+            if cost > own[node]:
+                continue  # Entrada vieja
+            if node in other and cost + other[node] < best:
+                best, meeting = cost + other[node], node
+            for neighbor, edge_cost in adjacency[side][node]:
+                new_cost = cost + edge_cost
+                if new_cost < own.get(neighbor, infinity):
+                    own[neighbor] = new_cost
+                    parents[side][neighbor] = node
+                    heapq.heappush(queues[side], (new_cost, neighbor))
+
+        if meeting < 0:
+            return infinity, None
+
+        # Camino de la jerarquía: inicio -> encuentro -> objetivo
+        path = []
+        node = meeting
+        while node != -1:
+            path.append(node)
+            node = parents[0][node]
+        path.reverse()
+        node = parents[1][meeting]
+        while node != -1:
+            path.append(node)
+            node = parents[1][node]
+        return best, self.unpack(path)
+
+    def unpack(self, path_ids):
+        """Reemplaza cada atajo del camino por las aristas originales que representa."""
+        result = [path_ids[0]]
+        for u, w in zip(path_ids, path_ids[1:]):
+            stack = [(u, w)]
+            while stack:
+                a, b = stack.pop()
+                middle = self.shortcuts.get((a, b))
+                if middle is None:
+                    result.append(b)
+                else:
+                    # Primero (a, middle), después (middle, b)
+                    stack.append((middle, b))
+                    stack.append((a, middle))
+        return result
+
+    def shortest_path(self, start_node, goal_node):
+        """
+        Como ucs / a_star_search, con los nombres de los nodos.
+
+        Returns:
+            (path, cost): el camino más corto y su costo, o (None, inf).
+        """
+        graph = self.graph
+        cost, path_ids = self.query_ids(graph.id_of(start_node), graph.id_of(goal_node))
+        if path_ids is None:
+            return None, cost
+        return [graph.name_of(node) for node in path_ids], cost
+
+    @property
+    def num_shortcuts(self):
+        return len(self.shortcuts)
+
+    # --- Guardar y leer ---
+
+    def save(self, path):
+        """Guarda la jerarquía (formato .npz de numpy, sin comprimir)."""
+        pairs = np.array(list(self.shortcuts.keys()), dtype=np.int64).reshape(-1, 2)
+        middles = np.array(list(self.shortcuts.values()), dtype=np.int64)
+        with open(path, 'wb') as f:
+            np.savez(f, rank=self.rank,
+                     forward_offsets=self.forward[0], forward_targets=self.forward[1],
+                     forward_weights=self.forward[2],
+                     backward_offsets=self.backward[0], backward_targets=self.backward[1],
+                     backward_weights=self.backward[2],
+                     shortcut_pairs=pairs, shortcut_middles=middles,
+                     fingerprint=np.array(self.graph.fingerprint()))
+
+    @classmethod
+    def load(cls, path, graph):
+        """
+        Lee una jerarquía guardada con save(). Debe ser del mismo grafo (se
+        compara la huella de su contenido, como en Landmarks.load).
+        """
+        with np.load(path) as data:
+            if str(data['fingerprint']) != graph.fingerprint():
+                raise ValueError(f"La jerarquía de '{path}' es de otro grafo")
+            forward = (data['forward_offsets'], data['forward_targets'], data['forward_weights'])
+            backward = (data['backward_offsets'], data['backward_targets'],
+                        data['backward_weights'])
+            shortcuts = dict(zip(map(tuple, data['shortcut_pairs'].tolist()),
+                                 data['shortcut_middles'].tolist()))
+            return cls(graph, data['rank'], forward, backward, shortcuts)
+
+    def __repr__(self):
+        return (f"ContractionHierarchy(nodos={len(self.rank)}, "
+                f"aristas_arriba={len(self.forward[1])}, aristas_atras={len(self.backward[1])}, "
+                f"atajos={self.num_shortcuts})")
+
+
+def _witness_search(out_edges, source, excluded, max_cost, limit):
+    """Dijkstra desde 'source' sin pasar por 'excluded', hasta max_cost o 'limit' nodos."""
+    distances = {source: 0}
+    queue = [(0, source)]
+    settled = 0
+    while queue and settled < limit:
+        cost, node = heapq.heappop(queue)
+        if cost > distances[node]:
+            continue
+        if cost > max_cost:
+            break
+        settled += 1
+        for neighbor, edge_cost in out_edges[node].items():
+            if neighbor == excluded:
+                continue
+            new_cost = cost + edge_cost
+            if new_cost < distances.get(neighbor, float('inf')):
+                distances[neighbor] = new_cost
+                heapq.heappush(queue, (new_cost, neighbor))
+    return distances
+
+
+def _csr_arrays(edges, num_nodes):
+    """Lista de (u, w, costo) -> (offsets, targets, weights) ordenados por u."""
+    edges.sort(key=lambda edge: edge[0])
+    sources = np.array([u for u, _, _ in edges], dtype=np.int64)
+    offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_nodes), out=offsets[1:])
+    targets = np.array([w for _, w, _ in edges], dtype=np.int32)
+    weights = np.array([cost for _, _, cost in edges])
+    return offsets, targets, weights
+
+
+def _adjacency_lists(offsets, targets, weights):
+    """Listas [(vecino, costo), ...] por nodo, a partir de arreglos CSR."""
+    offsets, targets, weights = offsets.tolist(), targets.tolist(), weights.tolist()
+    return [list(zip(targets[offsets[v]:offsets[v + 1]], weights[offsets[v]:offsets[v + 1]]))
+            for v in range(len(offsets) - 1)]
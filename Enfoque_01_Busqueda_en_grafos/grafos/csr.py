@@ -0,0 +1,279 @@
+import array
+import hashlib
+
+import numpy as np
+
+
+def _edge_positions(offsets, node_ids):
+    """Ayudante de GrafoCSR.edge_positions que solo necesita el arreglo de offsets."""
+    node_ids = np.asarray(node_ids, dtype=np.int64)
+    starts = offsets[node_ids]
+    counts = offsets[node_ids + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    # Para cada arista: inicio de su bloque + posición dentro del bloque
+    block_begin = np.cumsum(counts) - counts
+    positions = np.repeat(starts - block_begin, counts) + np.arange(total)
+    return np.repeat(node_ids, counts), positions
+
+
+class GrafoCSR:
+    """
+    Grafo compacto en formato CSR (Compressed Sparse Row).
+
+    En lugar de un diccionario de listas con cadenas, guardamos el grafo en
+    tres arreglos de numpy:
+
+        offsets (int64, n+1): las aristas del nodo i van de offsets[i] a offsets[i+1]
+        targets (int32, m):   el id del nodo destino de cada arista
+        weights (m):          el costo de cada arista
+
+    Los nodos se identifican internamente con enteros (int32) y se guarda
+    un mapeo nombre <-> id para poder seguir hablando de 'A', 'B', ...
+
+    El grafo también imita la interfaz de los diccionarios de ejemplo
+    (graph.get(nodo, [])), así que las búsquedas lo aceptan directamente.
+    """
+
+    def __init__(self, offsets, targets, weights, names):
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.targets = np.asarray(targets, dtype=np.int32)
+        self.weights = np.asarray(weights)
+        self.names = list(names)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        # Número de versión: quien modifique los arreglos debe llamar a
+        # touch() para que los cachés sepan que sus resultados ya no valen.
+        self.version = 0
+        self._reversed = None
+
+    # --- Construcción ---
+
+    @classmethod
+    def from_arrays(cls, sources, targets, weights, names):
+        """
+        Construye el CSR a partir de tres arreglos paralelos de aristas
+        (origen, destino, costo) con ids enteros.
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int32)
+        weights = np.asarray(weights)
+        num_nodes = len(names)
+
+        # 1. Ordenamos las aristas por nodo origen (estable: respeta el orden
+        #    original de los vecinos de cada nodo).
+        order = np.argsort(sources, kind='stable')
+
+        # 2. Contamos cuántas aristas salen de cada nodo y acumulamos
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_nodes), out=offsets[1:])
+
+        return cls(offsets, targets[order], weights[order], names)
+
+    @classmethod
+    def from_dict(cls, graph, formato='lista'):
+        """
+        Convierte uno de los grafos-diccionario de los ejemplos a CSR.
+
+        Args:
+            graph (dict): El grafo como lista de adyacencia.
+            formato (str): Cómo vienen las aristas:
+                           'lista'        -> {'A': ['B', 'C']}          (costo 1)
+                           'costo_vecino' -> {'A': [(5, 'B'), (1, 'C')]} (como en UCS)
+                           'vecino_costo' -> {'A': [('B', 5), ('C', 1)]} (como en A*)
+        """
+        names = []
+        ids = {}
+
+        def get_id(name):
+            if name not in ids:
+                ids[name] = len(names)
+                names.append(name)
+            return ids[name]
+
+        sources, targets, weights = [], [], []
+        for node, edges in graph.items():
+            node_id = get_id(node)
+            for edge in edges:
+                if formato == 'lista':
+                    neighbor, cost = edge, 1
+                elif formato == 'costo_vecino':
+                    cost, neighbor = edge
+                elif formato == 'vecino_costo':
+                    neighbor, cost = edge
+                else:
+                    raise ValueError(f"Formato de grafo desconocido: '{formato}'")
+                sources.append(node_id)
+                targets.append(get_id(neighbor))
+                weights.append(cost)
+
+        # Si todos los costos son enteros los guardamos como enteros,
+        # así los resultados son idénticos a los del diccionario.
+        if all(isinstance(w, int) for w in weights):
+            weights = np.array(weights, dtype=np.int64)
+        else:
+            weights = np.array(weights, dtype=np.float64)
+        return cls.from_arrays(sources, targets, weights, names)
+
+    @classmethod
+    def from_edge_list(cls, path, directed=True, default_weight=1.0):
+        """
+        Carga un grafo desde un archivo de texto de aristas.
+
+        Cada línea tiene la forma "origen destino [costo]". Las líneas vacías
+        y las que empiezan con '#' se ignoran.
+
+        Args:
+            path (str): Ruta al archivo.
+            directed (bool): Si es False, cada arista se añade en ambos sentidos.
+            default_weight (float): Costo de las aristas que no traen uno.
+        """
+        names = []
+        ids = {}
+
+        # Usamos array.array en lugar de listas: 4-8 bytes por arista
+        # en vez de un objeto de Python por cada número.
+        sources = array.array('i')
+        targets = array.array('i')
+        weights = array.array('d')
+
+        with open(path, encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                parts = line.split()
+                if len(parts) not in (2, 3):
+                    raise ValueError(f"{path}:{line_number}: se esperaba "
+                                     f"'origen destino [costo]', se leyó: {line!r}")
+
+                for name in parts[:2]:
+                    if name not in ids:
+                        ids[name] = len(names)
+                        names.append(name)
+                u, v = ids[parts[0]], ids[parts[1]]
+                w = float(parts[2]) if len(parts) == 3 else default_weight
+
+                sources.append(u)
+                targets.append(v)
+                weights.append(w)
+                if not directed:
+                    sources.append(v)
+                    targets.append(u)
+                    weights.append(w)
+
+        return cls.from_arrays(np.frombuffer(sources, dtype=np.int32),
+                               np.frombuffer(targets, dtype=np.int32),
+                               np.frombuffer(weights, dtype=np.float64),
+                               names)
+
+    # --- Consultas por id (rápidas, sin crear objetos) ---
+
+    @property
+    def num_nodes(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def neighbor_ids(self, node_id):
+        """Vista (sin copia) de los ids vecinos del nodo node_id."""
+        return self.targets[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def edge_weights(self, node_id):
+        """Vista (sin copia) de los costos de las aristas del nodo node_id."""
+        return self.weights[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def edge_positions(self, node_ids):
+        """
+        Posiciones (en targets/weights) de TODAS las aristas que salen de
+        los nodos node_ids, junto con el nodo origen de cada una.
+        Es la operación básica para expandir una frontera completa con numpy.
+
+        Returns:
+            (sources, positions): dos arreglos del mismo largo.
+        """
+        return _edge_positions(self.offsets, node_ids)
+
+    def degrees(self):
+        """Grado de salida de cada nodo."""
+        return np.diff(self.offsets)
+
+    def reversed(self):
+        """
+        Devuelve el grafo transpuesto (aristas invertidas). Se calcula una
+        sola vez y se guarda, porque BFS bottom-up lo consulta en cada nivel.
+        """
+        if self._reversed is None:
+            sources = np.repeat(np.arange(self.num_nodes, dtype=np.int64), self.degrees())
+            self._reversed = GrafoCSR.from_arrays(self.targets.astype(np.int64), sources,
+                                                  self.weights, self.names)
+        return self._reversed
+
+    def touch(self):
+        """Marca el grafo como modificado (invalida cachés y el grafo transpuesto)."""
+        self.version += 1
+        self._reversed = None
+
+    def id_of(self, name):
+        return self.ids[name]
+
+    def name_of(self, node_id):
+        return self.names[node_id]
+
+    def memory_bytes(self):
+        """Bytes ocupados por los arreglos CSR (sin contar los nombres)."""
+        return self.offsets.nbytes + self.targets.nbytes + self.weights.nbytes
+
+    def fingerprint(self):
+        """
+        Huella del contenido del grafo (SHA-256 de offsets, targets y weights).
+        Los preprocesamientos guardados en disco (hitos, jerarquías) la
+        guardan para no usarse con otro grafo del mismo tamaño.
+        """
+        digest = hashlib.sha256()
+        for values in (self.offsets, self.targets, self.weights):
+            digest.update(str(values.dtype).encode())
+            digest.update(np.ascontiguousarray(values).data)
+        return digest.hexdigest()
+
+    # --- Interfaz compatible con los diccionarios de los ejemplos ---
+
+    def __contains__(self, name):
+        return name in self.ids
+
+    def __len__(self):
+        return self.num_nodes
+
+    def __iter__(self):
+        """Recorre los nombres de los nodos, como 'for node in graph' en un dict."""
+        return iter(self.names)
+
+    def keys(self):
+        return list(self.names)
+
+    def get(self, name, default=None):
+        """Igual que graph.get(nodo, []) en formato 'lista': nombres de los vecinos."""
+        node_id = self.ids.get(name)
+        if node_id is None:
+            return default
+        return [self.names[v] for v in self.neighbor_ids(node_id).tolist()]
+
+    def cost_neighbor_edges(self, name):
+        """Aristas en formato (costo, vecino), como las usa UCS."""
+        node_id = self.ids.get(name)
+        if node_id is None:
+            return []
+        return [(w, self.names[v]) for v, w in zip(self.neighbor_ids(node_id).tolist(),
+                                                   self.edge_weights(node_id).tolist())]
+
+    def neighbor_cost_edges(self, name):
+        """Aristas en formato (vecino, costo), como las usa A*."""
+        node_id = self.ids.get(name)
+        if node_id is None:
+            return []
+        return [(self.names[v], w) for v, w in zip(self.neighbor_ids(node_id).tolist(),
+                                                   self.edge_weights(node_id).tolist())]
@@ -0,0 +1,392 @@
+import array
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from .csr import GrafoCSR
+
+# --- Formato binario de grafos en disco ---
+#
+# Un solo archivo que numpy.memmap abre sin cargarlo en memoria. El sistema
+# operativo trae a RAM solo las páginas que la búsqueda toca, así que sirve
+# para grafos más grandes que la memoria (cientos de millones de aristas).
+#
+#   cabecera (64 bytes): magia, versión, banderas, n, m, bytes de nombres
+#   offsets       int64[n + 1]
+#   targets       int32[m]
+#   weights       int64[m] o float64[m]
+#   (si hay nombres)
+#   name_offsets  int64[n + 1]   el nombre i va de name_offsets[i] a name_offsets[i+1]
+#   name_order    int32[n]       ids ordenados por nombre (para buscar por nombre)
+#   name_bytes    uint8[...]     todos los nombres en UTF-8, uno detrás de otro
+#
+# Cada sección empieza en un múltiplo de 8 bytes. Sin nombres, los nodos se
+# llaman 0, 1, 2, ... (su propio id). Con nombres, todos deben ser str: el
+# archivo no guarda el tipo, y un nombre 1 o (0, 1) volvería como '1' o
+# '(0, 1)' sin que nadie lo note.
+
+MAGIC = b'GRAFOCSR'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<8sIIqqq')
+HEADER_SIZE = 64
+
+FLAG_FLOAT_WEIGHTS = 1
+FLAG_NAMES = 2
+
+
+def _align(position):
+    return (position + 7) // 8 * 8
+
+
+def _layout(num_nodes, num_edges, weight_dtype, names_size, has_names):
+    """Posición (en bytes) de cada sección dentro del archivo."""
+    sections = {}
+    position = HEADER_SIZE
+    parts = [('offsets', np.int64, num_nodes + 1),
+             ('targets', np.int32, num_edges),
+             ('weights', weight_dtype, num_edges)]
+    if has_names:
+        parts += [('name_offsets', np.int64, num_nodes + 1),
+                  ('name_order', np.int32, num_nodes),
+                  ('name_bytes', np.uint8, names_size)]
+    for section, dtype, length in parts:
+        sections[section] = (position, dtype, length)
+        position = _align(position + np.dtype(dtype).itemsize * length)
+    return sections, position
+
+
+def _map_section(path, section, mode):
+    position, dtype, length = section
+    if length == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode=mode, offset=position, shape=(length,))
+
+
+def _create_file(path, num_nodes, num_edges, weight_dtype, names=None):
+    """
+    Crea el archivo con su cabecera y sus nombres, y devuelve los memmaps
+    (offsets, targets, weights) para que quien llama los llene.
+    """
+    # 1. Codificamos los nombres (si los hay) en un solo bloque de bytes
+    if names is not None:
+        encoded = [str(name).encode('utf-8') for name in names]
+        name_offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum([len(e) for e in encoded], out=name_offsets[1:])
+        names_size = int(name_offsets[-1])
+    else:
+        names_size = 0
+
+    # 2. Cabecera y tamaño total del archivo
+    flags = FLAG_FLOAT_WEIGHTS if np.dtype(weight_dtype).kind == 'f' else 0
+    if names is not None:
+        flags |= FLAG_NAMES
+    sections, total_size = _layout(num_nodes, num_edges, weight_dtype,
+                                   names_size, names is not None)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, flags, num_nodes, num_edges, names_size)
+                .ljust(HEADER_SIZE, b'\0'))
+        f.truncate(total_size)
+
+    # 3. Tabla de nombres
+    if names is not None:
+        _map_section(path, sections['name_offsets'], 'r+')[:] = name_offsets
+        order = sorted(range(num_nodes), key=encoded.__getitem__)
+        _map_section(path, sections['name_order'], 'r+')[:] = order
+        if names_size:
+            _map_section(path, sections['name_bytes'], 'r+')[:] = np.frombuffer(
+                b''.join(encoded), dtype=np.uint8)
+
+    return (_map_section(path, sections['offsets'], 'r+'),
+            _map_section(path, sections['targets'], 'r+'),
+            _map_section(path, sections['weights'], 'r+'))
+
+
+# --- Escritura ---
+
+def save_graph(graph, path):
+    """Guarda un GrafoCSR (en memoria) en el formato de disco."""
+    # Si los nombres son justo 0..n-1 no hace falta la tabla de nombres
+    numbered = all(name == node_id for node_id, name in enumerate(graph.names))
+    names = None if numbered else graph.names
+    if names is not None:
+        for name in names:
+            if not isinstance(name, str):
+                raise TypeError(f"save_graph solo guarda nombres str (o los ids 0..n-1), "
+                                f"llegó {name!r} de tipo {type(name).__name__}")
+    weight_dtype = np.float64 if graph.weights.dtype.kind == 'f' else np.int64
+    offsets, targets, weights = _create_file(path, graph.num_nodes, graph.num_edges,
+                                             weight_dtype, names)
+    offsets[:] = graph.offsets
+    targets[:] = graph.targets
+    weights[:] = graph.weights
+    for array_map in (offsets, targets, weights):
+        if isinstance(array_map, np.memmap):
+            array_map.flush()
+
+
+def _convert_edges(read_edges, path, chunk_edges):
+    """
+    Convierte un flujo de aristas (nombre_origen, nombre_destino, costo) al
+    formato de disco SIN tener todas las aristas en memoria. Un elemento
+    (nombre, None, None) solo registra el nodo (para nodos sin aristas).
+
+      1. Se leen las aristas por bloques y se escriben como ids en archivos
+         temporales (solo el diccionario nombre -> id queda en RAM).
+      2. Se cuentan los grados para obtener los offsets.
+      3. Se reparte cada bloque en su lugar definitivo (ordenamiento por
+         conteo), respetando el orden original de los vecinos.
+    """
+    names = []
+    ids = {}
+    directory = os.path.dirname(os.path.abspath(path))
+
+    with tempfile.TemporaryDirectory(dir=directory) as temp_dir:
+        temp_paths = [os.path.join(temp_dir, name) for name in ('src', 'dst', 'w')]
+        buffers = [array.array('i'), array.array('i'), array.array('d')]
+        num_edges = 0
+
+        # 1. Primera pasada: nombres -> ids, aristas a disco por bloques
+        with open(temp_paths[0], 'wb') as f_src, open(temp_paths[1], 'wb') as f_dst, \
+                open(temp_paths[2], 'wb') as f_w:
+            files = (f_src, f_dst, f_w)
+            for u_name, v_name, weight in read_edges():
+                for name in (u_name, v_name):
+                    if name is not None and name not in ids:
+                        ids[name] = len(names)
+                        names.append(name)
+                if v_name is None:
+                    continue
+                buffers[0].append(ids[u_name])
+                buffers[1].append(ids[v_name])
+                buffers[2].append(weight)
+                if len(buffers[0]) >= chunk_edges:
+                    num_edges += len(buffers[0])
+                    for buffer, f in zip(buffers, files):
+                        buffer.tofile(f)
+                        del buffer[:]
+            num_edges += len(buffers[0])
+            for buffer, f in zip(buffers, files):
+                buffer.tofile(f)
+
+        num_nodes = len(names)
+        sources, destinations, costs = (
+            np.fromfile(temp_path, dtype=dtype) if num_edges == 0 else
+            np.memmap(temp_path, dtype=dtype, mode='r')
+            for temp_path, dtype in zip(temp_paths, (np.int32, np.int32, np.float64)))
+
+        # 2. Grados -> offsets
+        degrees = np.zeros(num_nodes, dtype=np.int64)
+        for begin in range(0, num_edges, chunk_edges):
+            degrees += np.bincount(sources[begin:begin + chunk_edges], minlength=num_nodes)
+
+        offsets, targets, weights = _create_file(path, num_nodes, num_edges,
+                                                 np.float64, names)
+        offsets[0] = 0
+        np.cumsum(degrees, out=offsets[1:])
+
+        # 3. Segunda pasada: cada arista a su posición final
+        cursor = np.array(offsets[:-1])
+        for begin in range(0, num_edges, chunk_edges):
+            chunk_sources = np.asarray(sources[begin:begin + chunk_edges])
+            order = np.argsort(chunk_sources, kind='stable')
+            sorted_sources = chunk_sources[order]
+
+            # Posición de cada arista dentro del grupo de su nodo origen
+            index = np.arange(len(order))
+            new_group = np.ones(len(order), dtype=bool)
+            new_group[1:] = sorted_sources[1:] != sorted_sources[:-1]
+            rank = index - np.maximum.accumulate(np.where(new_group, index, 0))
+
+            positions = cursor[sorted_sources] + rank
+            targets[positions] = np.asarray(destinations[begin:begin + chunk_edges])[order]
+            weights[positions] = np.asarray(costs[begin:begin + chunk_edges])[order]
+            cursor += np.bincount(chunk_sources, minlength=num_nodes)
+
+        for array_map in (offsets, targets, weights):
+            if isinstance(array_map, np.memmap):
+                array_map.flush()
+        # Soltamos los memmaps antes de borrar los temporales (Windows lo exige)
+        del sources, destinations, costs
+
+
+def convert_edge_list(text_path, path, directed=True, default_weight=1.0,
+                      chunk_edges=1 << 20):
+    """
+    Convierte un archivo de aristas "origen destino [costo]" (el mismo formato
+    de GrafoCSR.from_edge_list) al formato de disco.
+    """
+    def read_edges():
+        with open(text_path, encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                parts = line.split()
+                if len(parts) not in (2, 3):
+                    raise ValueError(f"{text_path}:{line_number}: se esperaba "
+                                     f"'origen destino [costo]', se leyó: {line!r}")
+                weight = float(parts[2]) if len(parts) == 3 else default_weight
+                yield parts[0], parts[1], weight
+                if not directed:
+                    yield parts[1], parts[0], weight
+
+    _convert_edges(read_edges, path, chunk_edges)
+
+
+def convert_adjacency_list(text_path, path, default_weight=1.0, chunk_edges=1 << 20):
+    """
+    Convierte un archivo de listas de adyacencia al formato de disco.
+
+    Cada línea tiene la forma "nodo vecino1 vecino2[:costo] ...": el primer
+    nombre es el nodo y los demás sus vecinos, con un costo opcional después
+    de ':'. Un nodo sin vecinos aparece solo en su línea.
+    """
+    def read_edges():
+        with open(text_path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                node, *neighbors = line.split()
+                yield node, None, None  # El nodo existe aunque no tenga vecinos
+                for neighbor in neighbors:
+                    name, _, cost = neighbor.partition(':')
+                    yield node, name, float(cost) if cost else default_weight
+
+    _convert_edges(read_edges, path, chunk_edges)
+
+
+# --- Lectura ---
+
+class _NameTable:
+    """Lista de nombres de solo lectura que decodifica cada nombre del archivo al pedirlo."""
+
+    def __init__(self, name_offsets, name_bytes):
+        self.name_offsets = name_offsets
+        self.name_bytes = name_bytes
+
+    def raw(self, node_id):
+        begin, end = self.name_offsets[node_id], self.name_offsets[node_id + 1]
+        return self.name_bytes[begin:end].tobytes()
+
+    def __getitem__(self, node_id):
+        return self.raw(node_id).decode('utf-8')
+
+    def __len__(self):
+        return len(self.name_offsets) - 1
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class _NameIndex:
+    """
+    Mapeo nombre -> id sin diccionario: búsqueda binaria sobre 'name_order'
+    (los ids ordenados por nombre). Cuesta O(log n) lecturas del archivo.
+    """
+
+    def __init__(self, names, name_order):
+        self.names = names
+        self.name_order = name_order
+
+    def get(self, name, default=None):
+        # (Un nombre que no es str nunca está en el archivo: mejor fallar que
+        #  devolver 'default' y que la búsqueda crea que el nodo no tiene vecinos)
+        if not isinstance(name, str):
+            raise TypeError(f"Los nodos de este grafo en disco se llaman con str, "
+                            f"llegó {name!r} de tipo {type(name).__name__}")
+        key = name.encode('utf-8')
+        low, high = 0, len(self.name_order)
+        while low < high:
+            middle = (low + high) // 2
+            if self.names.raw(int(self.name_order[middle])) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self.name_order):
+            node_id = int(self.name_order[low])
+            if self.names.raw(node_id) == key:
+                return node_id
+        return default
+
+    def __getitem__(self, name):
+        node_id = self.get(name)
+        if node_id is None:
+            raise KeyError(name)
+        return node_id
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+
+class _IdentityIndex:
+    """Mapeo nombre -> id cuando los nodos se llaman 0..n-1 (el nombre ES el id)."""
+
+    def __init__(self, num_nodes):
+        self.num_nodes = num_nodes
+
+    def get(self, name, default=None):
+        if isinstance(name, (int, np.integer)) and 0 <= name < self.num_nodes:
+            return int(name)
+        return default
+
+    def __getitem__(self, name):
+        node_id = self.get(name)
+        if node_id is None:
+            raise KeyError(name)
+        return node_id
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+
+class GrafoDisco(GrafoCSR):
+    """
+    Un GrafoCSR cuyos arreglos viven en un archivo (numpy.memmap).
+
+    Se usa exactamente igual que un GrafoCSR (bfs, ucs, generic_graph_search
+    lo aceptan sin cambios), pero abrirlo no lee el archivo: solo se cargan
+    las páginas de las aristas que la búsqueda visita. Los nombres tampoco se
+    cargan; se decodifican al pedirlos y se buscan con búsqueda binaria.
+    """
+
+    def __init__(self, path):
+        # No llamamos a GrafoCSR.__init__: construiría la lista de nombres y
+        # el diccionario de ids en memoria, justo lo que queremos evitar.
+        with open(path, 'rb') as f:
+            header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"'{path}' no es un grafo en disco (archivo demasiado corto)")
+        magic, version, flags, num_nodes, num_edges, names_size = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"'{path}' no es un grafo en disco (magia {magic!r})")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"'{path}': versión de formato {version} no soportada")
+
+        weight_dtype = np.float64 if flags & FLAG_FLOAT_WEIGHTS else np.int64
+        has_names = bool(flags & FLAG_NAMES)
+        sections, _ = _layout(num_nodes, num_edges, weight_dtype, names_size, has_names)
+
+        self.path = path
+        self.offsets = _map_section(path, sections['offsets'], 'r')
+        self.targets = _map_section(path, sections['targets'], 'r')
+        self.weights = _map_section(path, sections['weights'], 'r')
+        if has_names:
+            self.names = _NameTable(_map_section(path, sections['name_offsets'], 'r'),
+                                    _map_section(path, sections['name_bytes'], 'r'))
+            self.ids = _NameIndex(self.names, _map_section(path, sections['name_order'], 'r'))
+        else:
+            self.names = range(num_nodes)
+            self.ids = _IdentityIndex(num_nodes)
+        self.version = 0
+        self._reversed = None
+
+    def keys(self):
+        return iter(self.names)
+
+
+def open_graph(path):
+    """Abre un grafo guardado con save_graph / convert_edge_list / convert_adjacency_list."""
+    return GrafoDisco(path)
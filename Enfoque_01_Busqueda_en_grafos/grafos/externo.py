@@ -0,0 +1,150 @@
+import array
+import heapq
+import os
+import tempfile
+
+import numpy as np
+
+# --- Archivos ordenados para búsquedas en memoria externa ---
+#
+# Una "corrida" (run) es un archivo binario con enteros sin signo de 64 bits,
+# ordenados y sin repetir. Con ellos se arma una BFS cuya frontera vive en
+# disco: cada capa se escribe en corridas, las corridas se mezclan (merge)
+# leyéndolas por bloques y los duplicados se quitan al mezclar. Nunca hace
+# falta tener una capa completa en memoria.
+#
+# Cada corrida abierta en una mezcla ocupa un archivo y un bloque de lectura,
+# así que una mezcla junta como mucho 'max_fan_in' archivos. Con más
+# corridas se mezcla en varias pasadas (grupos de max_fan_in en archivos
+# intermedios) hasta que queden pocas.
+
+DTYPE = np.uint64
+
+
+def write_sorted_run(values, path):
+    """Ordena 'values' (enteros >= 0), quita repetidos y los escribe en 'path'. Devuelve cuántos."""
+    run = np.unique(np.asarray(values, dtype=DTYPE))
+    run.tofile(path)
+    return len(run)
+
+
+def iter_sorted_file(path, chunk_items=1 << 16):
+    """Recorre una corrida de principio a fin leyendo 'chunk_items' valores a la vez."""
+    with open(path, 'rb') as f:
+        while True:
+            chunk = np.fromfile(f, dtype=DTYPE, count=chunk_items)
+            if len(chunk) == 0:
+                return
+            yield from chunk.tolist()
+
+
+def run_length(path):
+    return os.path.getsize(path) // np.dtype(DTYPE).itemsize
+
+
+def contains_sorted(path, value):
+    """¿Está 'value' en la corrida? Búsqueda binaria sobre el archivo (numpy.memmap)."""
+    if run_length(path) == 0:
+        return False
+    values = np.memmap(path, dtype=DTYPE, mode='r')
+    position = int(np.searchsorted(values, value))
+    return position < len(values) and int(values[position]) == value
+
+
+def merge_runs(run_paths, out_path, exclude_paths=(), chunk_items=1 << 16, max_fan_in=16):
+    """
+    Mezcla varias corridas en una sola (ordenada, sin repetidos), quitando
+    los valores que aparezcan en alguna de 'exclude_paths'. Todo se lee y se
+    escribe por bloques de 'chunk_items' valores y nunca hay más de
+    'max_fan_in' archivos abiertos para leer, así que la memoria usada es
+    ~max_fan_in * chunk_items valores, sin importar cuántas corridas haya.
+
+    Returns:
+        (written, dropped): cuántos valores se escribieron y cuántos se
+        descartaron (repetidos entre corridas o presentes en los excluidos).
+    """
+    if max_fan_in < 2:
+        raise ValueError("merge_runs necesita max_fan_in >= 2")
+    directory = os.path.dirname(os.path.abspath(out_path))
+    temporary = []
+    try:
+        # 1. Si no caben todos en una mezcla, los excluidos se juntan en a lo
+        #    más la mitad de los lugares y las corridas en el resto
+        #    (Solo cuentan como descartados los repetidos de las corridas:
+        #    los excluidos no son valores nuevos)
+        run_paths, exclude_paths = list(run_paths), list(exclude_paths)
+        dropped = 0
+        if len(run_paths) + len(exclude_paths) > max_fan_in:
+            exclude_paths, _ = _reduce_runs(exclude_paths, max_fan_in // 2, directory,
+                                            chunk_items, max_fan_in, temporary)
+            run_paths, dropped = _reduce_runs(run_paths, max_fan_in - len(exclude_paths),
+                                              directory, chunk_items, max_fan_in, temporary)
+
+        # 2. La última pasada: corridas + excluidos -> out_path
+        written, last_dropped = _merge_once(run_paths, out_path, exclude_paths, chunk_items)
+        return written, dropped + last_dropped
+    finally:
+        for path in temporary:
+            os.remove(path)
+
+
+def _reduce_runs(paths, limit, directory, chunk_items, max_fan_in, temporary):
+    """
+    Mezcla 'paths' en grupos de max_fan_in (pasada tras pasada) hasta que
+    queden a lo más 'limit' archivos. Los intermedios se anotan en
+    'temporary' para borrarlos al final; los de una pasada ya consumida se
+    borran en cuanto se usan. Devuelve (archivos, repetidos descartados).
+    """
+    dropped = 0
+    while len(paths) > limit:
+        merged = []
+        for begin in range(0, len(paths), max_fan_in):
+            group = paths[begin:begin + max_fan_in]
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            handle, path = tempfile.mkstemp(suffix='.bin', dir=directory)
+            os.close(handle)
+            temporary.append(path)
+            dropped += _merge_once(group, path, (), chunk_items)[1]
+            merged.append(path)
+            for used in group:
+                if used in temporary:
+                    temporary.remove(used)
+                    os.remove(used)
+        paths = merged
+    return paths, dropped
+
+
+def _merge_once(run_paths, out_path, exclude_paths, chunk_items):
+    """Una sola pasada de mezcla (ver merge_runs); abre todos los archivos a la vez."""
+    merged = heapq.merge(*(iter_sorted_file(path, chunk_items) for path in run_paths))
+    excluded = heapq.merge(*(iter_sorted_file(path, chunk_items) for path in exclude_paths))
+    next_excluded = next(excluded, None)
+
+    buffer = array.array('Q')
+    written = 0
+    dropped = 0
+    previous = None
+    with open(out_path, 'wb') as out:
+        for value in merged:
+            if value == previous:
+                dropped += 1
+                continue  # Repetido (venía en dos corridas)
+            previous = value
+
+            # Avanzamos la lista de excluidos hasta alcanzar 'value'
+            while next_excluded is not None and next_excluded < value:
+                next_excluded = next(excluded, None)
+            if next_excluded == value:
+                dropped += 1
+                continue  # Ya estaba en una capa anterior
+
+            buffer.append(value)
+            if len(buffer) >= chunk_items:
+                buffer.tofile(out)
+                written += len(buffer)
+                del buffer[:]
+        buffer.tofile(out)
+        written += len(buffer)
+    return written, dropped
@@ -0,0 +1,70 @@
+import numpy as np
+
+from .csr import GrafoCSR
+
+
+# --- Generadores de grafos sintéticos (no dirigidos, reproducibles) ---
+#
+# Todos devuelven un GrafoCSR con nodos llamados 0, 1, 2, ... (enteros) y
+# costos enteros entre 1 y max_weight. Cada arista aparece en ambos sentidos.
+
+
+def _symmetric_csr(sources, targets, num_nodes, rng, max_weight):
+    """Ayudante: añade las aristas inversas y arma el CSR."""
+    # Quitamos lazos (u -> u), que no aportan nada a una búsqueda
+    keep = sources != targets
+    sources, targets = sources[keep], targets[keep]
+    weights = rng.integers(1, max_weight + 1, len(sources))
+    return GrafoCSR.from_arrays(np.concatenate([sources, targets]),
+                                np.concatenate([targets, sources]),
+                                np.concatenate([weights, weights]),
+                                range(num_nodes))
+
+
+def grid_graph(num_nodes, seed=0, max_weight=10):
+    """
+    Rejilla cuadrada de lado sqrt(num_nodes), con vecinos arriba/abajo/izquierda/derecha.
+    (El número real de nodos es lado^2).
+    """
+    rng = np.random.default_rng(seed)
+    side = max(1, int(round(num_nodes ** 0.5)))
+    ids = np.arange(side * side, dtype=np.int64).reshape(side, side)
+
+    # Aristas horizontales y verticales
+    sources = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    targets = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    return _symmetric_csr(sources, targets, side * side, rng, max_weight)
+
+
+def erdos_renyi_graph(num_nodes, avg_degree=8, seed=0, max_weight=10):
+    """Grafo aleatorio de Erdős–Rényi (modelo G(n, m)) con grado medio 'avg_degree'."""
+    rng = np.random.default_rng(seed)
+    num_edges = num_nodes * avg_degree // 2
+    sources = rng.integers(0, num_nodes, num_edges)
+    targets = rng.integers(0, num_nodes, num_edges)
+    return _symmetric_csr(sources, targets, num_nodes, rng, max_weight)
+
+
+def scale_free_graph(num_nodes, avg_degree=8, exponent=2.5, seed=0, max_weight=10):
+    """
+    Grafo libre de escala (grados con ley de potencias), modelo de Chung–Lu.
+
+    Cada nodo i recibe un peso w_i ~ (i + 1)^(-1 / (exponent - 1)) y los
+    extremos de cada arista se eligen con probabilidad proporcional a w.
+    Así unos pocos "hubs" tienen grado enorme, como en redes reales, y se
+    genera todo con numpy (sirve hasta 10^7 nodos).
+    """
+    rng = np.random.default_rng(seed)
+    num_edges = num_nodes * avg_degree // 2
+    weights = (np.arange(num_nodes) + 1.0) ** (-1.0 / (exponent - 1.0))
+    probabilities = weights / weights.sum()
+    sources = rng.choice(num_nodes, size=num_edges, p=probabilities)
+    targets = rng.choice(num_nodes, size=num_edges, p=probabilities)
+    return _symmetric_csr(sources, targets, num_nodes, rng, max_weight)
+
+
+GENERATORS = {
+    'grid': grid_graph,
+    'erdos_renyi': erdos_renyi_graph,
+    'scale_free': scale_free_graph,
+}
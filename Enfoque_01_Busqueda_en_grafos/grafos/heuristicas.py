@@ -0,0 +1,114 @@
+from collections import OrderedDict
+
+# --- Heurísticas como funciones (con caché) ---
+#
+# A* y Voraz leen la heurística con heuristics.get(nodo, default), igual que
+# un diccionario. Cuando h(n) no está precalculada sino que es una función
+# (quizá cara: distancias geográficas, tablas de patrones, un modelo...),
+# HeuristicCache la envuelve con la misma interfaz y recuerda los valores
+# ya calculados (caché LRU: al llenarse, olvida el menos usado).
+#
+# Con vectorized=True la función recibe una LISTA de nodos y devuelve sus
+# valores (por ejemplo, un arreglo de numpy): las búsquedas llaman a
+# get_many() con todos los vecinos nuevos de un nodo a la vez, así que se
+# paga una sola llamada de numpy por expansión en lugar de una por vecino.
+
+
+class HeuristicCache:
+    """
+    Heurística h(n) calculada a pedido, con caché LRU.
+
+    Args:
+        function (callable): h(nodo) -> valor, o con vectorized=True
+                             h([nodos]) -> valores (lista o arreglo de numpy).
+        vectorized (bool): Si la función evalúa lotes de nodos.
+        maxsize (int | None): Máximo de valores guardados (None = sin límite).
+
+    Mientras un nodo siga en la caché su h(n) se calcula una sola vez.
+    'hits', 'misses', 'calls' (llamadas a la función) y 'evictions' sirven
+    para ver cuánto trabajo se ahorró.
+    """
+
+    def __init__(self, function, vectorized=False, maxsize=1 << 16):
+        self.function = function
+        self.vectorized = vectorized
+        self.maxsize = maxsize
+        self.values = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.calls = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.values)
+
+    def _store(self, node, value):
+        self.values[node] = value
+        if self.maxsize is not None and len(self.values) > self.maxsize:
+            self.values.popitem(last=False)  # El menos usado recientemente
+            self.evictions += 1
+
+    def _evaluate(self, nodes):
+        """Llama a la función con los nodos que faltan (uno o un lote)."""
+        self.calls += 1
+        if not self.vectorized:
+            return [self.function(nodes[0])]
+        values = self.function(nodes)
+        # Con numpy, pasamos a números de Python para que f = g + h no sea np.float64
+        return values.tolist() if hasattr(values, 'tolist') else list(values)
+
+    def get(self, node, default=None):
+        """h(node), como heuristics.get(node, default) con un diccionario."""
+        values = self.values
+        if node in values:
+            self.hits += 1
+            values.move_to_end(node)
+            return values[node]
+        self.misses += 1
+        value = self._evaluate([node])[0]
+        self._store(node, value)
+        return value
+
+    def get_many(self, nodes):
+        """h(n) de varios nodos; los que no están en la caché se calculan juntos."""
+        if not self.vectorized:
+            return [self.get(node) for node in nodes]
+
+        values = self.values
+        missing = {}  # (dict para no repetir nodos y conservar el orden)
+        for node in nodes:
+            if node in values:
+                self.hits += 1
+                values.move_to_end(node)
+            else:
+                missing[node] = None
+        missing = list(missing)
+        if missing:
+            self.misses += len(missing)
+            computed = dict(zip(missing, self._evaluate(missing)))
+            for node in missing:
+                self._store(node, computed[node])
+        else:
+            computed = {}
+        # (Si la caché es muy chica, un valor recién calculado pudo salir ya)
+        return [computed[node] if node in computed else values[node] for node in nodes]
+
+    def clear(self):
+        self.values.clear()
+
+    def __repr__(self):
+        return (f"HeuristicCache(llamadas={self.calls}, aciertos={self.hits}, "
+                f"fallos={self.misses}, desalojos={self.evictions}, guardados={len(self)})")
+
+
+def as_heuristic(heuristics, vectorized=False, maxsize=1 << 16):
+    """
+    Normaliza lo que se pasa como 'heuristics' a A* / Voraz: un diccionario
+    (o cualquier objeto con .get) se usa tal cual; una función se envuelve
+    en una HeuristicCache.
+    """
+    if hasattr(heuristics, 'get'):
+        return heuristics
+    if callable(heuristics):
+        return HeuristicCache(heuristics, vectorized=vectorized, maxsize=maxsize)
+    raise TypeError("heuristics debe ser un diccionario, un objeto con .get() o una función")
@@ -0,0 +1,270 @@
+import heapq
+
+import numpy as np
+
+from .csr import GrafoCSR
+from .heuristicas import HeuristicCache
+
+# --- Heurística ALT (A*, Landmarks y desigualdad Triangular) ---
+#
+# Para grafos sin coordenadas no hay una "distancia en línea recta". ALT la
+# reemplaza con unos pocos nodos de referencia ("hitos", landmarks) L y sus
+# distancias exactas, calculadas UNA vez con Dijkstra:
+#
+#     from_landmark[i, v] = d(L_i, v)        to_landmark[i, v] = d(v, L_i)
+#
+# Por la desigualdad triangular, para cualquier hito L:
+#
+#     d(v, t) >= d(L, t) - d(L, v)      y      d(v, t) >= d(v, L) - d(t, L)
+#
+# así que el máximo de esas cotas sobre todos los hitos es una heurística
+# admisible (y consistente) para ir de v a t. Las tablas son arreglos de
+# numpy (k x n) y se guardan en disco para no repetir el preprocesamiento.
+
+
+def _shortest_path_tree_ids(graph, source_id):
+    """
+    Dijkstra (UCS sin objetivo) sobre ids: costo mínimo desde source_id a
+    cada nodo y el padre de cada nodo en el árbol de caminos más cortos.
+    """
+    cost = [float('inf')] * graph.num_nodes
+    parent = [-1] * graph.num_nodes
+    cost[source_id] = 0
+    priority_queue = [(0, source_id)]
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    while priority_queue:
+        current_cost, current_node = heapq.heappop(priority_queue)
+        if current_cost > cost[current_node]:
+            continue  # Entrada vieja
+        begin, end = offsets[current_node], offsets[current_node + 1]
+        for neighbor, edge_cost in zip(targets[begin:end].tolist(), weights[begin:end].tolist()):
+            new_cost = current_cost + edge_cost
+            if new_cost < cost[neighbor]:
+                cost[neighbor] = new_cost
+                parent[neighbor] = current_node
+                heapq.heappush(priority_queue, (new_cost, neighbor))
+    return np.array(cost, dtype=np.float64), np.array(parent, dtype=np.int64)
+
+
+def _dijkstra_ids(graph, source_id):
+    return _shortest_path_tree_ids(graph, source_id)[0]
+
+
+class Landmarks:
+    """
+    Tablas de distancias de ALT para un GrafoCSR.
+
+    Atributos:
+        landmark_ids (int64, k): ids de los hitos.
+        from_landmark (float64, k x n): d(hito, v).
+        to_landmark (float64, k x n): d(v, hito) (el mismo arreglo si el
+                                      grafo es no dirigido).
+        undirected (bool): si se construyó con una sola tabla.
+
+    Se construye con Landmarks.build(graph, ...) o se lee con
+    Landmarks.load(path, graph). heuristic(goal) da la heurística para A*.
+    """
+
+    STRATEGIES = ('farthest', 'avoid')
+
+    def __init__(self, graph, landmark_ids, from_landmark, to_landmark, undirected=False):
+        self.graph = graph
+        self.landmark_ids = np.asarray(landmark_ids, dtype=np.int64)
+        self.from_landmark = from_landmark
+        self.to_landmark = to_landmark
+        self.undirected = undirected
+
+    # --- Preprocesamiento ---
+
+    @classmethod
+    def build(cls, graph, num_landmarks=8, strategy='avoid', undirected=False, seed=0):
+        """
+        Elige los hitos y calcula sus tablas (un Dijkstra por hito y sentido).
+
+        Args:
+            graph (GrafoCSR): El grafo (los costos no pueden ser negativos).
+            num_landmarks (int): Cuántos hitos (k). Más hitos = mejor cota,
+                                 más memoria (2 * k * n * 8 bytes).
+            strategy (str): 'farthest': cada hito nuevo es el nodo más lejano
+                            a los ya elegidos. 'avoid': el hito nuevo cae en
+                            la zona que los hitos actuales acotan PEOR
+                            (Goldberg y Harrelson); suele dar mejores cotas.
+            undirected (bool): Si el grafo es simétrico, basta una tabla.
+            seed (int): Semilla para el nodo de partida.
+        """
+        if strategy not in cls.STRATEGIES:
+            raise ValueError(f"Estrategia desconocida: '{strategy}' (usa {cls.STRATEGIES})")
+        if not isinstance(graph, GrafoCSR):
+            raise TypeError("Landmarks necesita un GrafoCSR (usa GrafoCSR.from_dict)")
+        num_landmarks = min(num_landmarks, graph.num_nodes)
+        rng = np.random.default_rng(seed)
+        reverse = graph if undirected else graph.reversed()
+
+        landmarks = cls(graph, [], np.empty((0, graph.num_nodes)), np.empty((0, graph.num_nodes)),
+                        undirected=undirected)
+        # 1. El primer hito: el nodo más lejano a uno al azar
+        first = int(rng.integers(graph.num_nodes))
+        candidate = _farthest(_dijkstra_ids(graph, first), first)
+
+        for _ in range(num_landmarks):
+            # 2. Tablas del hito nuevo: un Dijkstra hacia adelante y otro hacia atrás
+            forward = _dijkstra_ids(graph, candidate)
+            backward = forward if undirected else _dijkstra_ids(reverse, candidate)
+            landmarks._append(candidate, forward, backward)
+            if len(landmarks.landmark_ids) == num_landmarks:
+                break
+
+            # 3. Elegimos el siguiente
+            if strategy == 'farthest':
+                # El más lejano a TODOS los hitos (maximiza la menor distancia,
+                # en cualquier sentido), entre los nodos conectados con alguno
+                distances = np.fmin(landmarks.from_landmark, landmarks.to_landmark).min(axis=0)
+                distances[~np.isfinite(distances)] = -1
+                distances[landmarks.landmark_ids] = -1
+                candidate = int(np.argmax(distances))
+            else:
+                candidate = landmarks._avoid_candidate(int(rng.integers(graph.num_nodes)))
+            if candidate in landmarks.landmark_ids.tolist():
+                # (Grafo casi sin aristas: cualquier nodo nuevo sirve)
+                free = np.setdiff1d(np.arange(graph.num_nodes), landmarks.landmark_ids)
+                candidate = int(rng.choice(free))
+        return landmarks
+
+    def _append(self, landmark_id, forward, backward):
+        self.landmark_ids = np.append(self.landmark_ids, landmark_id)
+        self.from_landmark = np.vstack([self.from_landmark, forward])
+        self.to_landmark = (self.from_landmark if backward is forward
+                            else np.vstack([self.to_landmark, backward]))
+
+    def _avoid_candidate(self, root):
+        """
+        Estrategia 'avoid': en el árbol de caminos más cortos desde 'root',
+        cada nodo pesa lo mal que lo acotan los hitos actuales
+        (d(root, v) - cota(root, v)). Bajamos por el subárbol más pesado sin
+        hitos hasta una hoja: ese es el hito nuevo.
+        """
+        cost, parent = _shortest_path_tree_ids(self.graph, root)
+        reached = np.isfinite(cost)
+        weight = np.zeros(len(cost))
+        weight[reached] = cost[reached] - self.lower_bounds_ids(root, np.flatnonzero(reached),
+                                                                from_source=True)
+
+        # Sumamos los pesos de cada subárbol (hijos antes que padres:
+        # en orden de costo decreciente), anulando los que contienen un hito
+        has_landmark = np.zeros(len(cost), dtype=bool)
+        has_landmark[self.landmark_ids] = True
+        size = weight.copy()
+        order = np.argsort(cost)[::-1]
+        order = order[reached[order]].tolist()
+        parent_list = parent.tolist()
+        size_list, landmark_list = size.tolist(), has_landmark.tolist()
+        for v in order:
+            p = parent_list[v]
+            if p >= 0:
+                size_list[p] += size_list[v]
+                landmark_list[p] = landmark_list[p] or landmark_list[v]
+        size = np.where(landmark_list, 0.0, size_list)
+
+        # Bajamos desde la raíz siguiendo al hijo de mayor tamaño
+        children = {}
+        for v in order:
+            if parent_list[v] >= 0:
+                children.setdefault(parent_list[v], []).append(v)
+        node = root
+        while node in children:
+            best = max(children[node], key=lambda child: size[child])
+            if size[best] <= 0:
+                break
+            node = best
+        if node in self.landmark_ids.tolist():
+            # No quedó zona mal acotada: caemos en el más lejano
+            return _farthest(cost, root)
+        return node
+
+    # --- Consultas ---
+
+    def lower_bounds_ids(self, target_id, node_ids, from_source=False):
+        """
+        Cota inferior de d(v, target) para cada v de node_ids (vectorizado).
+        Con from_source=True acota d(target, v) en su lugar.
+        """
+        node_ids = np.asarray(node_ids, dtype=np.int64)
+        if len(self.landmark_ids) == 0:
+            return np.zeros(len(node_ids))
+        # (inf - inf da NaN, "sin información"; fmax ignora los NaN)
+        with np.errstate(invalid='ignore'):
+            return np.fmax(self._bounds(target_id, node_ids, from_source), 0.0)
+
+    def _bounds(self, target_id, node_ids, from_source):
+        if from_source:
+            # d(s, v) >= d(L, v) - d(L, s)   y   d(s, v) >= d(s, L) - d(v, L)
+            first = self.from_landmark[:, node_ids] - self.from_landmark[:, [target_id]]
+            second = self.to_landmark[:, [target_id]] - self.to_landmark[:, node_ids]
+        else:
+            # d(v, t) >= d(L, t) - d(L, v)   y   d(v, t) >= d(v, L) - d(t, L)
+            first = self.from_landmark[:, [target_id]] - self.from_landmark[:, node_ids]
+            second = self.to_landmark[:, node_ids] - self.to_landmark[:, [target_id]]
+        return np.fmax(np.fmax.reduce(first, axis=0), np.fmax.reduce(second, axis=0))
+
+    def heuristic(self, goal_node, maxsize=1 << 16):
+        """
+        Heurística admisible para ir hacia 'goal_node', lista para a_star_search.
+        Es una HeuristicCache vectorizada: A* calcula la cota de todos los
+        vecinos nuevos de un nodo en una sola operación de numpy.
+        """
+        graph = self.graph
+        goal_id = graph.id_of(goal_node)
+
+        def bounds(nodes):
+            node_ids = np.fromiter((graph.id_of(node) for node in nodes), dtype=np.int64,
+                                   count=len(nodes))
+            return self.lower_bounds_ids(goal_id, node_ids)
+
+        return HeuristicCache(bounds, vectorized=True, maxsize=maxsize)
+
+    def memory_bytes(self):
+        total = self.from_landmark.nbytes
+        if self.to_landmark is not self.from_landmark:
+            total += self.to_landmark.nbytes
+        return total
+
+    # --- Guardar y leer ---
+
+    def save(self, path):
+        """Guarda los hitos y sus tablas (formato .npz de numpy, sin comprimir)."""
+        with open(path, 'wb') as f:
+            np.savez(f, landmark_ids=self.landmark_ids, from_landmark=self.from_landmark,
+                     to_landmark=(self.to_landmark if self.to_landmark is not self.from_landmark
+                                  else np.empty((0, 0))),
+                     fingerprint=np.array(self.graph.fingerprint()),
+                     undirected=np.array(self.undirected))
+
+    @classmethod
+    def load(cls, path, graph, undirected=None):
+        """
+        Lee unas tablas guardadas con save(). Deben ser del mismo grafo (se
+        compara la huella de su contenido, no solo el tamaño) y, si se pasa
+        'undirected', haberse construido con el mismo valor.
+        """
+        with np.load(path) as data:
+            if str(data['fingerprint']) != graph.fingerprint():
+                raise ValueError(f"Las tablas de '{path}' son de otro grafo")
+            saved_undirected = bool(data['undirected'])
+            if undirected is not None and undirected != saved_undirected:
+                raise ValueError(f"Las tablas de '{path}' se construyeron con "
+                                 f"undirected={saved_undirected}")
+            from_landmark = data['from_landmark']
+            to_landmark = data['to_landmark'] if data['to_landmark'].size else from_landmark
+            return cls(graph, data['landmark_ids'], from_landmark, to_landmark,
+                       undirected=saved_undirected)
+
+    def __repr__(self):
+        return (f"Landmarks(hitos={self.landmark_ids.tolist()}, "
+                f"memoria={self.memory_bytes()} bytes)")
+
+
+def _farthest(cost, default):
+    """El nodo alcanzable más lejano según 'cost' (o 'default' si no hay otro)."""
+    finite = np.where(np.isfinite(cost), cost, -1)
+    node = int(np.argmax(finite))
+    return node if finite[node] > 0 else default
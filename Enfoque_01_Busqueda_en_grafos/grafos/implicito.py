@@ -0,0 +1,162 @@
+import random
+
+# --- Grafos implícitos (espacios de estados) ---
+#
+# En muchos problemas (rompecabezas, planificación) el grafo es enorme y no se
+# puede escribir como diccionario: solo sabemos calcular los vecinos de un
+# estado. GrafoImplicito envuelve esa "función sucesora" con la misma interfaz
+# que GrafoCSR (get, cost_neighbor_edges, neighbor_cost_edges), así que las
+# búsquedas generan los estados SOLO cuando los expanden.
+#
+# Para que visited/path_from/g_costs guarden enteros en lugar de tuplas,
+# StatePacker empaqueta un estado (una tupla de números pequeños) en un int.
+
+
+class StatePacker:
+    """
+    Empaqueta una tupla de 'num_fields' enteros (cada uno de 0 a 2^bits - 1)
+    en un solo int de Python: el campo i ocupa los bits [i*bits, (i+1)*bits).
+
+    Un int pequeño ocupa mucha menos memoria que una tupla, se compara y se
+    hashea más rápido, y los campos se leen y cambian con operaciones de bits.
+    """
+
+    def __init__(self, num_fields, bits_per_field):
+        self.num_fields = num_fields
+        self.bits = bits_per_field
+        self.mask = (1 << bits_per_field) - 1
+
+    def pack(self, values):
+        if len(values) != self.num_fields:
+            raise ValueError(f"Se esperaban {self.num_fields} campos, llegaron {len(values)}")
+        code = 0
+        for i, value in enumerate(values):
+            if not 0 <= value <= self.mask:
+                raise ValueError(f"El campo {i} vale {value}, fuera de 0..{self.mask}")
+            code |= value << (i * self.bits)
+        return code
+
+    def unpack(self, code):
+        return tuple((code >> (i * self.bits)) & self.mask for i in range(self.num_fields))
+
+    def field(self, code, i):
+        return (code >> (i * self.bits)) & self.mask
+
+    def with_field(self, code, i, value):
+        shift = i * self.bits
+        return (code & ~(self.mask << shift)) | (value << shift)
+
+
+class _HeuristicView:
+    """Adaptador para usar una función h(estado) donde las búsquedas esperan un dict."""
+
+    def __init__(self, function):
+        self.function = function
+
+    def get(self, state, default=None):
+        return self.function(state)
+
+
+class GrafoImplicito:
+    """
+    Grafo definido por una función sucesora en lugar de listas de adyacencia.
+
+    Args:
+        successors (callable): successors(estado) -> iterable de (vecino, costo).
+        heuristic (callable, optional): h(estado), para A* / Voraz.
+
+    Las búsquedas lo aceptan igual que un GrafoCSR. 'expansions' cuenta
+    cuántas veces se llamó a la función sucesora (estados generados a pedido).
+    """
+
+    def __init__(self, successors, heuristic=None):
+        self.successors = successors
+        self.heuristics = _HeuristicView(heuristic) if heuristic is not None else {}
+        self.expansions = 0
+
+    def _edges(self, state):
+        self.expansions += 1
+        return self.successors(state)
+
+    # --- Interfaz compatible con los diccionarios de los ejemplos ---
+
+    def __contains__(self, state):
+        return True  # Cualquier estado existe; sus vecinos se calculan al pedirlos
+
+    def get(self, state, default=None):
+        """Igual que graph.get(nodo, []) en formato 'lista': solo los vecinos."""
+        return [neighbor for neighbor, _ in self._edges(state)]
+
+    def cost_neighbor_edges(self, state):
+        """Aristas en formato (costo, vecino), como las usa UCS."""
+        return [(cost, neighbor) for neighbor, cost in self._edges(state)]
+
+    def neighbor_cost_edges(self, state):
+        """Aristas en formato (vecino, costo), como las usa A*."""
+        return list(self._edges(state))
+
+
+# --- Ejemplo: el rompecabezas deslizante (8-puzzle, 15-puzzle) ---
+
+class SlidingPuzzle(GrafoImplicito):
+    """
+    Rompecabezas deslizante de side x side como grafo implícito.
+
+    Cada estado es un int: una casilla por campo (4 bits para el 8-puzzle y
+    el 15-puzzle) más un campo extra con la posición del hueco (0), para no
+    tener que buscarlo. Cada movimiento cuesta 1. La heurística es la
+    distancia de Manhattan (admisible).
+    """
+
+    def __init__(self, side=3):
+        self.side = side
+        self.size = side * side
+        bits = max(1, (self.size - 1).bit_length())
+        self.packer = StatePacker(self.size + 1, bits)
+        self.goal = self.encode(tuple(range(1, self.size)) + (0,))
+
+        # Movimientos posibles desde cada posición del hueco
+        self.moves = []
+        for position in range(self.size):
+            row, col = divmod(position, side)
+            self.moves.append([r * side + c
+                               for r, c in ((row - 1, col), (row + 1, col),
+                                            (row, col - 1), (row, col + 1))
+                               if 0 <= r < side and 0 <= c < side])
+        super().__init__(self._successors, self.manhattan)
+
+    def encode(self, tiles):
+        """tiles: tupla con las fichas fila por fila (0 = hueco)."""
+        return self.packer.pack(tuple(tiles) + (tiles.index(0),))
+
+    def decode(self, state):
+        return self.packer.unpack(state)[:self.size]
+
+    def _successors(self, state):
+        packer = self.packer
+        blank = packer.field(state, self.size)
+        for target in self.moves[blank]:
+            # La ficha de 'target' se desliza al hueco
+            tile = packer.field(state, target)
+            new_state = packer.with_field(state, blank, tile)
+            new_state = packer.with_field(new_state, target, 0)
+            yield packer.with_field(new_state, self.size, target), 1
+
+    def manhattan(self, state):
+        side = self.side
+        total = 0
+        for position in range(self.size):
+            tile = self.packer.field(state, position)
+            if tile:
+                goal_row, goal_col = divmod(tile - 1, side)
+                row, col = divmod(position, side)
+                total += abs(row - goal_row) + abs(col - goal_col)
+        return total
+
+    def scrambled(self, num_moves, seed=0):
+        """Un estado a 'num_moves' movimientos aleatorios de la meta (siempre resoluble)."""
+        rng = random.Random(seed)
+        state = self.goal
+        for _ in range(num_moves):
+            state = rng.choice([neighbor for neighbor, _ in self._successors(state)])
+        return state
@@ -0,0 +1,157 @@
+import array
+import sys
+
+from .csr import GrafoCSR
+
+# --- Almacén compacto de nodos de búsqueda ---
+#
+# Antes, cada búsqueda guardaba por nodo descubierto una entrada en
+# path_from (hijo -> padre) y otra en costs/g_costs (nodo -> g), y cada
+# costo era un objeto float/int de Python. NodeArena guarda TODO en arreglos
+# paralelos indexados por un entero (el "índice" del nodo):
+#
+#   states[i]   el estado/nodo        parent[i]  índice del padre (-1 = raíz)
+#   g[i]        costo desde el inicio  h[i]       heurística guardada
+#   depth[i]    número de pasos desde el inicio (-1 = no descubierto)
+#
+# Los números viven en array.array (8 bytes cada uno, sin objetos) y el
+# camino se reconstruye siguiendo los índices de padre. Hay dos modos:
+#
+#   NodeArena()           cualquier estado; un diccionario estado -> índice.
+#   NodeArena(num_nodes)  estados 0..num_nodes-1 (ids de un GrafoCSR, por
+#                         ejemplo): el índice ES el estado, sin diccionario.
+#
+# NodeArena.for_graph(graph) elige el modo: con un GrafoCSR usa el modo denso
+# aunque los nodos tengan nombres (el índice es graph.id_of(nombre), con el
+# mapeo que el grafo ya tiene), y con cualquier otro grafo usa el diccionario.
+# El modo denso reserva ~28 bytes por nodo del grafo al empezar, así que en
+# una búsqueda que toca muy pocos nodos de un grafo enorme conviene NodeArena().
+
+
+class NodeArena:
+    """
+    Arena de nodos de búsqueda con arreglos paralelos.
+
+    Los costos se guardan como enteros ('q') mientras todos lo sean y pasan a
+    flotantes ('d') con el primer costo no entero, así UCS y A* siguen
+    devolviendo exactamente el mismo costo que con diccionarios.
+    """
+
+    __slots__ = ('index', 'ids', 'states', 'parent', 'g', 'h', 'depth', 'count')
+
+    def __init__(self, num_nodes=None):
+        self.count = 0
+        self.ids = None  # En modo denso: mapeo nombre -> índice (None = el índice es el estado)
+        if num_nodes is None:
+            self.index = {}                   # estado -> índice
+            self.states = []                  # índice -> estado
+            self.parent = array.array('q')
+            self.g = array.array('q')
+            self.h = array.array('q')
+            self.depth = array.array('i')
+        else:
+            self.index = None
+            self.states = range(num_nodes)
+            self.parent = array.array('q', bytes(8 * num_nodes))
+            self.g = array.array('q', bytes(8 * num_nodes))
+            self.h = array.array('q', bytes(8 * num_nodes))
+            self.depth = array.array('i', [-1]) * num_nodes
+
+    @classmethod
+    def for_graph(cls, graph):
+        """Arena para buscar en 'graph': densa si es un GrafoCSR, con diccionario si no."""
+        if not isinstance(graph, GrafoCSR):
+            return cls()
+        arena = cls(graph.num_nodes)
+        arena.ids = graph.ids
+        arena.states = graph.names
+        return arena
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, state):
+        return self.index_of(state) is not None
+
+    def index_of(self, state):
+        """Índice del nodo de 'state', o None si todavía no se descubrió."""
+        if self.index is not None:
+            return self.index.get(state)
+        if self.ids is not None:
+            state = self.ids.get(state)
+            if state is None:
+                return None
+        return state if self.depth[state] >= 0 else None
+
+    def discovered(self):
+        """Índices de todos los nodos descubiertos."""
+        if self.index is not None:
+            return range(len(self.states))
+        return (i for i, depth in enumerate(self.depth) if depth >= 0)
+
+    def _number(self, field, value):
+        """Devuelve el arreglo 'field' listo para guardar 'value' (promoviendo a float si hace falta)."""
+        values = getattr(self, field)
+        if values.typecode == 'q' and not isinstance(value, int):
+            values = array.array('d', values)
+            setattr(self, field, values)
+        return values
+
+    def add(self, state, parent_index=-1, g=0, h=0):
+        """Registra un estado nuevo y devuelve su índice."""
+        depth = 0 if parent_index < 0 else self.depth[parent_index] + 1
+        self.count += 1
+        if self.index is None:
+            if self.ids is not None:
+                state = self.ids[state]
+            self.parent[state] = parent_index
+            self._number('g', g)[state] = g
+            self._number('h', h)[state] = h
+            self.depth[state] = depth
+            return state
+
+        node_index = len(self.states)
+        self.index[state] = node_index
+        self.states.append(state)
+        self.parent.append(parent_index)
+        self._number('g', g).append(g)
+        self._number('h', h).append(h)
+        self.depth.append(depth)
+        return node_index
+
+    def update(self, node_index, parent_index, g):
+        """Encontramos un camino más barato al nodo: cambiamos su padre y su costo."""
+        self.parent[node_index] = parent_index
+        self._number('g', g)[node_index] = g
+        self.depth[node_index] = self.depth[parent_index] + 1
+
+    def path(self, node_index):
+        """Camino (lista de estados) desde la raíz hasta el nodo 'node_index'."""
+        path = []
+        while node_index != -1:
+            path.append(self.states[node_index])
+            node_index = self.parent[node_index]
+        path.reverse()
+        return path
+
+    def memory_bytes(self):
+        """Bytes de los arreglos (y del diccionario y la lista, si los hay), sin los estados."""
+        arrays = (self.parent, self.g, self.h, self.depth)
+        total = sum(values.itemsize * len(values) for values in arrays)
+        if self.index is not None:
+            total += sys.getsizeof(self.index) + sys.getsizeof(self.states)
+        return total
+
+
+def dicts_memory_bytes(arena):
+    """
+    Bytes que ocuparían los diccionarios path_from y costs equivalentes a la
+    arena (tablas hash + objetos de costo), para comparar.
+    """
+    path_from, costs = {}, {}
+    for i in arena.discovered():
+        state, parent = arena.states[i], arena.parent[i]
+        path_from[state] = arena.states[parent] if parent >= 0 else None
+        costs[state] = arena.g[i]
+    return (sys.getsizeof(path_from) + sys.getsizeof(costs)
+            + sum(sys.getsizeof(cost) for cost in costs.values()))
@@ -0,0 +1,219 @@
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .csr import _edge_positions
+
+# --- BFS por niveles en paralelo (varios procesos) ---
+#
+# Todos los arreglos grandes viven en memoria compartida
+# (multiprocessing.shared_memory), así que a los procesos solo se les manda
+# una tupla pequeña por tarea (begin, end, offset, capacity) y nunca se
+# copian aristas:
+#
+#   offsets, targets   el CSR (solo lectura para los workers)
+#   visited_bits       un bit por nodo
+#   frontier           los ids de la frontera del nivel actual
+#   next_nodes/parents UN bloque de n entradas para los candidatos del
+#                      siguiente nivel; cada worker escribe en su tramo
+#
+# Cada nivel: el coordinador reparte la frontera en trozos con más o menos
+# las mismas aristas y le da a cada worker un tramo del bloque de
+# candidatos (del tamaño de sus aristas, o una parte proporcional de n si
+# no alcanza). Cada worker expande su trozo, "reclama" sus candidatos
+# encendiendo su bit de visitado (así casi no se repiten entre workers) y
+# los escribe en su tramo; si no le cabían todos, devuelve el resto por la
+# tubería del pool. El coordinador los junta y vuelve a marcar visitados.
+#
+# Los workers escriben bits de visitado sin candados: si dos escriben el
+# mismo byte a la vez se puede perder un bit del nivel actual, pero solo
+# significa un candidato repetido (el coordinador se queda con uno) y el
+# coordinador vuelve a encender todos los bits al final del nivel.
+#
+# Ojo: con numpy y CPython cada nivel paga el reparto de tareas y la unión
+# de candidatos en el coordinador, así que más procesos no siempre es más
+# rápido. Conviene medirlo en la máquina y el grafo de interés.
+
+_worker_arrays = {}  # En cada worker: vistas numpy sobre la memoria compartida
+
+
+def _share(shape, dtype, initial=0):
+    """Crea un bloque de memoria compartida con forma 'shape' y lo llena con 'initial'."""
+    size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    view = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    view[...] = initial
+    return block, view
+
+
+def _attach(name):
+    """Abre un bloque creado por otro proceso (sin que su resource_tracker lo borre al salir)."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 no tiene 'track'
+        return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(specs):
+    """Inicializador del pool: cada worker se conecta UNA vez a los bloques compartidos."""
+    for key, (name, dtype, shape) in specs.items():
+        block = _attach(name)
+        _worker_arrays[key] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+
+
+def _expand_range(arrays, begin, end, offset, capacity):
+    """
+    Expande frontier[begin:end] y escribe los vecinos no visitados (cada uno
+    una sola vez, con su primer padre) en next_nodes[offset:offset + capacity].
+
+    Returns:
+        (count, overflow): cuántos se escribieron, y (nodos, padres) de los
+        que no cupieron (None si cupieron todos).
+    """
+    frontier = arrays['frontier'][begin:end]
+    sources, positions = _edge_positions(arrays['offsets'], frontier)
+    neighbors = arrays['targets'][positions]
+
+    # ¿Ya visitado? Miramos el bit v de visited_bits
+    bits = arrays['visited_bits']
+    unvisited = (bits[neighbors >> 3] >> (neighbors & 7)) & 1 == 0
+    neighbors, sources = neighbors[unvisited], sources[unvisited]
+
+    unique, first = np.unique(neighbors, return_index=True)
+    unique_parents = sources[first]
+
+    # Reclamamos los candidatos: otro worker que los vea después ya no los repite
+    np.bitwise_or.at(bits, unique >> 3, (1 << (unique & 7)).astype(np.uint8))
+
+    count = min(len(unique), capacity)
+    arrays['next_nodes'][offset:offset + count] = unique[:count]
+    arrays['next_parents'][offset:offset + count] = unique_parents[:count]
+    overflow = (unique[count:], unique_parents[count:]) if count < len(unique) else None
+    return count, overflow
+
+
+def _worker_task(task):
+    arrays = {key: view for key, (_, view) in _worker_arrays.items()}
+    return _expand_range(arrays, *task)
+
+
+def _run_levels(arrays, pool, num_workers, start, dist, parent, min_parallel_edges):
+    """El bucle de niveles del coordinador (ver parallel_bfs_ids)."""
+    offsets = arrays['offsets']
+    num_nodes = len(arrays['next_nodes'])
+
+    # 1. El nodo inicial
+    dist[start] = 0
+    arrays['visited_bits'][start >> 3] |= 1 << (start & 7)
+    arrays['frontier'][0] = start
+    size = 1
+    level = 0
+
+    # 2. Un nivel completo por vuelta
+    while size > 0:
+        frontier = arrays['frontier'][:size]
+        degrees = offsets[frontier + 1] - offsets[frontier]
+        total_edges = int(degrees.sum())
+
+        # 3. Repartimos la frontera en trozos con ~las mismas aristas, y el
+        #    bloque de candidatos en tramos (cada worker nunca devuelve más
+        #    candidatos que aristas tiene su trozo)
+        if pool is None or total_edges < min_parallel_edges:
+            tasks = [(0, size, 0, num_nodes)]
+            results = [_expand_range(arrays, *tasks[0])]
+        else:
+            cumulative = np.cumsum(degrees)
+            edges_per_cut = total_edges * np.arange(1, num_workers) / num_workers
+            cuts = np.searchsorted(cumulative, edges_per_cut) + 1
+            bounds = [0] + np.minimum(cuts, size).tolist() + [size]
+            slice_edges = np.diff(np.concatenate([[0], cumulative])[bounds])
+            if total_edges > num_nodes:
+                slice_edges = slice_edges * num_nodes // total_edges
+            region_starts = np.concatenate([[0], np.cumsum(slice_edges)[:-1]]).tolist()
+            tasks = [(bounds[i], bounds[i + 1], region_starts[i], int(slice_edges[i]))
+                     for i in range(num_workers)]
+            results = pool.map(_worker_task, tasks)
+
+        # 4. Juntamos los candidatos de todos los workers (un nodo puede
+        #    venir de varios: nos quedamos con el primero)
+        children, parents = [], []
+        for (_, _, region_start, _), (count, overflow) in zip(tasks, results):
+            children.append(arrays['next_nodes'][region_start:region_start + count])
+            parents.append(arrays['next_parents'][region_start:region_start + count])
+            if overflow is not None:
+                children.append(overflow[0])
+                parents.append(overflow[1])
+        children, parents = np.concatenate(children), np.concatenate(parents)
+        next_frontier, first = np.unique(children, return_index=True)
+
+        level += 1
+        dist[next_frontier] = level
+        parent[next_frontier] = parents[first]
+        np.bitwise_or.at(arrays['visited_bits'], next_frontier >> 3,
+                         (1 << (next_frontier & 7)).astype(np.uint8))
+        size = len(next_frontier)
+        arrays['frontier'][:size] = next_frontier
+
+
+def parallel_bfs_ids(graph, start, num_workers=None, min_parallel_edges=1 << 15):
+    """
+    BFS por niveles repartida entre varios procesos.
+
+    Args:
+        graph (GrafoCSR): El grafo (se trabaja con ids enteros).
+        start (int): Id del nodo inicial.
+        num_workers (int, optional): Procesos a usar (por defecto, uno por núcleo).
+        min_parallel_edges (int): Los niveles con menos aristas que esto se
+                                  expanden en el coordinador (repartir trozos
+                                  tan pequeños cuesta más de lo que ahorra).
+
+    Returns:
+        (dist, parent): arreglos int32 por id, igual que bfs_level_synchronous.
+    """
+    num_workers = num_workers or os.cpu_count() or 1
+    num_nodes = graph.num_nodes
+
+    dist = np.full(num_nodes, -1, dtype=np.int32)
+    parent = np.full(num_nodes, -1, dtype=np.int32)
+
+    # 1. Pasamos todo a memoria compartida. Los candidatos de un nivel
+    #    comparten un solo bloque de num_nodes entradas (no uno por worker).
+    layout = {
+        'offsets': ((num_nodes + 1,), np.int64, graph.offsets),
+        'targets': ((graph.num_edges,), np.int32, graph.targets),
+        'visited_bits': (((num_nodes + 7) // 8,), np.uint8, 0),
+        'frontier': ((max(num_nodes, 1),), np.int32, 0),
+        'next_nodes': ((max(num_nodes, 1),), np.int32, 0),
+        'next_parents': ((max(num_nodes, 1),), np.int32, 0),
+    }
+    arrays = {}
+    blocks = {}
+    try:
+        for key, (shape, dtype, initial) in layout.items():
+            blocks[key], arrays[key] = _share(shape, dtype, initial)
+        specs = {key: (blocks[key].name, view.dtype, view.shape)
+                 for key, view in arrays.items()}
+
+        # 'fork' evita volver a ejecutar el script principal en cada worker
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        pool = context.Pool(num_workers, initializer=_init_worker, initargs=(specs,)) \
+            if num_workers > 1 else None
+
+        try:
+            # 2. Recorremos nivel por nivel
+            _run_levels(arrays, pool, num_workers, start, dist, parent, min_parallel_edges)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+    finally:
+        # 3. Liberamos la memoria compartida (primero soltamos las vistas)
+        arrays.clear()
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+    return dist, parent
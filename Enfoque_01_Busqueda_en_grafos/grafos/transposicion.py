@@ -0,0 +1,71 @@
+class TranspositionTable:
+    """
+    Tabla de transposición acotada para búsquedas con límite de profundidad.
+
+    Guarda resultados del tipo "desde el nodo n, con r pasos restantes,
+    NO se llega al objetivo". Si más tarde llegamos a n con r' <= r pasos
+    restantes (por otro camino o en otra iteración de IDDFS), ya sabemos la
+    respuesta y no hace falta volver a expandir ese subárbol.
+
+    La tabla tiene un número fijo de casillas (como en los motores de
+    ajedrez): cada nodo cae en la casilla hash(nodo) % capacity. Cuando dos
+    nodos compiten por la misma casilla decide la política de reemplazo:
+
+      - 'depth'  (DEPTH_PREFERRED): se queda la entrada con MÁS pasos
+                 restantes, porque su subárbol costó más trabajo.
+      - 'always' (ALWAYS_REPLACE):  la entrada nueva siempre gana
+                 (favorece lo más reciente).
+    """
+
+    DEPTH_PREFERRED = 'depth'
+    ALWAYS_REPLACE = 'always'
+
+    def __init__(self, capacity=1 << 16, policy=DEPTH_PREFERRED):
+        if policy not in (self.DEPTH_PREFERRED, self.ALWAYS_REPLACE):
+            raise ValueError(f"Política de reemplazo desconocida: '{policy}'")
+        self.capacity = capacity
+        self.policy = policy
+        self.nodes = [None] * capacity   # Nodo guardado en cada casilla
+        self.depths = [-1] * capacity    # Pasos restantes con los que falló
+        # Estadísticas
+        self.hits = 0        # Subárboles que NO se re-expandieron
+        self.stores = 0      # Resultados guardados
+        self.replaced = 0    # Entradas de otro nodo que se sobrescribieron
+        self.rejected = 0    # Resultados descartados por la política
+
+    def _slot(self, node):
+        return hash(node) % self.capacity
+
+    def is_known_failure(self, node, remaining_depth):
+        """True si ya sabemos que desde 'node' con 'remaining_depth' pasos no hay objetivo."""
+        slot = self._slot(node)
+        if self.nodes[slot] == node and self.depths[slot] >= remaining_depth:
+            self.hits += 1
+            return True
+        return False
+
+    def store_failure(self, node, remaining_depth):
+        """Anota que desde 'node' con 'remaining_depth' pasos no se llega al objetivo."""
+        slot = self._slot(node)
+        stored_node = self.nodes[slot]
+
+        if stored_node == node:
+            # El mismo nodo: nos quedamos con el mayor número de pasos
+            if remaining_depth > self.depths[slot]:
+                self.depths[slot] = remaining_depth
+                self.stores += 1
+            return
+
+        if (stored_node is not None and self.policy == self.DEPTH_PREFERRED
+                and self.depths[slot] > remaining_depth):
+            self.rejected += 1
+            return
+
+        if stored_node is not None:
+            self.replaced += 1
+        self.nodes[slot] = node
+        self.depths[slot] = remaining_depth
+        self.stores += 1
+
+    def __len__(self):
+        return sum(1 for node in self.nodes if node is not None)
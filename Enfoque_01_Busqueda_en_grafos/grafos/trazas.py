@@ -0,0 +1,102 @@
+import collections
+import math
+import struct
+
+# --- Eventos que emiten las búsquedas ---
+#
+# Una búsqueda recibe un parámetro opcional 'trace'. Si es None (por defecto)
+# no se hace NADA más que una comparación con None en cada evento. Si es un
+# "sink", se le llama así:
+#
+#     trace(evento, nodo, valor)
+#
+# donde 'valor' es un número opcional (costo, profundidad, f(n), ...).
+
+VISIT = 'visit'      # Se saca/explora un nodo
+ENQUEUE = 'enqueue'  # Se mete un vecino a la frontera
+PRUNE = 'prune'      # Se descarta un nodo (ya visitado, límite, entrada vieja)
+GOAL = 'goal'        # Se alcanzó el objetivo
+
+EVENTS = (VISIT, ENQUEUE, PRUNE, GOAL)
+
+
+class PrintSink:
+    """Imprime cada evento (lo que antes hacían los print dentro de los bucles)."""
+
+    FORMATS = {
+        VISIT: "  Visitando nodo: {node!r}",
+        ENQUEUE: "    -> Encolando vecino: {node!r}",
+        PRUNE: "    (Descartando {node!r})",
+        GOAL: "¡Objetivo {node!r} alcanzado!",
+    }
+
+    def __call__(self, event, node, value=None):
+        message = self.FORMATS[event].format(node=node)
+        if value is not None:
+            message += f" [{value}]"
+        print(message)
+
+
+class CountSink:
+    """Solo cuenta cuántos eventos de cada tipo hubo."""
+
+    def __init__(self):
+        self.counts = collections.Counter()
+
+    def __call__(self, event, node, value=None):
+        self.counts[event] += 1
+
+    def __repr__(self):
+        return f"CountSink({dict(self.counts)})"
+
+
+class BinaryTraceSink:
+    """
+    Escribe los eventos en un archivo binario compacto (13 bytes por evento):
+
+        código de evento (uint8) | id del nodo (uint32) | valor (float64, NaN si no hay)
+
+    Los nombres de los nodos se escriben una sola vez, en el archivo
+    '<path>.nombres' (un nombre por línea, en orden de id).
+    Se usa como context manager: with BinaryTraceSink('traza.bin') as sink: ...
+    """
+
+    RECORD = struct.Struct('<BId')
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'wb')
+        self.names_file = open(path + '.nombres', 'w', encoding='utf-8')
+        self.ids = {}
+        self.codes = {event: code for code, event in enumerate(EVENTS)}
+
+    def __call__(self, event, node, value=None):
+        node_id = self.ids.get(node)
+        if node_id is None:
+            node_id = self.ids[node] = len(self.ids)
+            self.names_file.write(f"{node}\n")
+        self.file.write(self.RECORD.pack(self.codes[event], node_id,
+                                         math.nan if value is None else value))
+
+    def close(self):
+        self.file.close()
+        self.names_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_binary_trace(path):
+    """Lee un archivo de BinaryTraceSink. Devuelve una lista de (evento, nodo, valor)."""
+    with open(path + '.nombres', encoding='utf-8') as f:
+        names = [line.rstrip('\n') for line in f]
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    events = []
+    for code, node_id, value in BinaryTraceSink.RECORD.iter_unpack(data):
+        events.append((EVENTS[code], names[node_id], None if math.isnan(value) else value))
+    return events
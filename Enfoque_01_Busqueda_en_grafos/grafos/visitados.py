@@ -0,0 +1,174 @@
+import math
+import sys
+import tracemalloc
+
+import numpy as np
+
+# --- Conjuntos de "visitados" compactos ---
+#
+# Las búsquedas solo usan dos operaciones de su conjunto de visitados:
+#
+#     visited.add(nodo)      y      nodo in visited
+#
+# así que cualquier objeto con esas dos operaciones (y len) sirve. Un set de
+# Python es lo más cómodo, pero guarda cada nodo como objeto (~60-100 bytes
+# por nodo contando la tabla hash). Aquí hay dos alternativas:
+#
+#   BitsetVisited: exacto, 1 bit por nodo. Para grafos con ids 0..n-1.
+#   BloomVisited:  aproximado (filtro de Bloom), unos pocos bits por nodo y no
+#                  necesita saber los nodos de antemano. Puede decir "ya lo
+#                  visité" de un nodo nuevo (falso positivo, con la tasa que
+#                  se pida), pero nunca lo contrario. Sirve para explorar
+#                  espacios de estados enormes aceptando saltarse algunos.
+#
+# Ojo: solo se comprime el conjunto de visitados (la lista "cerrada"). El
+# mapa de padres (path_from o NodeArena) y la frontera siguen guardando una
+# entrada por nodo descubierto, así que la memoria de una búsqueda sigue
+# siendo O(descubiertos). search_peak_bytes mide el total de verdad.
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(x):
+    """Mezclador splitmix64: reparte bien los bits de hash() (hash(5) == 5)."""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+class BitsetVisited:
+    """
+    Conjunto exacto de nodos 0..num_nodes-1 con un bit por nodo (arreglo numpy).
+
+    Args:
+        num_nodes (int): Número de nodos del grafo.
+        key (callable, optional): Convierte un nodo en su id (por ejemplo
+                                  graph.id_of para un GrafoCSR con nombres).
+    """
+
+    def __init__(self, num_nodes, key=None):
+        self.bits = np.zeros((num_nodes + 7) // 8, dtype=np.uint8)
+        # Los accesos sueltos se hacen por un memoryview (mucho más rápido
+        # que indexar el arreglo de numpy de a un elemento)
+        self._view = memoryview(self.bits)
+        self.key = key
+        self.count = 0
+
+    def add(self, node):
+        node_id = node if self.key is None else self.key(node)
+        byte, bit = node_id >> 3, 1 << (node_id & 7)
+        if not self._view[byte] & bit:
+            self._view[byte] |= bit
+            self.count += 1
+
+    def __contains__(self, node):
+        node_id = node if self.key is None else self.key(node)
+        return bool(self._view[node_id >> 3] & (1 << (node_id & 7)))
+
+    def __len__(self):
+        return self.count
+
+    def memory_bytes(self):
+        return self.bits.nbytes
+
+
+class BloomVisited:
+    """
+    Filtro de Bloom: conjunto aproximado con tasa de falsos positivos acotada.
+
+    Args:
+        capacity (int): Cuántos nodos se espera meter.
+        false_positive_rate (float): Probabilidad de que un nodo NUEVO parezca
+                                     visitado cuando ya hay 'capacity' nodos.
+
+    Con n = capacity y p = false_positive_rate se usan
+        m = -n ln(p) / ln(2)^2 bits   y   k = (m / n) ln(2) funciones hash
+    (por ejemplo, p = 1% cuesta ~9.6 bits por nodo).
+    """
+
+    def __init__(self, capacity, false_positive_rate=0.01):
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate debe estar entre 0 y 1")
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.target_rate = false_positive_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(false_positive_rate)
+                                         / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = np.zeros((self.num_bits + 7) // 8, dtype=np.uint8)
+        self._view = memoryview(self.bits)
+        self.count = 0  # Nodos que se metieron y no parecían estar ya
+
+    def _start(self, node):
+        # Doble hashing: la posición i es (first + i * step) % num_bits,
+        # con first y step sacados de un solo hash de 64 bits
+        mixed = _mix64(hash(node) & _MASK64)
+        return mixed & 0xFFFFFFFF, (mixed >> 32) | 1
+
+    def add(self, node):
+        view, num_bits = self._view, self.num_bits
+        position, step = self._start(node)
+        new = False
+        for _ in range(self.num_hashes):
+            position %= num_bits
+            byte, bit = position >> 3, 1 << (position & 7)
+            if not view[byte] & bit:
+                view[byte] |= bit
+                new = True
+            position += step
+        if new:
+            self.count += 1
+
+    def __contains__(self, node):
+        view, num_bits = self._view, self.num_bits
+        position, step = self._start(node)
+        for _ in range(self.num_hashes):
+            position %= num_bits
+            if not view[position >> 3] & (1 << (position & 7)):
+                return False  # Basta un bit apagado para saber que es nuevo
+            position += step
+        return True
+
+    def __len__(self):
+        return self.count
+
+    def false_positive_rate(self):
+        """Tasa de falsos positivos estimada con los nodos que ya tiene."""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def memory_bytes(self):
+        return self.bits.nbytes
+
+
+def visited_memory_bytes(visited):
+    """
+    Bytes que ocupa un conjunto de visitados. Para un set de Python se suma
+    la tabla hash y los objetos que guarda (como si nadie más los usara).
+    """
+    if hasattr(visited, 'memory_bytes'):
+        return visited.memory_bytes()
+    return sys.getsizeof(visited) + sum(sys.getsizeof(node) for node in visited)
+
+
+def search_peak_bytes(search):
+    """
+    Corre search() (una función sin argumentos) y mide con tracemalloc el
+    pico de memoria que reservó: visitados, padres, frontera y resultado.
+    El conjunto de visitados debe crearse DENTRO de search() para contarlo.
+
+    Returns:
+        (resultado, pico_en_bytes)
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        result = search()
+        peak = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return result, peak